@@ -0,0 +1,68 @@
+"""Compares JSON decoding of the `v2/rates` document and a 100-item orders page.
+
+Usage::
+
+    python -m benchmarks.bench_json
+
+"""
+import json
+import timeit
+from typing import Callable, Dict, List, Tuple
+
+from coingate.json_codec import JSONCodec, OrjsonCodec, orjson
+from coingate.resources.order import PaginatedOrders
+
+from .bench_parsing import orders_page
+
+CURRENCIES = ["BTC", "ETH", "LTC", "USDT", "EUR", "USD", "GBP", "PLN", "CAD", "AUD"]
+
+
+def rates_document(size: int = 60) -> Dict[str, object]:
+    symbols = CURRENCIES + [f"C{i:03d}" for i in range(size - len(CURRENCIES))]
+    table = {
+        source: {target: f"{(i + 1) / (j + 3):.8f}" for j, target in enumerate(symbols)}
+        for i, source in enumerate(symbols)
+    }
+    return {"merchant": table, "trader": {"buy": table, "sell": table}}
+
+
+def main(number: int = 200) -> None:
+    documents = {
+        "v2/rates": json.dumps(rates_document()).encode(),
+        "orders page": json.dumps(orders_page()).encode(),
+    }
+
+    decoders: List[Tuple[str, Callable[[bytes], object]]] = [
+        ("json.loads", json.loads),
+        ("JSONCodec", JSONCodec().loads),
+    ]
+    if orjson is not None:
+        decoders.append(("OrjsonCodec", OrjsonCodec().loads))
+
+    for name, body in documents.items():
+        print(f"{name} ({len(body) / 1024:.0f} KiB)")
+        baseline = None
+        for decoder_name, loads in decoders:
+            elapsed = min(timeit.repeat(lambda: loads(body), number=number)) / number
+            baseline = baseline or elapsed
+            print(
+                f"  {decoder_name:<12} {elapsed * 1000:.3f} ms  {baseline / elapsed:.1f}x"
+            )
+
+    page = documents["orders page"]
+    print("orders page decoded and parsed")
+    for decoder_name, loads in decoders:
+        elapsed = (
+            min(
+                timeit.repeat(
+                    lambda: PaginatedOrders(**loads(page)),  # type: ignore
+                    number=number,
+                )
+            )
+            / number
+        )
+        print(f"  {decoder_name:<12} {elapsed * 1000:.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
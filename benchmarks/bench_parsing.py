@@ -0,0 +1,66 @@
+"""Compares validated and trusted construction of a 100-item orders page.
+
+Usage::
+
+    python -m benchmarks.bench_parsing
+
+"""
+import timeit
+
+from coingate.parsing import construct_resource, parse_resource
+from coingate.resources.order import PaginatedOrders
+
+
+def orders_page(size: int = 100):
+    return {
+        "current_page": 1,
+        "per_page": size,
+        "total_orders": size,
+        "total_pages": 1,
+        "orders": [
+            {
+                "id": i,
+                "status": "paid",
+                "do_not_convert": False,
+                "price_currency": "EUR",
+                "price_amount": "129.99",
+                "lightning_network": False,
+                "receive_currency": "EUR",
+                "receive_amount": "129.99",
+                "created_at": "2022-10-10T12:23:22+00:00",
+                "order_id": f"shop-{i}",
+                "payment_url": f"https://pay.coingate.com/invoice/{i}",
+                "underpaid_amount": "0",
+                "overpaid_amount": "0",
+                "is_refundable": True,
+                "orderable_type": "ApiOrder",
+                "orderable_id": i,
+                "payment_address": "0x6a1a8e0b8b2cd5c6d4d1f8e6b2f0a3c4d5e6f7a8",
+            }
+            for i in range(size)
+        ],
+    }
+
+
+def main(number: int = 200) -> None:
+    page = orders_page()
+    # Warm up per-model plans of the fast path
+    construct_resource(PaginatedOrders, page)
+
+    validated = min(
+        timeit.repeat(lambda: parse_resource(PaginatedOrders, page), number=number)
+    )
+    trusted = min(
+        timeit.repeat(
+            lambda: parse_resource(PaginatedOrders, page, validate=False),
+            number=number,
+        )
+    )
+
+    print(f"validated: {validated / number * 1000:.3f} ms per page")
+    print(f"trusted:   {trusted / number * 1000:.3f} ms per page")
+    print(f"speedup:   {validated / trusted:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Compares per-call overhead of transports on `client.order.get` against a local keep-alive HTTP server.
+
+Usage::
+
+    python -m benchmarks.bench_transport
+
+"""
+import json
+import threading
+import timeit
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List, Tuple
+
+from coingate import CoinGate
+from coingate.transport import (
+    InMemoryResponse,
+    InMemoryTransport,
+    RequestsTransport,
+    Transport,
+    Urllib3Transport,
+)
+
+from .bench_parsing import orders_page
+
+ORDER = json.dumps(orders_page(1)["orders"][0]).encode()  # type: ignore
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment, avoiding delayed ACK stalls
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(ORDER)))
+        self.end_headers()
+        self.wfile.write(ORDER)
+
+    def log_message(self, *args) -> None:
+        pass
+
+
+def main(number: int = 1000) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    transports: List[Tuple[str, Callable[[], Transport]]] = [
+        ("RequestsTransport", RequestsTransport),
+        ("Urllib3Transport", Urllib3Transport),
+        (
+            "InMemoryTransport",
+            lambda: InMemoryTransport(lambda request: InMemoryResponse(200, ORDER)),
+        ),
+    ]
+
+    print(f"client.order.get, {number} calls over a keep-alive connection")
+    baseline = None
+    try:
+        for name, transport in transports:
+            client = CoinGate("api_key", transport=transport())
+            client.BASE_API_URL = f"http://127.0.0.1:{server.server_port}"
+            client.order.get(1)
+
+            elapsed = (
+                min(timeit.repeat(lambda: client.order.get(1), number=number, repeat=3))
+                / number
+            )
+            baseline = baseline or elapsed
+            print(f"  {name:<18} {elapsed * 1e6:.0f} µs  {baseline / elapsed:.1f}x")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,372 @@
+"""Local stand-in for the CoinGate API, serving generated fixtures with configurable latency and page size.
+
+The server runs in a child process, so it does not compete with the measured
+client for the GIL and its allocations are not traced.
+
+Usage::
+
+    python -m benchmarks.fake_server --latency 0.02 --page-size 100
+
+"""
+import argparse
+import json
+import multiprocessing
+import re
+import time
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from .bench_parsing import orders_page
+
+CURRENCY = {"id": 1, "title": "Tether", "symbol": "USDT"}
+PLATFORM = {"id": 2, "title": "Ethereum", "id_name": "ethereum"}
+RATES = {
+    symbol: {other: "1.5" for other in ("EUR", "USD", "BTC", "ETH", "USDT")}
+    for symbol in ("EUR", "USD", "BTC", "ETH", "USDT", "LTC", "DAI", "BNB")
+}
+
+Answer = Tuple[int, bytes, str]
+
+
+def order(id: int) -> Dict[str, Any]:
+    return {**orders_page(1)["orders"][0], "id": id, "orderable_id": id}
+
+
+def refund(id: int) -> Dict[str, Any]:
+    return {
+        "id": id,
+        "request_amount": "10.0",
+        "refund_amount": "10.0",
+        "address": "0x6a1a8e0b8b2cd5c6d4d1f8e6b2f0a3c4d5e6f7a8",
+        "crypto_address": "0x6a1a8e0b8b2cd5c6d4d1f8e6b2f0a3c4d5e6f7a8",
+        "crypto_address_memo": None,
+        "status": "pending",
+        "memo": None,
+        "created_at": "2022-10-10T12:23:22+00:00",
+        "order": {"id": id},
+        "refund_currency": {**CURRENCY, "platform": PLATFORM},
+        "transactions": [],
+        "ledger_account": {"id": f"01GA{id:06d}", "currency": CURRENCY},
+    }
+
+
+def ledger_account(id: int) -> Dict[str, Any]:
+    return {
+        "id": f"01GA{id:06d}",
+        "balance": "1250.75",
+        "status": "active",
+        "currency": CURRENCY,
+    }
+
+
+def withdrawal(id: int) -> Dict[str, Any]:
+    return {
+        "id": id,
+        "status": "completed",
+        "amount": "100.5",
+        "created_at": "2022-10-10T12:23:22+00:00",
+        "completed_at": "2022-10-10T13:23:22+00:00",
+        "currency": CURRENCY,
+        "payout_setting": {"id": 3, "title": "USDT wallet"},
+        "platform": PLATFORM,
+    }
+
+
+def currency(id: int) -> Dict[str, Any]:
+    return {
+        **CURRENCY,
+        "id": id,
+        "kind": "crypto",
+        "native": False,
+        "disabled": False,
+        "disabled_message": None,
+        "merchant": {"price": True, "pay": True, "receive": True},
+        "platforms": [{**PLATFORM, "enabled": True}],
+    }
+
+
+def platform(id: int) -> Dict[str, Any]:
+    return {
+        **PLATFORM,
+        "id": id,
+        "disabled": False,
+        "disabled_message": None,
+        "currencies": [{**CURRENCY, "enabled": True}],
+    }
+
+
+PAGES: Dict[str, Tuple[str, str, Callable[[int], Dict[str, Any]]]] = {
+    "orders": ("orders", "total_orders", order),
+    "refunds": ("refunds", "total_refunds", refund),
+    "ledger/accounts": ("accounts", "total_accounts", ledger_account),
+    "withdrawals": ("withdrawals", "total_withdrawals", withdrawal),
+}
+
+
+@lru_cache(maxsize=None)
+def _json(kind: str, id: int = 0) -> bytes:
+    documents: Dict[str, Callable[[int], Any]] = {
+        "order": order,
+        "new_order": lambda id: {**order(id), "token": "token"},
+        "checkout": lambda id: {
+            **order(id),
+            "pay_currency": "BTC",
+            "pay_amount": "0.0042",
+            "expire_at": "2022-10-10T12:43:22+00:00",
+            "payment_address": "bc1qxy2kgdygjrsqtzq2n0yrf2493p83kkfjhx0wlh",
+            "platform": PLATFORM,
+        },
+        "refund": refund,
+        "ledger_account": ledger_account,
+        "withdrawal": withdrawal,
+        "rates": lambda id: {
+            "merchant": RATES,
+            "trader": {"buy": RATES, "sell": RATES},
+        },
+        "nested_rates": lambda id: RATES,
+        "trader_rates": lambda id: {"buy": RATES, "sell": RATES},
+        "ping": lambda id: {"ping": "pong", "time": "2022-10-10T12:23:22+00:00"},
+    }
+    return json.dumps(documents[kind](id)).encode()
+
+
+@lru_cache(maxsize=None)
+def _page(endpoint: str, page: int, per_page: int, total_pages: int) -> bytes:
+    key, total_key, build = PAGES[endpoint]
+    first_id = (page - 1) * per_page + 1
+    return json.dumps(
+        {
+            "current_page": page,
+            "per_page": per_page,
+            key: [build(first_id + i) for i in range(per_page)],
+            total_key: per_page * total_pages,
+            "total_pages": total_pages,
+        }
+    ).encode()
+
+
+@lru_cache(maxsize=None)
+def _list(kind: str, size: int) -> bytes:
+    build = currency if kind == "currencies" else platform
+    return json.dumps([build(i + 1) for i in range(size)]).encode()
+
+
+class CoinGateStandIn:
+    """Answers CoinGate API v2 requests with generated documents.
+
+    :param int `page_size`: Items per page when request does not set `per_page`, and number of currencies and platforms. Default: 100
+    :param int `total_pages`: Number of pages of every list endpoint. Default: 3
+
+    """
+
+    def __init__(self, *, page_size: int = 100, total_pages: int = 3) -> None:
+        self.page_size = page_size
+        self.total_pages = total_pages
+
+    def answer(self, method: str, path: str, params: Dict[str, str]) -> Answer:
+        path = path.strip("/")
+        if path.startswith("v2/"):
+            path = path[3:]
+
+        if method == "POST":
+            if path == "orders":
+                return self._ok(_json("new_order", 1))
+            match = re.fullmatch(r"orders/(\d+)/(checkout|refunds)", path)
+            if match:
+                kind = "checkout" if match.group(2) == "checkout" else "refund"
+                return self._ok(_json(kind, int(match.group(1))))
+            return self._not_found()
+
+        if path in PAGES:
+            return self._ok(self._page(path, params))
+        match = re.fullmatch(r"orders/\d+/refunds", path)
+        if match:
+            return self._ok(self._page("refunds", params))
+        match = re.fullmatch(
+            r"(orders|orders/\d+/refunds|ledger/accounts|withdrawals)/(\w+)", path
+        )
+        if match:
+            kind = {
+                "orders": "order",
+                "ledger/accounts": "ledger_account",
+                "withdrawals": "withdrawal",
+            }.get(match.group(1), "refund")
+            id = int(re.sub(r"\D", "", match.group(2)) or 0)
+            return self._ok(_json(kind, id))
+
+        if path == "rates":
+            return self._ok(_json("rates"))
+        if path in ("rates/merchant", "rates/trader/buy", "rates/trader/sell"):
+            return self._ok(_json("nested_rates"))
+        if path == "rates/trader":
+            return self._ok(_json("trader_rates"))
+        if re.fullmatch(r"rates/(merchant|trader/buy|trader/sell)/\w+/\w+", path):
+            return 200, b"1.5", "text/plain"
+        if path == "ping":
+            return self._ok(_json("ping"))
+        if path == "ips-v4":
+            return 200, b"1.2.3.4\n5.6.7.8", "text/plain"
+        if path in ("currencies", "platforms"):
+            return self._ok(_list(path, self.page_size))
+
+        return self._not_found()
+
+    def _page(self, endpoint: str, params: Dict[str, str]) -> bytes:
+        page = int(params.get("page") or 1)
+        per_page = int(params.get("per_page") or self.page_size)
+        return _page(endpoint, page, per_page, self.total_pages)
+
+    @staticmethod
+    def _ok(body: bytes) -> Answer:
+        return 200, body, "application/json"
+
+    @staticmethod
+    def _not_found() -> Answer:
+        return (
+            404,
+            b'{"reason": "PageNotFound", "message": "Not found"}',
+            "application/json",
+        )
+
+
+def _handler(stand_in: CoinGateStandIn, latency: float):
+    class _Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        # Send headers and body in one segment, avoiding delayed ACK stalls
+        wbufsize = -1
+        disable_nagle_algorithm = True
+
+        def do_GET(self) -> None:
+            self._answer()
+
+        def do_POST(self) -> None:
+            self._answer()
+
+        def _answer(self) -> None:
+            url = urlsplit(self.path)
+            length = int(self.headers.get("Content-Length") or 0)
+            body = self.rfile.read(length).decode() if length else ""
+            # List endpoints of ledger and refunds send paging in form body
+            params = {
+                key: values[-1]
+                for key, values in {**parse_qs(body), **parse_qs(url.query)}.items()
+            }
+
+            if latency:
+                time.sleep(latency)
+
+            status, content, content_type = stand_in.answer(
+                self.command, url.path, params
+            )
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *args: Any) -> None:
+            pass
+
+    return _Handler
+
+
+def serve(
+    port: int = 0,
+    *,
+    latency: float = 0.0,
+    page_size: int = 100,
+    total_pages: int = 3,
+    ready: Optional[Any] = None,
+) -> None:
+    """Serves stand-in API on `127.0.0.1:port` until the process is stopped. Sends bound port to `ready` connection."""
+    stand_in = CoinGateStandIn(page_size=page_size, total_pages=total_pages)
+    server = ThreadingHTTPServer(("127.0.0.1", port), _handler(stand_in, latency))
+    server.daemon_threads = True
+    if ready is not None:
+        ready.send(server.server_port)
+        ready.close()
+    server.serve_forever()
+
+
+class FakeCoinGateServer:
+    """Runs :func:`serve` in a child process.
+
+    :param float `latency`: Seconds every response is delayed. Default: 0
+    :param int `page_size`: Items per page and number of currencies and platforms. Default: 100
+    :param int `total_pages`: Number of pages of every list endpoint. Default: 3
+
+    Basic Usage::
+      >>> with FakeCoinGateServer(latency=0.01) as server:
+      ...     client = CoinGate("api_key")
+      ...     client.BASE_API_URL = server.url
+      ...     client.order.get(1)
+
+    """
+
+    def __init__(
+        self, *, latency: float = 0.0, page_size: int = 100, total_pages: int = 3
+    ) -> None:
+        self.latency = latency
+        self.page_size = page_size
+        self.total_pages = total_pages
+        self._process: Optional[multiprocessing.process.BaseProcess] = None
+        self.url = ""
+
+    def start(self) -> str:
+        context = multiprocessing.get_context("spawn")
+        receiver, sender = context.Pipe(duplex=False)
+        self._process = context.Process(
+            target=serve,
+            kwargs={
+                "latency": self.latency,
+                "page_size": self.page_size,
+                "total_pages": self.total_pages,
+                "ready": sender,
+            },
+            daemon=True,
+        )
+        self._process.start()
+        sender.close()
+        if not receiver.poll(30):
+            self.stop()
+            raise RuntimeError("Fake CoinGate server did not start in 30 seconds")
+
+        self.url = f"http://127.0.0.1:{receiver.recv()}"
+        receiver.close()
+        return self.url
+
+    def stop(self) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+    def __enter__(self) -> "FakeCoinGateServer":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.stop()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--total-pages", type=int, default=3)
+    args = parser.parse_args()
+
+    print(f"Serving CoinGate stand-in on http://127.0.0.1:{args.port}")
+    serve(
+        args.port,
+        latency=args.latency,
+        page_size=args.page_size,
+        total_pages=args.total_pages,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,341 @@
+"""Measures every service method end to end against :mod:`benchmarks.fake_server`, and compares results with a stored baseline.
+
+For every method it reports calls per second, p50 and p99 latency of single
+calls made one after another, and peak memory allocated during a call.
+
+Usage::
+
+    python -m benchmarks.suite
+    python -m benchmarks.suite --compare results-main.json --output results.json
+    python -m benchmarks.suite --save benchmarks/baseline.json
+
+Results are compared with the committed `benchmarks/baseline.json`, or the
+file given by `--compare`, and the change of every metric is reported. Exits
+with status 1 when any method is slower or allocates more than the baseline
+by more than `--threshold`.
+
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import sys
+import time
+import tracemalloc
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional
+
+from coingate import CoinGate, __version__
+from coingate.transport import RequestsTransport, Transport, Urllib3Transport
+
+from .fake_server import FakeCoinGateServer
+
+TRANSPORTS: Dict[str, Callable[[], Transport]] = {
+    "requests": RequestsTransport,
+    "urllib3": Urllib3Transport,
+}
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+# Higher values are worse for the first metrics, lower values for the second
+METRICS_LOWER_IS_BETTER = ("p50_ms", "p99_ms", "alloc_kib")
+METRICS_HIGHER_IS_BETTER = ("calls_per_sec",)
+
+
+def service_calls(client: CoinGate, page_size: int) -> Dict[str, Callable[[], Any]]:
+    """Calls of every service method, by name. Iterators are consumed to the end."""
+    order_spec: Dict[str, Any] = {
+        "price_amount": Decimal("10"),
+        "price_currency": "EUR",
+        "receive_currency": "EUR",
+    }
+    refund_args = (1, Decimal("10"), "0xabc", 1, 2, "Chargeback", "a@b.com", "01GA1")
+
+    return {
+        "order.create": lambda: client.order.create(**order_spec),
+        "order.create_many": lambda: client.order.create_many([order_spec] * 10),
+        "order.checkout": lambda: client.order.checkout(1, "BTC"),
+        "order.get": lambda: client.order.get(1),
+        "order.get_all": lambda: client.order.get_all(per_page=page_size),
+        "order.iter_all": lambda: list(client.order.iter_all(per_page=page_size)),
+        "order.iter_all[stream]": lambda: list(
+            client.order.iter_all(stream=True, per_page=page_size)
+        ),
+        "order.fetch_all": lambda: client.order.fetch_all(per_page=page_size),
+        "refund.create_order_refund": lambda: client.refund.create_order_refund(
+            *refund_args
+        ),
+        "refund.get_order_refund": lambda: client.refund.get_order_refund(1, 1),
+        "refund.get_order_refunds": lambda: client.refund.get_order_refunds(
+            1, per_page=page_size
+        ),
+        "refund.get_refunds": lambda: client.refund.get_refunds(per_page=page_size),
+        "refund.iter_order_refunds": lambda: list(
+            client.refund.iter_order_refunds(1, per_page=page_size)
+        ),
+        "refund.iter_refunds": lambda: list(
+            client.refund.iter_refunds(per_page=page_size)
+        ),
+        "refund.fetch_order_refunds": lambda: client.refund.fetch_order_refunds(
+            1, per_page=page_size
+        ),
+        "refund.fetch_refunds": lambda: client.refund.fetch_refunds(per_page=page_size),
+        "ledger.get": lambda: client.ledger.get("01GA000001"),
+        "ledger.get_all": lambda: client.ledger.get_all(per_page=page_size),
+        "ledger.iter_all": lambda: list(client.ledger.iter_all(per_page=page_size)),
+        "ledger.fetch_all": lambda: client.ledger.fetch_all(per_page=page_size),
+        "withdrawal.get": lambda: client.withdrawal.get("1"),
+        "withdrawal.get_all": lambda: client.withdrawal.get_all(per_page=page_size),
+        "withdrawal.iter_all": lambda: list(
+            client.withdrawal.iter_all(per_page=page_size)
+        ),
+        "withdrawal.fetch_all": lambda: client.withdrawal.fetch_all(per_page=page_size),
+        "public.get_exchange_rate_for_merchant": lambda: (
+            client.public.get_exchange_rate_for_merchant("EUR", "BTC")
+        ),
+        "public.get_exchange_rate_for_trader": lambda: (
+            client.public.get_exchange_rate_for_trader("buy", "EUR", "BTC")
+        ),
+        "public.get_all_exchange_rates": client.public.get_all_exchange_rates,
+        "public.get_merchant_exchange_rates": client.public.get_merchant_exchange_rates,
+        "public.get_trader_exchange_rates": client.public.get_trader_exchange_rates,
+        "public.ping": client.public.ping,
+        "public.get_ip_addresses": client.public.get_ip_addresses,
+        "public.get_currencies": client.public.get_currencies,
+        "public.get_platforms": client.public.get_platforms,
+    }
+
+
+def percentile(sorted_values: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted values."""
+    index = max(
+        0, min(len(sorted_values) - 1, round(fraction * len(sorted_values)) - 1)
+    )
+    return sorted_values[index]
+
+
+def measure(call: Callable[[], Any], *, number: int, warmup: int = 3) -> Dict[str, Any]:
+    for _ in range(warmup):
+        call()
+
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(number):
+        call_started = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - call_started)
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+
+    return {
+        "calls": number,
+        "calls_per_sec": number / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "alloc_kib": allocated_kib(call, number=min(number, 10)),
+    }
+
+
+def allocated_kib(call: Callable[[], Any], *, number: int) -> Optional[float]:
+    """Average peak of memory allocated while a call runs, above memory held before it."""
+    if not hasattr(tracemalloc, "reset_peak"):  # Python < 3.9
+        return None
+
+    tracemalloc.start()
+    try:
+        total = 0
+        for _ in range(number):
+            before, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            call()
+            _, peak = tracemalloc.get_traced_memory()
+            total += peak - before
+    finally:
+        tracemalloc.stop()
+
+    return total / number / 1024
+
+
+def changes(
+    results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]
+) -> Dict[str, Dict[str, float]]:
+    """Relative change of every metric against baseline, by method and metric. Positive change is always worse."""
+    result_changes: Dict[str, Dict[str, float]] = {}
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+
+        for metric in METRICS_LOWER_IS_BETTER + METRICS_HIGHER_IS_BETTER:
+            value, base_value = result.get(metric), base.get(metric)
+            if not value or not base_value:
+                continue
+            result_changes.setdefault(name, {})[metric] = (
+                value / base_value - 1
+                if metric in METRICS_LOWER_IS_BETTER
+                else base_value / value - 1
+            )
+
+    return result_changes
+
+
+def compare(
+    results: Dict[str, Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Any]],
+    *,
+    threshold: float,
+) -> Dict[str, Dict[str, float]]:
+    """Relative change of every metric that got worse by more than `threshold`, by method and metric. Positive change is always worse."""
+    regressions: Dict[str, Dict[str, float]] = {}
+    for name, metrics in changes(results, baseline).items():
+        for metric, change in metrics.items():
+            if change > threshold:
+                regressions.setdefault(name, {})[metric] = change
+
+    return regressions
+
+
+def run(
+    *,
+    number: int,
+    latency: float,
+    page_size: int,
+    total_pages: int,
+    transport: str,
+    only: Optional[str] = None,
+) -> Dict[str, Any]:
+    settings = {
+        "number": number,
+        "latency": latency,
+        "page_size": page_size,
+        "total_pages": total_pages,
+        "transport": transport,
+    }
+    results = {}
+    with FakeCoinGateServer(
+        latency=latency, page_size=page_size, total_pages=total_pages
+    ) as server:
+        client = CoinGate("api_key", transport=TRANSPORTS[transport]())
+        client.BASE_API_URL = server.url
+
+        for name, call in service_calls(client, page_size).items():
+            if only is not None and not re.search(only, name):
+                continue
+            results[name] = measure(call, number=number)
+            _print_result(name, results[name])
+
+    return {
+        "environment": {
+            "coingate": __version__,
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+        },
+        "settings": settings,
+        "results": results,
+    }
+
+
+def _print_result(name: str, result: Dict[str, Any]) -> None:
+    alloc = result["alloc_kib"]
+    print(
+        f"{name:<40} {result['calls_per_sec']:>9.1f}/s"
+        f"  p50 {result['p50_ms']:>8.3f} ms  p99 {result['p99_ms']:>8.3f} ms"
+        f"  alloc {'-' if alloc is None else f'{alloc:.1f}':>8} KiB"
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=50, help="calls per method")
+    parser.add_argument(
+        "--latency", type=float, default=0.0, help="seconds every response is delayed"
+    )
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--total-pages", type=int, default=3)
+    parser.add_argument("--transport", choices=sorted(TRANSPORTS), default="requests")
+    parser.add_argument("--only", help="regular expression selecting methods")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--save", help="write results as a new baseline JSON file")
+    parser.add_argument(
+        "--compare",
+        "--baseline",
+        dest="baseline",
+        default=DEFAULT_BASELINE,
+        help="compare results with this JSON file. Default: benchmarks/baseline.json",
+    )
+    parser.add_argument(
+        "--no-compare",
+        dest="baseline",
+        action="store_const",
+        const=None,
+        help="do not compare results with a baseline",
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.2,
+        help="relative change reported as regression. Default: 0.2",
+    )
+    args = parser.parse_args(argv)
+
+    report = run(
+        number=args.number,
+        latency=args.latency,
+        page_size=args.page_size,
+        total_pages=args.total_pages,
+        transport=args.transport,
+        only=args.only,
+    )
+    for path in filter(None, (args.output, args.save)):
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+    # Saved baseline is not compared with itself
+    if not args.baseline or (
+        args.save and os.path.abspath(args.baseline) == os.path.abspath(args.save)
+    ):
+        return 0
+    if not os.path.exists(args.baseline):
+        print(
+            f"\nwarning: baseline {args.baseline} not found, results are not compared"
+        )
+        return 0
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    # Number of calls only changes precision, other settings change results
+    settings = {k: v for k, v in report["settings"].items() if k != "number"}
+    base_settings = baseline.get("settings", {})
+    if {k: base_settings.get(k) for k in settings} != settings:
+        print(
+            f"\nwarning: baseline was measured with {base_settings},"
+            f" results are not comparable"
+        )
+
+    base_results = baseline.get("results", {})
+    print(f"\nChange against {args.baseline}, positive is worse:")
+    for name, metrics in changes(report["results"], base_results).items():
+        _print_changes(name, metrics)
+
+    regressions = compare(report["results"], base_results, threshold=args.threshold)
+    if not regressions:
+        print(f"\nNo regressions above {args.threshold:.0%} against {args.baseline}")
+        return 0
+
+    print(f"\nRegressions above {args.threshold:.0%} against {args.baseline}:")
+    for name, metrics in regressions.items():
+        _print_changes(name, metrics)
+    return 1
+
+
+def _print_changes(name: str, metrics: Dict[str, float]) -> None:
+    text = ", ".join(f"{m} {change:+.0%}" for m, change in metrics.items())
+    print(f"  {name:<40} {text}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,230 @@
+import posixpath
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+
+import httpx
+
+from ..client import CoinGate
+from ..json_codec import JSONCodec
+from ..metrics import MetricsRegistry
+from ..parsing import M, parse_resource
+from ..rate_limit import RateLimiter
+from ..retry import RetryPolicy
+from ..single_flight import SingleFlight
+from .http_client import AsyncHTTPClient
+from .services import (
+    AsyncLedgerService,
+    AsyncOrderService,
+    AsyncPublicService,
+    AsyncRefundService,
+    AsyncWithdrawalService,
+)
+
+
+if TYPE_CHECKING:
+    from ..tracing import Tracing
+
+S = TypeVar("S")
+
+
+class AsyncCoinGate:
+    BASE_API_URL = CoinGate.BASE_API_URL
+    BASE_SANDBOX_API_URL = CoinGate.BASE_SANDBOX_API_URL
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        use_sanbox_mode: bool = False,
+        *,
+        limits: Optional[httpx.Limits] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self._http_client = AsyncHTTPClient(api_key, limits=limits, transport=transport)
+        self._use_sandbox_mode = use_sanbox_mode
+        self._validate_resources = True
+        self._json_codec = JSONCodec()
+        self._single_flight: Optional[SingleFlight] = None
+        self._metrics: Optional[MetricsRegistry] = None
+
+        self._set_services(None)
+
+    async def __aenter__(self) -> "AsyncCoinGate":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+    @property
+    def order(self) -> AsyncOrderService:
+        return self._order
+
+    @property
+    def refund(self) -> AsyncRefundService:
+        return self._refund
+
+    @property
+    def public(self) -> AsyncPublicService:
+        return self._public
+
+    @property
+    def ledger(self) -> AsyncLedgerService:
+        return self._ledger
+
+    @property
+    def withdrawal(self) -> AsyncWithdrawalService:
+        return self._withdrawal
+
+    @property
+    def is_sandbox_mode(self):
+        return self._use_sandbox_mode
+
+    def set_api_key(self, api_key: Optional[str]):
+        self._http_client.api_key = api_key
+
+    def set_timeout(self, timeout: Optional[int]):
+        self._http_client.timeout = timeout
+
+    def set_app_info(self, name: str, *, version: str):
+        self._http_client.update_user_agent(name=name, version=version)
+
+    def set_rate_limiter(self, rate_limiter: Optional[RateLimiter]):
+        self._http_client.rate_limiter = rate_limiter
+
+    def set_resource_validation(self, enabled: bool):
+        """Disabling validation builds resources without pydantic validation, which is several times faster for large list responses.
+        Use it only with responses of the real CoinGate API."""
+        self._validate_resources = enabled
+
+    def set_json_codec(self, json_codec: JSONCodec):
+        """Sets codec used to decode response bodies. Default: :class:`coingate.json_codec.JSONCodec`"""
+        self._json_codec = json_codec
+
+    def set_retry_policy(self, retry_policy: Optional[RetryPolicy]):
+        self._http_client.retry_policy = retry_policy
+
+    def set_single_flight(self, single_flight: Optional[SingleFlight]):
+        """Makes identical concurrent `GET` requests share one API call and its parsed body."""
+        self._single_flight = single_flight
+
+    def add_hook(self, event: str, hook: Callable[..., Any]) -> Callable[..., Any]:
+        """Registers `hook` for a request lifecycle event, see :class:`coingate.hooks.RequestHooks`."""
+        return self._http_client.hooks.add(event, hook)
+
+    def remove_hook(self, event: str, hook: Callable[..., Any]):
+        self._http_client.hooks.remove(event, hook)
+
+    def set_tracing(self, tracing: Optional["Tracing"]):
+        """Records OpenTelemetry spans of service calls and API requests, see :class:`coingate.tracing.Tracing`."""
+        self._http_client.tracing = tracing
+        self._set_services(tracing)
+
+    def _set_services(self, tracing: Optional["Tracing"]) -> None:
+        def _create(service_class: Callable[["AsyncCoinGate"], S]) -> S:
+            service = service_class(self)
+            if tracing is None:
+                return service
+            return cast(S, tracing.trace_service(service))
+
+        self._order = _create(AsyncOrderService)
+        self._refund = _create(AsyncRefundService)
+        self._public = _create(AsyncPublicService)
+        self._ledger = _create(AsyncLedgerService)
+        self._withdrawal = _create(AsyncWithdrawalService)
+
+    def set_metrics(self, metrics: Optional[MetricsRegistry]):
+        """Records request metrics in `metrics`, replacing the previously set registry."""
+        if self._metrics is not None:
+            for event, hook in self._metrics.hooks().items():
+                self.remove_hook(event, hook)
+        self._metrics = metrics
+        if metrics is not None:
+            for event, hook in metrics.hooks().items():
+                self.add_hook(event, hook)
+
+    async def request(
+        self,
+        method: Union[str, bytes],
+        endpoint: str,
+        *,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ):
+        url = self._build_path_to_endpoint(endpoint)
+        single_flight = self._single_flight
+        if single_flight is None or not single_flight.is_coalescable(method):
+            return await self._http_client.request(
+                method, url, data=data, params=params
+            )
+
+        return await single_flight.acall(
+            single_flight.key(method, url, params, data, self._authorization()),
+            lambda: self._http_client.request(method, url, data=data, params=params),
+        )
+
+    async def request_json(
+        self,
+        method: Union[str, bytes],
+        endpoint: str,
+        *,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        single_flight = self._single_flight
+        if single_flight is None or not single_flight.is_coalescable(method):
+            return await self._request_json(method, endpoint, data=data, params=params)
+
+        # Callers of `request` get the response, these get its parsed body
+        key = single_flight.json_key(
+            method,
+            self._build_path_to_endpoint(endpoint),
+            params,
+            data,
+            self._authorization(),
+        )
+        return await single_flight.acall(
+            key,
+            lambda: self._request_json(method, endpoint, data=data, params=params),
+        )
+
+    async def _request_json(
+        self,
+        method: Union[str, bytes],
+        endpoint: str,
+        *,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+    ) -> Any:
+        url = self._build_path_to_endpoint(endpoint)
+        response = await self._http_client.request(
+            method, url, data=data, params=params
+        )
+        return self._json_codec.loads(response.content)
+
+    async def aclose(self) -> None:
+        """Closes the underlying connection pool."""
+        await self._http_client.aclose()
+
+    def parse_resource(self, model: Type[M], data: Dict[str, Any]) -> M:
+        return parse_resource(model, data, validate=self._validate_resources)
+
+    def _authorization(self) -> Optional[str]:
+        # Part of coalescing keys, so clients with different API keys sharing
+        # one SingleFlight never get each other's responses
+        return self._http_client.default_headers.get("Authorization")
+
+    def _base_api_url(self):
+        return self.BASE_SANDBOX_API_URL if self.is_sandbox_mode else self.BASE_API_URL
+
+    def _build_path_to_endpoint(self, endpoint: str) -> str:
+        api_url = self._base_api_url()
+        endpoint = endpoint.lower()
+        return posixpath.join(api_url, endpoint)
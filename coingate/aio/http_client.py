@@ -0,0 +1,131 @@
+import itertools
+import time
+from typing import Any, Awaitable, Dict, Optional, Union
+
+import httpx
+
+from ..hooks import RequestTiming
+from ..http_client import BaseHTTPClient
+from ..transport import TransportRequest
+
+
+class AsyncHTTPClient(BaseHTTPClient):
+    def __init__(
+        self,
+        api_key: Optional[str],
+        *,
+        limits: Optional[httpx.Limits] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ) -> None:
+        self._client = httpx.AsyncClient(
+            limits=limits or httpx.Limits(max_connections=100),
+            transport=transport,
+        )
+
+        super().__init__(api_key)
+
+    async def request(
+        self,
+        method: Union[str, bytes],
+        url: Union[str, bytes],
+        *,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        if self._tracing is None:
+            return await self._request(method, url, data, params)
+
+        with self._tracing.request_span(method, url, params, data) as span:
+            response = await self._request(method, url, data, params)
+            span.set_attribute("http.response.status_code", response.status_code)
+            return response
+
+    async def _request(
+        self,
+        method: Union[str, bytes],
+        url: Union[str, bytes],
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+    ) -> httpx.Response:
+        request = TransportRequest.build(
+            method,
+            url,
+            headers=self._build_request_headers(method, data),
+            data=data,
+            params=params,
+            timeout=self._timeout,
+        )
+
+        attempts = itertools.count()
+
+        def _send() -> Awaitable[httpx.Response]:
+            return self._send(request, next(attempts))
+
+        if self._retry_policy is not None:
+            return await self._retry_policy.acall(
+                method, _send, on_retry=self._retry_hook(request)
+            )
+
+        return await _send()
+
+    async def _send(
+        self, request: TransportRequest, attempt: int = 0
+    ) -> httpx.Response:
+        queued = 0.0
+        if self._rate_limiter is not None:
+            queued = await self._rate_limiter.acquire_async(request.url)
+
+        if self._tracing is None:
+            return await self._send_attempt(request, queued)
+
+        with self._tracing.attempt_span(request, attempt) as traced_request:
+            return await self._send_attempt(traced_request, queued)
+
+    async def _send_attempt(
+        self, request: TransportRequest, queued: float
+    ) -> httpx.Response:
+        self._hooks.emit("before_request", request)
+        started = time.perf_counter()
+        try:
+            # Query string and form body are encoded by TransportRequest the
+            # same way as for the synchronous client
+            response = await self._client.request(
+                request.method,
+                request.url,
+                content=request.body,
+                timeout=request.timeout,
+                headers=dict(request.headers),
+            )
+        except Exception as e:
+            timing = RequestTiming(queued, time.perf_counter() - started)
+            self._hooks.emit("on_error", request, e, timing)
+            raise
+
+        timing = RequestTiming(queued, time.perf_counter() - started)
+        if self._rate_limiter is not None:
+            self._rate_limiter.observe(request.url, response.headers)
+        if self._tracing is not None:
+            self._tracing.record_response(response.status_code)
+
+        self._hooks.emit("after_response", request, response, timing)
+        try:
+            return self._process_response(response)
+        except Exception as e:
+            self._hooks.emit("on_error", request, e, timing)
+            raise
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+    def _process_response(self, response: httpx.Response):
+        # httpx raises for 1xx and 3xx responses as well
+        if not self._is_error(response):
+            return response
+
+        try:
+            response.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            client_exception = self._raise_client_error(response)
+            raise client_exception or e
+        else:
+            return response
@@ -0,0 +1,5 @@
+from .ledger import AsyncLedgerService
+from .order import AsyncOrderService
+from .public import AsyncPublicService
+from .refund import AsyncRefundService
+from .withdrawal import AsyncWithdrawalService
@@ -0,0 +1,89 @@
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+
+from ...pagination import BulkPages, afetch_pages_concurrently, aiterate_pages
+from ...resources.ledger import LedgerAccount, PaginatedLedgerAccounts
+
+if TYPE_CHECKING:
+    from ..client import AsyncCoinGate
+
+
+class AsyncLedgerService:
+    def __init__(self, client: "AsyncCoinGate"):
+        self._client = client
+
+    async def get(self, id: str) -> LedgerAccount:
+        """Retrieves a specific ledger account.
+
+        :param str `id`: ID of ledger account
+
+        :rtype `:class:`<coingate.resources.ledger.LedgerAccount>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> await client.ledger.get('ledger_id')
+
+        """
+        response = await self._client.request_json("get", f"v2/ledger/accounts/{id}")
+        return self._client.parse_resource(LedgerAccount, response)
+
+    async def get_all(
+        self, *, page: Optional[int] = None, per_page: Optional[int] = None
+    ) -> PaginatedLedgerAccounts:
+        """Retrieves all ledger accounts.
+
+        :param Optional[int] `page`: Current page number. Default: 1
+        :param Optional[int] `per_page`: Number of accounts per page. Max: 100. Default: 100
+
+        :rtype `:class:`<coingate.resources.ledger.PaginatedLedgerAccounts>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> await client.ledger.get_all()
+
+        """
+        response = await self._client.request_json(
+            "get", "v2/ledger/accounts", data={"page": page, "per_page": per_page}
+        )
+
+        return self._client.parse_resource(PaginatedLedgerAccounts, response)
+
+    def iter_all(
+        self, *, per_page: Optional[int] = None
+    ) -> AsyncIterator[LedgerAccount]:
+        """Iterates over ledger accounts of every page. Next page is fetched in background while current one is consumed.
+
+        :param Optional[int] `per_page`: Number of accounts per page. Max: 100. Default: 100
+
+        :rtype AsyncIterator[:class:`<coingate.resources.ledger.LedgerAccount>`]
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> async for account in client.ledger.iter_all():
+          ...     print(account.balance)
+
+        """
+        return aiterate_pages(
+            lambda page: self.get_all(page=page, per_page=per_page),
+            lambda accounts: accounts.accounts,
+        )
+
+    async def fetch_all(
+        self, *, workers: int = 4, per_page: Optional[int] = None
+    ) -> BulkPages[LedgerAccount]:
+        """Fetches ledger accounts of every page. Once the first page is received, remaining pages are fetched concurrently.
+
+        :param int `workers`: Number of pages fetched at the same time. Default: 4
+        :param Optional[int] `per_page`: Number of accounts per page. Max: 100. Default: 100
+
+        :rtype `:class:`<coingate.pagination.BulkPages>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> await client.ledger.fetch_all()
+
+        """
+        return await afetch_pages_concurrently(
+            lambda page: self.get_all(page=page, per_page=per_page),
+            lambda accounts: accounts.accounts,
+            workers=workers,
+        )
@@ -0,0 +1,266 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Union,
+)
+
+from ...bulk import (
+    BulkResults,
+    arun_concurrently,
+    find_duplicate_order_ids,
+    pending_order_ids,
+    reuse_existing_orders,
+)
+from ...pagination import BulkPages, afetch_pages_concurrently, aiterate_pages
+from ...resources.order import BaseOrder, Checkout, NewOrder, Order, PaginatedOrders
+from ...services.order import OrderService
+
+if TYPE_CHECKING:
+    from ..client import AsyncCoinGate
+
+
+class AsyncOrderService:
+    def __init__(self, client: "AsyncCoinGate"):
+        self._client = client
+
+    async def create(
+        self,
+        price_amount: Decimal,
+        price_currency: str,
+        receive_currency: str,
+        *,
+        order_id: Optional[str] = None,
+        title: Optional[str] = None,
+        description: Optional[str] = None,
+        callback_url: Optional[str] = None,
+        cancel_url: Optional[str] = None,
+        success_url: Optional[str] = None,
+        token: Optional[str] = None,
+        purchaser_email: Optional[str] = None,
+    ) -> NewOrder:
+        """Create order at CoinGate and redirect shopper to invoice (payment_url).
+
+        Accepts the same parameters as :meth:`coingate.services.order.OrderService.create`.
+
+        :rtype `:class`<coingate.resources.order.NewOrder>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> await client.order.create(Decimal('10'), 'EUR', 'EUR')
+
+        """
+        response = await self._client.request_json(
+            "post",
+            "v2/orders",
+            data=OrderService._create_data(
+                price_amount,
+                price_currency,
+                receive_currency,
+                order_id=order_id,
+                title=title,
+                description=description,
+                callback_url=callback_url,
+                cancel_url=cancel_url,
+                success_url=success_url,
+                token=token,
+                purchaser_email=purchaser_email,
+            ),
+        )
+
+        return self._client.parse_resource(NewOrder, response)
+
+    async def create_many(
+        self,
+        specs: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = 4,
+        existing_since: Optional[datetime] = None,
+    ) -> BulkResults[BaseOrder]:
+        """Creates orders concurrently, at most `concurrency` requests in flight.
+
+        Accepts the same parameters as :meth:`coingate.services.order.OrderService.create_many`.
+
+        :rtype `:class:`<coingate.bulk.BulkResults>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> results = await client.order.create_many(specs, concurrency=16)
+
+        """
+        specs = list(specs)
+        results: Dict[int, Union[BaseOrder, Exception]] = dict(
+            find_duplicate_order_ids(specs)
+        )
+
+        if existing_since is not None:
+            order_ids = pending_order_ids(specs, results)
+            existing: Dict[str, Order] = {}
+            if order_ids:
+                async for order in self.iter_all(
+                    sort="created_at_asc", created_from=existing_since
+                ):
+                    if order.order_id in order_ids:
+                        existing.setdefault(order.order_id, order)
+            reuse_existing_orders(specs, results, existing)
+
+        pending = [i for i in range(len(specs)) if i not in results]
+        created = await arun_concurrently(
+            lambda i: self.create(**specs[i]), pending, concurrency=concurrency
+        )
+        results.update(zip(pending, created))
+
+        return BulkResults([results[i] for i in range(len(specs))])
+
+    async def checkout(
+        self,
+        id: int,
+        pay_currency: str,
+        *,
+        lightning_network: Optional[bool] = None,
+        purchaser_email: Optional[str] = None,
+        platform_id: Optional[int] = None,
+    ) -> Checkout:
+        """Placing created order with pre-selected payment currency (BTC, LTC, ETH, etc).
+
+        Accepts the same parameters as :meth:`coingate.services.order.OrderService.checkout`.
+
+        :rtype `:class:`<coingate.resources.order.Checkout>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> await client.order.checkout(123, 'EUR')
+
+        """
+        response = await self._client.request_json(
+            "post",
+            f"v2/orders/{id}/checkout",
+            data=OrderService._checkout_data(
+                pay_currency,
+                lightning_network=lightning_network,
+                purchaser_email=purchaser_email,
+                platform_id=platform_id,
+            ),
+        )
+
+        return self._client.parse_resource(Checkout, response)
+
+    async def get(self, id: int) -> Order:
+        """Retrieves a specific order.
+
+        :param int `id`: CoinGate Order id
+
+        :rtype `:class:`<coingate.resources.order.Order>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> await client.order.get(123)
+
+        """
+        response = await self._client.request_json("get", f"v2/orders/{id}")
+        return self._client.parse_resource(Order, response)
+
+    async def get_all(
+        self,
+        *,
+        per_page: Optional[int] = None,
+        page: Optional[int] = None,
+        sort: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> PaginatedOrders:
+        """Retrieving information of all placed orders.
+
+        Accepts the same parameters as :meth:`coingate.services.order.OrderService.get_all`.
+
+        :rtype `:class:`<coingate.resources.order.PaginatedOrders>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> await client.order.get_all()
+
+        """
+        response = await self._client.request_json(
+            "get",
+            "v2/orders",
+            params=OrderService._get_all_params(
+                per_page, page, sort, created_from, created_to
+            ),
+        )
+
+        return self._client.parse_resource(PaginatedOrders, response)
+
+    def iter_all(
+        self,
+        *,
+        per_page: Optional[int] = None,
+        sort: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> AsyncIterator[Order]:
+        """Iterates over orders of every page. Next page is fetched in background while current one is consumed.
+
+        Accepts the same parameters as :meth:`coingate.services.order.OrderService.iter_all`.
+
+        :rtype AsyncIterator[:class:`<coingate.resources.order.Order>`]
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> async for order in client.order.iter_all():
+          ...     print(order.id)
+
+        """
+        return aiterate_pages(
+            lambda page: self.get_all(
+                per_page=per_page,
+                page=page,
+                sort=sort,
+                created_from=created_from,
+                created_to=created_to,
+            ),
+            lambda orders: orders.orders,
+        )
+
+    async def fetch_all(
+        self,
+        *,
+        workers: int = 4,
+        per_page: Optional[int] = None,
+        sort: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> BulkPages[Order]:
+        """Fetches orders of every page. Once the first page is received, remaining pages are fetched concurrently.
+        Orders are merged in page order without duplicates, pages which failed to load are reported in `failed_pages`.
+
+        :param int `workers`: Number of pages fetched at the same time. Default: 4
+        :param Optional[int] `per_page`: How many orders per page. Max: 100. Default: 100
+        :param Optional[str] `sort`: Sort orders by field. Available sort options: created_at_asc, created_at_desc. Default: created_at_desc
+        :param Optional[str] `created_from`: Where order creation time is equal or greater
+        :param Optional[str] `created_to`: Where order creation time is equal or greater
+
+        :rtype `:class:`<coingate.pagination.BulkPages>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> result = await client.order.fetch_all(workers=8)
+          >>> result.items, result.failed_pages
+
+        """
+        return await afetch_pages_concurrently(
+            lambda page: self.get_all(
+                per_page=per_page,
+                page=page,
+                sort=sort,
+                created_from=created_from,
+                created_to=created_to,
+            ),
+            lambda orders: orders.orders,
+            workers=workers,
+        )
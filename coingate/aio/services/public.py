@@ -0,0 +1,216 @@
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+
+from typing_extensions import Literal
+
+from ...resources.public import (
+    ExchangesRates,
+    ExchangeTrader,
+    NestedCurrencyObject,
+    Ping,
+    PublicCurrency,
+    PublicPlatform,
+)
+from ...services.public import PublicService
+
+if TYPE_CHECKING:
+    from ..client import AsyncCoinGate
+
+
+class AsyncPublicService:
+    def __init__(self, client: "AsyncCoinGate"):
+        self._client = client
+
+    async def get_exchange_rate_for_merchant(
+        self, from_currency: str, to_currency: str
+    ) -> Optional[Decimal]:
+        """Get current exchange rate for any two currencies for merchant, fiat or crypto
+
+        :param str `from_currency`: ISO Symbol. Example: EUR, USD, BTC, ETH, etc
+        :param str `to_currency`: ISO Symbol. Example: EUR, USD, BTC, ETH, etc
+
+        :rtype Decimal
+
+        Basic Usage::
+
+          >>> client = AsyncCoinGate()
+          >>> await client.public.get_exchange_rate_for_merchant("ETH", "EUR")
+
+        """
+        return await self._get_exchange_rate("merchant", from_currency, to_currency)
+
+    async def get_exchange_rate_for_trader(
+        self, kind: Literal["buy", "sell"], from_currency: str, to_currency: str
+    ) -> Optional[Decimal]:
+        """Get current exchange rate for any two currencies for trader, fiat or crypto
+
+        :param Literal["buy", "sell"] `kind`
+        :param str `from_currency`: ISO Symbol. Example: EUR, USD, BTC, ETH, etc
+        :param str `to_currency`: ISO Symbol. Example: EUR, USD, BTC, ETH, etc
+
+        :rtype Decimal
+
+        Basic Usage::
+
+          >>> client = AsyncCoinGate()
+          >>> await client.public.get_exchange_rate_for_trader("buy", "ETH", "EUR")
+
+        """
+        return await self._get_exchange_rate(
+            f"trader/{kind}", from_currency, to_currency
+        )
+
+    async def _get_exchange_rate(
+        self, sideType: str, from_currency: str, to_currency: str
+    ) -> Optional[Decimal]:
+        response = await self._client.request(
+            "get",
+            PublicService._exchange_rate_endpoint(sideType, from_currency, to_currency),
+        )
+        return PublicService._parse_exchange_rate(response.text)
+
+    async def get_all_exchange_rates(self) -> ExchangesRates:
+        """Get current CoinGate exchange rates for Merchants and Traders
+
+        :rtype: :class:`<coingate.resources.public.ExchangeRates>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate()
+          >>> await client.public.get_all_exchange_rates()
+
+        """
+        response = await self._get_exchange_rates()
+        return self._client.parse_resource(ExchangesRates, response)
+
+    async def get_merchant_exchange_rates(self) -> NestedCurrencyObject:
+        """Get current CoinGate exchange rates for Merchant
+
+        :rtype: `:class:`<coingate.resources.public.NestedCurrencyObject>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate()
+          >>> await client.public.get_merchant_exchange_rates()
+
+        """
+        response = await self._get_exchange_rates("merchant")
+        return NestedCurrencyObject(response)
+
+    async def get_trader_exchange_rates(
+        self, kind: Optional[Literal["buy", "sell"]] = None
+    ) -> Union[ExchangeTrader, NestedCurrencyObject]:
+        """Get current CoinGate exchange rates for Trader
+
+        :param Optional[Literal["buy", "sell"]]
+
+        :rtype: Union[`:class:`<coingate.resources.ExchangeTrader>`, `:class:`<coingate.resources.NestedCurrencyObject>`]
+
+        Basic Usage::
+          >>> client = AsyncCoinGate()
+          >>> await client.public.get_trader_exchange_rates("buy")
+
+        """
+        sideType = "trader" if kind is None else f"trader/{kind}"
+        response = await self._get_exchange_rates(sideType)
+        return (
+            self._client.parse_resource(ExchangeTrader, response)
+            if kind is None
+            else NestedCurrencyObject(response)
+        )
+
+    async def _get_exchange_rates(
+        self, sideType: Optional[str] = None
+    ) -> Dict[str, Any]:
+        return await self._client.request_json(
+            "get", PublicService._exchange_rates_endpoint(sideType)
+        )
+
+    async def ping(self) -> Ping:
+        """A health check endpoint for CoinGate API
+
+        :rtype :class:`<coingate.resources.public.Ping>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate()
+          >>> await client.public.ping()
+
+        """
+        response = await self._client.request_json("get", "v2/ping")
+        return self._client.parse_resource(Ping, response)
+
+    async def get_ip_addresses(self, separator: Optional[str] = None) -> str:
+        """Get IP addresses of CoinGate servers
+
+        :param Optional[str] `separator`: Separator of ip addresses. Default new line (\\n).
+
+        :rtype str
+
+        Basic Usage::
+          >>> client = AsyncCoinGate()
+          >>> await client.public.get_ip_addresses(separator="|")
+
+        """
+
+        return (
+            await self._client.request(
+                "get", "v2/ips-v4", params={"separator": separator}
+            )
+        ).text
+
+    async def get_currencies(
+        self,
+        native: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+        merchant_pay: Optional[bool] = None,
+        merchant_receive: Optional[bool] = None,
+        kind: Optional[Literal["crypto", "fiat"]] = None,
+    ) -> List[PublicCurrency]:
+        """Retrieves all currencies. Filters which are not given are not applied.
+
+        :param Optional[bool] `native`
+        :param Optional[bool] `enabled`
+        :param Optional[bool] `merchant_pay`
+        :param Optional[bool] `merchant_receive`
+        :param Optional[Literal["crypto", "fiat"]] `kind`
+
+        :rtype List[:class:`<coingate.resources.public.PublicCurrency>`]
+
+        Basic Usage::
+          >>> client = AsyncCoinGate()
+          >>> await client.public.get_currencies()
+
+        """
+        response = await self._client.request_json(
+            "get",
+            "v2/currencies",
+            params=PublicService._currencies_params(
+                native, enabled, merchant_pay, merchant_receive, kind
+            ),
+        )
+
+        return [
+            self._client.parse_resource(PublicCurrency, currency)
+            for currency in response
+        ]
+
+    async def get_platforms(
+        self, enabled: Optional[bool] = None
+    ) -> List[PublicPlatform]:
+        """Get all platforms
+
+        :param Optional[bool] `enabled`: List only enabled platforms
+
+        :rtype List[:class:`<coingate.resources.public.Platform>`]
+
+        Basic Usage::
+          >>> client = AsyncCoinGate()
+          >>> await client.public.get_platforms()
+
+        """
+        response = await self._client.request_json(
+            "get", "v2/platforms", params={"enabled": enabled}
+        )
+
+        return [
+            self._client.parse_resource(PublicPlatform, platform)
+            for platform in response
+        ]
@@ -0,0 +1,215 @@
+from decimal import Decimal
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+
+from ...pagination import BulkPages, afetch_pages_concurrently, aiterate_pages
+from ...resources.refund import PaginatedRefunds, PaginatedRefundsRefund, Refund
+from ...services.refund import RefundService
+
+if TYPE_CHECKING:
+    from ..client import AsyncCoinGate
+
+
+class AsyncRefundService:
+    def __init__(self, client: "AsyncCoinGate"):
+        self._client = client
+
+    async def create_order_refund(
+        self,
+        order_id: int,
+        amount: Decimal,
+        address: str,
+        currency_id: int,
+        platform_id: int,
+        reason: str,
+        email: str,
+        ledger_account_id: str,
+        *,
+        address_memo: Optional[str] = None,
+    ) -> Refund:
+        """Creates a refund for an order.
+
+        :param int `order_id`: ID of the order to be refunded
+        :param Decimal `amount`: Requesting amount in order price currency to refund
+        :param str `address`: Cryptocurrency address to which the refund will be sent
+        :param Optional[str] `address_memo`
+        :param int `currency_id`: ID of the currency in which the refund will be issued
+        :param int `platform_id`: Platform ID of the currency in which the refund will be issued
+        :param str `reason`: Reason for issuing the refund
+        :param str `email`: Customer will receive updates on refund status to this email
+        :param str `ledger_account_id`: ID of the trader balance associated with the currency in which the refund will be issued
+
+        :rtype `:class:`<coingate.resources.refund.Refund>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> await client.refund.create_order_refund(1, Decimal('10'), 'addy', 1, 1, 'refund', 'email@email.com', 'id')
+
+        """
+        res = await self._client.request_json(
+            "post",
+            f"v2/orders/{order_id}/refunds",
+            data=RefundService._create_order_refund_data(
+                amount,
+                address,
+                currency_id,
+                platform_id,
+                reason,
+                email,
+                ledger_account_id,
+                address_memo=address_memo,
+            ),
+        )
+
+        return self._client.parse_resource(Refund, res)
+
+    async def get_order_refund(self, order_id: int, id: int) -> Refund:
+        """Retrieves a specific refund for an order.
+
+        :param int `order_id`: ID of the order to be refunded
+        :param int `id`: ID of the refund
+
+        :rtype `:class:`<coingate.resources.refund.Refund>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> await client.refund.get_order_refund(1, 1)
+
+        """
+        res = await self._client.request_json(
+            "get", f"v2/orders/{order_id}/refunds/{id}"
+        )
+        return self._client.parse_resource(Refund, res)
+
+    async def get_order_refunds(
+        self, order_id: int, *, page: Optional[int] = 1, per_page: Optional[int] = 100
+    ) -> PaginatedRefunds:
+        """Retrieves all refunds for an order.
+
+        :param int `order_id`: ID of the order to be refunded
+        :param Optional[int] `page`: Current page number
+        :param Optional[int] `per_page`: Number of refunds per page
+
+        :rtype `:class:`<coingate.resources.refund.PaginatedRefunds>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> await client.refund.get_order_refunds(1)
+
+        """
+        res = await self._client.request_json(
+            "get",
+            f"v2/orders/{order_id}/refunds",
+            data={
+                "page": page,
+                "per_page": per_page,
+            },
+        )
+
+        return self._client.parse_resource(PaginatedRefunds, res)
+
+    async def get_refunds(
+        self, *, page: int = 1, per_page: int = 100
+    ) -> PaginatedRefunds:
+        """Retrieves all refunds.
+
+        :param Optional[int] `page`: Current page number
+        :param Optional[int] `per_page`: Number of refunds per page
+
+        :rtype `:class:`<coingate.resources.refund.PaginatedRefunds>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> await client.refund.get_refunds()
+
+        """
+        res = await self._client.request_json(
+            "get",
+            "v2/refunds",
+            data={"page": page, "per_page": per_page},
+        )
+
+        return self._client.parse_resource(PaginatedRefunds, res)
+
+    def iter_order_refunds(
+        self, order_id: int, *, per_page: int = 100
+    ) -> AsyncIterator[PaginatedRefundsRefund]:
+        """Iterates over refunds of an order on every page. Next page is fetched in background while current one is consumed.
+
+        :param int `order_id`: ID of the order to be refunded
+        :param int `per_page`: Number of refunds per page
+
+        :rtype AsyncIterator[:class:`<coingate.resources.refund.PaginatedRefundsRefund>`]
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> async for refund in client.refund.iter_order_refunds(1):
+          ...     print(refund.status)
+
+        """
+        return aiterate_pages(
+            lambda page: self.get_order_refunds(order_id, page=page, per_page=per_page),
+            lambda refunds: refunds.refunds,
+        )
+
+    def iter_refunds(
+        self, *, per_page: int = 100
+    ) -> AsyncIterator[PaginatedRefundsRefund]:
+        """Iterates over all refunds on every page. Next page is fetched in background while current one is consumed.
+
+        :param int `per_page`: Number of refunds per page
+
+        :rtype AsyncIterator[:class:`<coingate.resources.refund.PaginatedRefundsRefund>`]
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> async for refund in client.refund.iter_refunds():
+          ...     print(refund.status)
+
+        """
+        return aiterate_pages(
+            lambda page: self.get_refunds(page=page, per_page=per_page),
+            lambda refunds: refunds.refunds,
+        )
+
+    async def fetch_order_refunds(
+        self, order_id: int, *, workers: int = 4, per_page: int = 100
+    ) -> BulkPages[PaginatedRefundsRefund]:
+        """Fetches refunds of an order on every page. Once the first page is received, remaining pages are fetched concurrently.
+
+        :param int `order_id`: ID of the order to be refunded
+        :param int `workers`: Number of pages fetched at the same time. Default: 4
+        :param int `per_page`: Number of refunds per page
+
+        :rtype `:class:`<coingate.pagination.BulkPages>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> await client.refund.fetch_order_refunds(1)
+
+        """
+        return await afetch_pages_concurrently(
+            lambda page: self.get_order_refunds(order_id, page=page, per_page=per_page),
+            lambda refunds: refunds.refunds,
+            workers=workers,
+        )
+
+    async def fetch_refunds(
+        self, *, workers: int = 4, per_page: int = 100
+    ) -> BulkPages[PaginatedRefundsRefund]:
+        """Fetches all refunds on every page. Once the first page is received, remaining pages are fetched concurrently.
+
+        :param int `workers`: Number of pages fetched at the same time. Default: 4
+        :param int `per_page`: Number of refunds per page
+
+        :rtype `:class:`<coingate.pagination.BulkPages>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> await client.refund.fetch_refunds(workers=8)
+
+        """
+        return await afetch_pages_concurrently(
+            lambda page: self.get_refunds(page=page, per_page=per_page),
+            lambda refunds: refunds.refunds,
+            workers=workers,
+        )
@@ -0,0 +1,87 @@
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+
+from ...pagination import BulkPages, afetch_pages_concurrently, aiterate_pages
+from ...resources.withdrawal import PaginatedWithdrawals, Withdrawal
+
+if TYPE_CHECKING:
+    from ..client import AsyncCoinGate
+
+
+class AsyncWithdrawalService:
+    def __init__(self, client: "AsyncCoinGate"):
+        self._client = client
+
+    async def get(self, id: str) -> Withdrawal:
+        """Retrieves a specific withdrawal.
+
+        :param int `id`: ID of withdrawal
+
+        :rtype `:class:`<coingate.resources.withdrawal.Withdrawal>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> await client.withdrawal.get(1)
+
+        """
+        response = await self._client.request_json("get", f"v2/withdrawals/{id}")
+        return self._client.parse_resource(Withdrawal, response)
+
+    async def get_all(
+        self, *, page: Optional[int] = None, per_page: Optional[int] = None
+    ) -> PaginatedWithdrawals:
+        """Retrieves all withdrawals.
+
+        :param Optional[int] `page`: Current page number. Default: 1
+        :param Optional[int] `per_page`: Number of withdrawals per page. Max: 100. Default: 100
+
+        :rtype `:class:`<coingate.resources.withdrawal.PaginatedWithdrawals>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> await client.withdrawal.get_all()
+
+        """
+        response = await self._client.request_json(
+            "get", "v2/withdrawals", params={"page": page, "per_page": per_page}
+        )
+
+        return self._client.parse_resource(PaginatedWithdrawals, response)
+
+    def iter_all(self, *, per_page: Optional[int] = None) -> AsyncIterator[Withdrawal]:
+        """Iterates over withdrawals of every page. Next page is fetched in background while current one is consumed.
+
+        :param Optional[int] `per_page`: Number of withdrawals per page. Max: 100. Default: 100
+
+        :rtype AsyncIterator[:class:`<coingate.resources.withdrawal.Withdrawal>`]
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> async for withdrawal in client.withdrawal.iter_all():
+          ...     print(withdrawal.status)
+
+        """
+        return aiterate_pages(
+            lambda page: self.get_all(page=page, per_page=per_page),
+            lambda withdrawals: withdrawals.withdrawals,
+        )
+
+    async def fetch_all(
+        self, *, workers: int = 4, per_page: Optional[int] = None
+    ) -> BulkPages[Withdrawal]:
+        """Fetches withdrawals of every page. Once the first page is received, remaining pages are fetched concurrently.
+
+        :param int `workers`: Number of pages fetched at the same time. Default: 4
+        :param Optional[int] `per_page`: Number of withdrawals per page. Max: 100. Default: 100
+
+        :rtype `:class:`<coingate.pagination.BulkPages>`
+
+        Basic Usage::
+          >>> client = AsyncCoinGate('YOUR_API_KEY')
+          >>> await client.withdrawal.fetch_all()
+
+        """
+        return await afetch_pages_concurrently(
+            lambda page: self.get_all(page=page, per_page=per_page),
+            lambda withdrawals: withdrawals.withdrawals,
+            workers=workers,
+        )
@@ -0,0 +1,139 @@
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    TypeVar,
+    Union,
+)
+
+T = TypeVar("T")
+S = TypeVar("S")
+
+
+class DuplicateOrderIdError(ValueError):
+    """Raised for an order spec whose merchant `order_id` already appeared earlier in the same batch."""
+
+    def __init__(self, order_id: str, index: int) -> None:
+        super().__init__(
+            f"order_id {order_id!r} is already used by spec at index {index}"
+        )
+        self.order_id = order_id
+        self.index = index
+
+
+@dataclass
+class BulkResults(Generic[T]):
+    """Results of a batch, aligned to its inputs: every item is either the result or the exception raised for the input at the same index.
+
+    :param List `results`: Result or exception of every input, in input order
+
+    """
+
+    results: List[Union[T, Exception]]
+
+    def __len__(self) -> int:
+        return len(self.results)
+
+    def __getitem__(self, index: int) -> Union[T, Exception]:
+        return self.results[index]
+
+    @property
+    def succeeded(self) -> List[T]:
+        return [r for r in self.results if not isinstance(r, Exception)]
+
+    @property
+    def errors(self) -> Dict[int, Exception]:
+        """Exceptions by input index."""
+        return {i: r for i, r in enumerate(self.results) if isinstance(r, Exception)}
+
+    @property
+    def is_complete(self) -> bool:
+        return not any(isinstance(r, Exception) for r in self.results)
+
+
+def run_concurrently(
+    func: Callable[[S], T], items: Sequence[S], *, concurrency: int = 4
+) -> List[Union[T, Exception]]:
+    """Calls `func` for every item on `concurrency` threads. Exceptions are returned in place of results instead of being raised."""
+
+    def _call(item: S) -> Union[T, Exception]:
+        try:
+            return func(item)
+        except Exception as e:
+            return e
+
+    if not items:
+        return []
+
+    with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(items)))) as pool:
+        futures = [
+            pool.submit(contextvars.copy_context().run, _call, item) for item in items
+        ]
+        return [future.result() for future in futures]
+
+
+async def arun_concurrently(
+    func: Callable[[S], Awaitable[T]], items: Sequence[S], *, concurrency: int = 4
+) -> List[Union[T, Exception]]:
+    """Asynchronous version of :func:`run_concurrently`. At most `concurrency` calls are awaited at the same time."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _call(item: S) -> Union[T, Exception]:
+        async with semaphore:
+            try:
+                return await func(item)
+            except Exception as e:
+                return e
+
+    return list(await asyncio.gather(*(_call(item) for item in items)))
+
+
+def find_duplicate_order_ids(
+    specs: Sequence[Mapping[str, Any]]
+) -> Dict[int, DuplicateOrderIdError]:
+    """Finds specs repeating merchant `order_id` of an earlier spec. Specs without `order_id` are never duplicates."""
+    first_index: Dict[str, int] = {}
+    duplicates = {}
+    for index, spec in enumerate(specs):
+        order_id: Optional[str] = spec.get("order_id")
+        if not order_id:
+            continue
+        if order_id in first_index:
+            duplicates[index] = DuplicateOrderIdError(order_id, first_index[order_id])
+        else:
+            first_index[order_id] = index
+
+    return duplicates
+
+
+def pending_order_ids(
+    specs: Sequence[Mapping[str, Any]], results: Mapping[int, Any]
+) -> Set[str]:
+    """Merchant `order_id`s of specs without a result yet."""
+    return {
+        spec["order_id"]
+        for index, spec in enumerate(specs)
+        if index not in results and spec.get("order_id")
+    }
+
+
+def reuse_existing_orders(
+    specs: Sequence[Mapping[str, Any]],
+    results: Dict[int, Any],
+    existing: Mapping[str, Any],
+) -> None:
+    """Sets existing order as result of every spec without a result, whose `order_id` it has."""
+    for index, spec in enumerate(specs):
+        if index not in results and spec.get("order_id") in existing:
+            results[index] = existing[spec["order_id"]]
@@ -0,0 +1,345 @@
+import asyncio
+import hmac
+import json
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http import HTTPStatus
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+from urllib.parse import parse_qsl
+
+from .resources.callback import OrderCallback
+
+Handler = Callable[[OrderCallback], None]
+ErrorHandler = Callable[[OrderCallback, Exception], None]
+
+
+@dataclass(frozen=True)
+class CallbackResult:
+    """Outcome of processing a callback, answered to CoinGate as HTTP status."""
+
+    status: HTTPStatus
+    callback: Optional[OrderCallback] = None
+    duplicate: bool = False
+
+    @property
+    def accepted(self) -> bool:
+        return self.status == HTTPStatus.OK
+
+
+class _SeenSet:
+    """Thread-safe set of recently seen keys, limited by size (least recently added are evicted) and age."""
+
+    def __init__(self, max_size: int, ttl: float, clock: Callable[[], float]) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._clock = clock
+        self._keys: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key: Hashable) -> bool:
+        """Adds key, returns `False` when it was already seen within `ttl`."""
+        now = self._clock()
+        with self._lock:
+            # Keys are ordered by time added, so expired ones are at the front
+            while self._keys:
+                oldest, added_at = next(iter(self._keys.items()))
+                if now - added_at < self._ttl:
+                    break
+                del self._keys[oldest]
+
+            if key in self._keys:
+                return False
+
+            self._keys[key] = now
+            if len(self._keys) > self._max_size:
+                self._keys.popitem(last=False)
+            return True
+
+    def discard(self, key: Hashable) -> None:
+        with self._lock:
+            self._keys.pop(key, None)
+
+
+class CallbackProcessor:
+    """Receives payment callbacks sent to `callback_url` of orders.
+
+    Every callback is parsed into :class:`coingate.resources.callback.OrderCallback`,
+    its `token` is compared in constant time with the one returned by
+    `token_for` (the `token` passed to :meth:`coingate.services.order.OrderService.create`),
+    and repeated deliveries of the same order status are dropped. Accepted
+    callbacks are answered immediately and passed to handlers on a pool of
+    `workers` threads. When `max_pending` callbacks are waiting for handlers,
+    new ones are answered with `503`, so CoinGate delivers them again later
+    instead of blocking the HTTP server.
+
+    Handlers run after callback is acknowledged, so CoinGate does not deliver
+    it again when a handler fails: handling is at most once. When a handler
+    raises, error handlers are called and the callback is kept in
+    :attr:`failed` (the latest `max_failed` of them) until
+    :meth:`retry_failed` handles it again. It is also forgotten by
+    deduplication, so a delivery resent from CoinGate is processed again.
+
+    Framework independent: call :meth:`process` with request body, or mount
+    :meth:`wsgi_app` or :meth:`asgi_app` directly. :meth:`asgi_app` verifies
+    callbacks in the default executor of the event loop, so a blocking
+    `token_for` does not stall it.
+
+    :param Callable[[OrderCallback], Optional[str]] `token_for`: Returns expected token of the order, `None` for unknown orders
+    :param int `workers`: Number of handler threads. Default: 4
+    :param int `max_pending`: Number of callbacks queued for handlers before answering `503`. Default: 1024
+    :param int `dedupe_size`: Number of recently seen deliveries remembered. Default: 100000
+    :param float `dedupe_ttl`: Number of seconds a delivery is remembered. Default: 86400
+    :param int `max_body_size`: Default: 64 KiB
+    :param int `max_failed`: Number of callbacks with failed handlers kept for :meth:`retry_failed`. Default: 1000
+
+    Basic Usage::
+      >>> processor = CallbackProcessor(lambda callback: tokens.get(callback.order_id))
+      >>> @processor.handler
+      ... def on_callback(callback):
+      ...     if callback.status == "paid":
+      ...         mark_paid(callback.order_id)
+      >>> app = processor.wsgi_app  # or processor.asgi_app
+
+    """
+
+    def __init__(
+        self,
+        token_for: Callable[[OrderCallback], Optional[str]],
+        *,
+        workers: int = 4,
+        max_pending: int = 1024,
+        dedupe_size: int = 100_000,
+        dedupe_ttl: float = 86400,
+        max_body_size: int = 64 * 1024,
+        max_failed: int = 1000,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._token_for = token_for
+        self._max_body_size = max_body_size
+        self._handlers: List[Handler] = []
+        self._error_handlers: List[ErrorHandler] = []
+
+        self._seen = _SeenSet(dedupe_size, dedupe_ttl, clock)
+        self._failed: Deque[OrderCallback] = deque(maxlen=max_failed)
+        self._failed_lock = threading.Lock()
+        self._pending = threading.BoundedSemaphore(max_pending)
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="coingate-callback"
+        )
+
+        self._counts_lock = threading.Lock()
+        self.counts: Dict[HTTPStatus, int] = {}
+        self.duplicates = 0
+        self.last_error: Optional[Exception] = None
+
+    def handler(self, func: Handler) -> Handler:
+        """Registers callback handler, can be used as decorator."""
+        self._handlers.append(func)
+        return func
+
+    def error_handler(self, func: ErrorHandler) -> ErrorHandler:
+        """Registers handler of exceptions raised by callback handlers, can be used as decorator."""
+        self._error_handlers.append(func)
+        return func
+
+    @property
+    def failed(self) -> List[OrderCallback]:
+        """Acknowledged callbacks whose handlers raised, oldest first."""
+        with self._failed_lock:
+            return list(self._failed)
+
+    def retry_failed(self) -> int:
+        """Passes every failed callback to handlers again in the calling thread, returns number handled without error.
+
+        Callbacks failing again are kept for the next retry.
+
+        """
+        with self._failed_lock:
+            callbacks = list(self._failed)
+            self._failed.clear()
+
+        return sum(self._handle(callback) for callback in callbacks)
+
+    def process(
+        self, body: Union[bytes, str], content_type: Optional[str] = None
+    ) -> CallbackResult:
+        """Verifies callback and queues it for handlers. Never waits for handlers."""
+        result = self._process(body, content_type)
+        with self._counts_lock:
+            self.counts[result.status] = self.counts.get(result.status, 0) + 1
+            self.duplicates += result.duplicate
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
+
+    def wsgi_app(
+        self, environ: Dict[str, Any], start_response: Callable[..., Any]
+    ) -> Iterable[bytes]:
+        if environ.get("REQUEST_METHOD") != "POST":
+            status = HTTPStatus.METHOD_NOT_ALLOWED
+        else:
+            try:
+                length = int(environ.get("CONTENT_LENGTH") or 0)
+            except ValueError:
+                length = 0
+
+            if length > self._max_body_size:
+                status = HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+            else:
+                body = environ["wsgi.input"].read(length)
+                status = self.process(body, environ.get("CONTENT_TYPE")).status
+
+        start_response(
+            f"{status.value} {status.phrase}", [("Content-Type", "text/plain")]
+        )
+        return [status.phrase.encode()]
+
+    async def asgi_app(
+        self,
+        scope: Dict[str, Any],
+        receive: Callable[[], Any],
+        send: Callable[[Dict[str, Any]], Any],
+    ) -> None:
+        if scope["type"] == "lifespan":
+            await self._asgi_lifespan(receive, send)
+            return
+
+        status = HTTPStatus.METHOD_NOT_ALLOWED
+        if scope.get("method") == "POST":
+            body = await self._asgi_body(receive)
+            if body is None:
+                status = HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+            else:
+                headers = dict(scope.get("headers") or [])
+                content_type = headers.get(b"content-type", b"").decode("latin-1")
+                # `token_for` may block (e.g. database lookup), keep it off the event loop
+                result = await asyncio.get_running_loop().run_in_executor(
+                    None, self.process, body, content_type or None
+                )
+                status = result.status
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status.value,
+                "headers": [(b"content-type", b"text/plain")],
+            }
+        )
+        await send({"type": "http.response.body", "body": status.phrase.encode()})
+
+    def _process(
+        self, body: Union[bytes, str], content_type: Optional[str]
+    ) -> CallbackResult:
+        if len(body) > self._max_body_size:
+            return CallbackResult(HTTPStatus.REQUEST_ENTITY_TOO_LARGE)
+
+        try:
+            callback = OrderCallback(**self._decode(body, content_type))
+        except (ValueError, TypeError):
+            # pydantic.ValidationError and JSON errors are ValueErrors
+            return CallbackResult(HTTPStatus.BAD_REQUEST)
+
+        expected = self._token_for(callback)
+        if (
+            expected is None
+            or callback.token is None
+            or not hmac.compare_digest(expected.encode(), callback.token.encode())
+        ):
+            return CallbackResult(HTTPStatus.FORBIDDEN, callback)
+
+        key = (callback.id, callback.status)
+        if not self._seen.add(key):
+            return CallbackResult(HTTPStatus.OK, callback, duplicate=True)
+
+        if not self._pending.acquire(blocking=False):
+            self._seen.discard(key)
+            return CallbackResult(HTTPStatus.SERVICE_UNAVAILABLE, callback)
+
+        try:
+            self._executor.submit(self._dispatch, key, callback)
+        except RuntimeError:
+            # Executor is shut down
+            self._pending.release()
+            self._seen.discard(key)
+            return CallbackResult(HTTPStatus.SERVICE_UNAVAILABLE, callback)
+
+        return CallbackResult(HTTPStatus.OK, callback)
+
+    @staticmethod
+    def _decode(body: Union[bytes, str], content_type: Optional[str]) -> Dict[str, Any]:
+        text = body.decode("utf-8") if isinstance(body, bytes) else body
+        if content_type is not None and content_type.startswith("application/json"):
+            data = json.loads(text)
+            if not isinstance(data, dict):
+                raise ValueError("Callback body must be a JSON object")
+            return data
+
+        return dict(parse_qsl(text, keep_blank_values=True, strict_parsing=True))
+
+    def _dispatch(self, key: Tuple[int, str], callback: OrderCallback) -> None:
+        try:
+            if not self._handle(callback):
+                self._seen.discard(key)
+        finally:
+            self._pending.release()
+
+    def _handle(self, callback: OrderCallback) -> bool:
+        try:
+            for handler in self._handlers:
+                handler(callback)
+        except Exception as e:
+            self.last_error = e
+            with self._failed_lock:
+                self._failed.append(callback)
+            for error_handler in self._error_handlers:
+                error_handler(callback, e)
+            return False
+
+        return True
+
+    async def _asgi_body(self, receive: Callable[[], Any]) -> Optional[bytes]:
+        chunks = []
+        size = 0
+        while True:
+            message = await receive()
+            if message["type"] == "http.disconnect":
+                break
+            chunk = message.get("body", b"")
+            size += len(chunk)
+            if size > self._max_body_size:
+                return None
+            chunks.append(chunk)
+            if not message.get("more_body", False):
+                break
+
+        return b"".join(chunks)
+
+    async def _asgi_lifespan(
+        self, receive: Callable[[], Any], send: Callable[[Dict[str, Any]], Any]
+    ) -> None:
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                self.shutdown(wait=False)
+                await send({"type": "lifespan.shutdown.complete"})
+                return
@@ -0,0 +1,350 @@
+import base64
+import gzip
+import io
+import json
+import random
+import re
+import threading
+import time
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass, field
+from http import HTTPStatus
+from typing import IO, Deque, Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+
+from .transport import RequestsTransport, Transport, TransportRequest, build_response
+
+CASSETTE_VERSION = 1
+
+# Replaced with `REDACTED` in request and response bodies: order tokens and
+# emails of purchasers and refund recipients
+REDACTED_FIELDS = frozenset({"token", "purchaser_email", "email"})
+_REDACTED = "REDACTED"
+_REDACTED_JSON_FIELD = re.compile(
+    r'("(?:%s)"\s*:\s*)"(?:[^"\\]|\\.)*"' % "|".join(sorted(REDACTED_FIELDS))
+)
+
+# Not recorded: they differ per request, carry session state, or describe the
+# encoded body while the decoded body is recorded
+_SKIPPED_RESPONSE_HEADERS = frozenset(
+    {
+        "set-cookie",
+        "date",
+        "connection",
+        "content-encoding",
+        "content-length",
+        "transfer-encoding",
+    }
+)
+
+
+class CassetteMissError(LookupError):
+    """Raised by :class:`ReplayTransport` for a request that is not in the cassette."""
+
+    def __init__(self, request: TransportRequest) -> None:
+        super().__init__(f"No recorded response for {request.method} {request.url}")
+        self.request = request
+
+
+@dataclass
+class Interaction:
+    """One recorded request and its response.
+
+    Request headers are not recorded, so API keys never end up in a cassette,
+    and string values of :data:`REDACTED_FIELDS` (order tokens and emails) in
+    request and JSON response bodies are replaced with `REDACTED`. Bodies are
+    stored as text, or base64 when they are not UTF-8.
+
+    :param str `method`
+    :param str `path`: Path and query string of the request, without host
+    :param Optional[str] `body`: Form body of the request
+    :param int `status_code`
+    :param Dict[str, str] `headers`: Response headers
+    :param str `content`: Response body
+    :param float `elapsed`: Seconds until the response was received when recorded
+    :param bool `binary`: `content` is base64 encoded
+
+    """
+
+    method: str
+    path: str
+    body: Optional[str]
+    status_code: int
+    headers: Dict[str, str]
+    content: str
+    elapsed: float
+    binary: bool = False
+
+    @property
+    def key(self) -> Tuple[str, str, Optional[str]]:
+        return self.method, self.path, self.body
+
+    @property
+    def raw_content(self) -> bytes:
+        return base64.b64decode(self.content) if self.binary else self.content.encode()
+
+
+def _request_key(request: TransportRequest) -> Tuple[str, str, Optional[str]]:
+    url = urlsplit(request.url)
+    path = f"{url.path}?{url.query}" if url.query else url.path
+    body = request.body.decode() if request.body is not None else None
+    # Replayed requests are redacted the same way, so they match the recording
+    return request.method, path, _redact_form(body) if body else body
+
+
+def _redact_form(body: str) -> str:
+    fields = parse_qsl(body, keep_blank_values=True)
+    if not any(name in REDACTED_FIELDS for name, _ in fields):
+        return body
+
+    return urlencode(
+        [
+            (name, _REDACTED if name in REDACTED_FIELDS and value else value)
+            for name, value in fields
+        ]
+    )
+
+
+def _redact_json(text: str) -> str:
+    return _REDACTED_JSON_FIELD.sub(rf'\1"{_REDACTED}"', text)
+
+
+@dataclass
+class Cassette:
+    """Recorded API exchanges, saved as JSON lines, gzip compressed when the file name ends with `.gz`.
+
+    Basic Usage::
+      >>> cassette = Cassette.load("orders.jsonl.gz")
+      >>> len(cassette), cassette.interactions[0].path
+      (120, '/v2/orders/1')
+
+    """
+
+    interactions: List[Interaction] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.interactions)
+
+    def save(self, path: str) -> None:
+        with self._open(path, "wt") as f:
+            f.write(json.dumps({"version": CASSETTE_VERSION}) + "\n")
+            for interaction in self.interactions:
+                f.write(json.dumps(asdict(interaction), separators=(",", ":")) + "\n")
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        with cls._open(path, "rt") as f:
+            header = json.loads(f.readline())
+            if header.get("version") != CASSETTE_VERSION:
+                raise ValueError(
+                    f"Unsupported cassette version {header.get('version')!r} in {path}"
+                )
+            return cls([Interaction(**json.loads(line)) for line in f if line.strip()])
+
+    @staticmethod
+    def _open(path: str, mode: str) -> IO[str]:
+        if path.endswith(".gz"):
+            return gzip.open(path, mode, encoding="utf-8")  # type: ignore[return-value]
+        return open(path, mode[0], encoding="utf-8")
+
+
+class RecordingTransport(Transport):
+    """Sends requests through `transport` and records every exchange into `cassette`.
+
+    Streamed responses are read whole before they are returned, so they can
+    be recorded.
+
+    :param Optional[Transport] `transport`: Default: :class:`coingate.transport.RequestsTransport`
+    :param Optional[Cassette] `cassette`: Default: new empty cassette
+
+    Basic Usage::
+      >>> recorder = RecordingTransport()
+      >>> client = CoinGate("YOUR_API_KEY", True, transport=recorder)
+      >>> client.order.fetch_all()
+      >>> recorder.cassette.save("orders.jsonl.gz")
+
+    """
+
+    def __init__(
+        self,
+        transport: Optional[Transport] = None,
+        *,
+        cassette: Optional[Cassette] = None,
+    ) -> None:
+        self._transport = transport or RequestsTransport()
+        self._lock = threading.Lock()
+        self.cassette = cassette if cassette is not None else Cassette()
+
+    def send(self, request: TransportRequest) -> requests.Response:
+        started = time.perf_counter()
+        response = self._transport.send(request)
+        content = response.content
+        elapsed = time.perf_counter() - started
+
+        try:
+            text, binary = _redact_json(content.decode()), False
+        except UnicodeDecodeError:
+            text, binary = base64.b64encode(content).decode(), True
+
+        method, path, body = _request_key(request)
+        interaction = Interaction(
+            method=method,
+            path=path,
+            body=body,
+            status_code=response.status_code,
+            headers={
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _SKIPPED_RESPONSE_HEADERS
+            },
+            content=text,
+            elapsed=elapsed,
+            binary=binary,
+        )
+        with self._lock:
+            self.cassette.interactions.append(interaction)
+
+        if not request.stream:
+            return response
+
+        return build_response(
+            request,
+            response.status_code,
+            response.headers,
+            raw=io.BytesIO(content),
+            reason=response.reason,
+        )
+
+    def close(self) -> None:
+        self._transport.close()
+
+
+class ReplayTransport(Transport):
+    """Answers requests with responses recorded in `cassette`, without network.
+
+    A request gets the recorded responses of the same method, path, query and
+    body in recorded order, so e.g. a `200` followed by a `304` replays the
+    same way for a response cache. Once they are used up, they are replayed
+    from the start again, or :class:`CassetteMissError` is raised when
+    `repeat` is disabled.
+
+    Responses are returned as fast as possible by default. `time_scale`
+    delays every response by its recorded time multiplied by the scale (1
+    replays real timing), `latency` adds a fixed delay. With `error_rate`, that
+    share of requests fails with `requests.ConnectionError`, or with an
+    `error_status` response when it is set, to exercise retries.
+
+    :param Cassette `cassette`
+    :param float `time_scale`: Multiplier of recorded response times. Default: 0
+    :param float `latency`: Seconds added to every response. Default: 0
+    :param float `error_rate`: Share of requests failed on purpose, from 0 to 1. Default: 0
+    :param Optional[int] `error_status`: Status of failed requests instead of a connection error, e.g. 500
+    :param bool `repeat`: Replay responses again once all were used. Default: True
+    :param Optional[int] `seed`: Seed of injected errors, for reproducible runs
+
+    Basic Usage::
+      >>> replay = ReplayTransport(Cassette.load("orders.jsonl.gz"), error_rate=0.05, error_status=500)
+      >>> client = CoinGate("api_key", transport=replay)
+      >>> client.set_retry_policy(RetryPolicy())
+      >>> client.order.fetch_all()
+
+    """
+
+    def __init__(
+        self,
+        cassette: Cassette,
+        *,
+        time_scale: float = 0.0,
+        latency: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: Optional[int] = None,
+        repeat: bool = True,
+        seed: Optional[int] = None,
+    ) -> None:
+        self._time_scale = time_scale
+        self._latency = latency
+        self._error_rate = error_rate
+        self._error_status = error_status
+        self._repeat = repeat
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self._recorded: Dict[
+            Tuple[str, str, Optional[str]], List[Interaction]
+        ] = defaultdict(list)
+        for interaction in cassette.interactions:
+            self._recorded[interaction.key].append(interaction)
+        self._queues: Dict[Tuple[str, str, Optional[str]], Deque[Interaction]] = {
+            key: deque(interactions) for key, interactions in self._recorded.items()
+        }
+
+        self.replayed = 0
+        self.injected_errors = 0
+
+    def send(self, request: TransportRequest) -> requests.Response:
+        key = _request_key(request)
+        if key not in self._recorded:
+            raise CassetteMissError(request)
+
+        with self._lock:
+            # A failed request keeps its response, so a retry replays it
+            if self._error_rate > 0 and self._random.random() < self._error_rate:
+                self.injected_errors += 1
+                interaction = None
+            else:
+                self.replayed += 1
+                interaction = self._next(key, request)
+
+        if interaction is None:
+            return self._inject_error(request)
+
+        delay = self._latency + interaction.elapsed * self._time_scale
+        if delay > 0:
+            time.sleep(delay)
+
+        content = interaction.raw_content
+        return build_response(
+            request,
+            interaction.status_code,
+            interaction.headers,
+            content=None if request.stream else content,
+            raw=io.BytesIO(content),
+        )
+
+    def _inject_error(self, request: TransportRequest) -> requests.Response:
+        if self._latency > 0:
+            time.sleep(self._latency)
+
+        status_code = self._error_status
+        if status_code is None:
+            raise requests.ConnectionError(
+                f"Injected connection error for {request.method} {request.url}"
+            )
+
+        try:
+            phrase = HTTPStatus(status_code).phrase
+        except ValueError:
+            # Non-standard status, e.g. 520
+            phrase = "Unknown Error"
+
+        return build_response(
+            request,
+            status_code,
+            {"Content-Type": "application/json"},
+            # Reason named after the status, e.g. `InternalServerError` for 500,
+            # is raised as the matching exception of the client
+            content=json.dumps({"reason": phrase.replace(" ", "")}).encode(),
+        )
+
+    def _next(
+        self, key: Tuple[str, str, Optional[str]], request: TransportRequest
+    ) -> Interaction:
+        queue = self._queues[key]
+        if not queue:
+            if not self._repeat:
+                raise CassetteMissError(request)
+            queue.extend(self._recorded[key])
+
+        return queue.popleft()
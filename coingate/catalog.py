@@ -0,0 +1,162 @@
+import threading
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple, Union
+
+from .resources.public import CurrencyPlatform, PublicCurrency, PublicPlatform
+
+if TYPE_CHECKING:
+    from .client import CoinGate
+
+
+class _CatalogIndex:
+    def __init__(
+        self, currencies: List[PublicCurrency], platforms: List[PublicPlatform]
+    ) -> None:
+        self.currencies = currencies
+        self.platforms = platforms
+
+        self.currencies_by_symbol = {c.symbol.upper(): c for c in currencies}
+        self.currencies_by_id = {c.id: c for c in currencies}
+        self.platforms_by_id = {p.id: p for p in platforms}
+        self.platforms_by_id_name = {p.id_name: p for p in platforms}
+
+        self.pairs: Dict[Tuple[str, str], CurrencyPlatform] = {}
+        for currency in currencies:
+            for platform in currency.platforms or []:
+                self.pairs[(currency.symbol.upper(), platform.id_name)] = platform
+
+
+class CurrencyCatalog:
+    """Currencies and platforms of CoinGate indexed for constant time lookups.
+
+    Both `v2/currencies` and `v2/platforms` are loaded on first use and then
+    refreshed every `refresh_interval` seconds by a background thread, once
+    :meth:`start` is called. Lookups always read a complete snapshot, so they
+    are safe while refresh is running.
+
+    :param CoinGate `client`
+    :param float `refresh_interval`: Number of seconds between refreshes. Default: 3600
+
+    Basic Usage::
+      >>> catalog = CurrencyCatalog(CoinGate())
+      >>> catalog.currency_id("BTC"), catalog.platform_id("bitcoin")
+      (1, 8)
+      >>> catalog.can_pay("USDT", "ethereum")
+      True
+
+    """
+
+    def __init__(self, client: "CoinGate", *, refresh_interval: float = 3600) -> None:
+        self._client = client
+        self._refresh_interval = refresh_interval
+        self._index: Optional[_CatalogIndex] = None
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.last_error: Optional[Exception] = None
+
+    def __enter__(self) -> "CurrencyCatalog":
+        self.start()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.stop()
+
+    def refresh(self) -> None:
+        """Loads currencies and platforms from API and swaps indexes."""
+        currencies = self._client.public.get_currencies()
+        platforms = self._client.public.get_platforms()
+        self._index = _CatalogIndex(currencies, platforms)
+
+    def start(self) -> None:
+        """Loads catalog, if needed, and starts refreshing it every `refresh_interval` seconds."""
+        self._get_index()
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._refresh_periodically, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def currencies(self) -> List[PublicCurrency]:
+        return self._get_index().currencies
+
+    @property
+    def platforms(self) -> List[PublicPlatform]:
+        return self._get_index().platforms
+
+    def currency(self, symbol_or_id: Union[str, int]) -> Optional[PublicCurrency]:
+        index = self._get_index()
+        if isinstance(symbol_or_id, int):
+            return index.currencies_by_id.get(symbol_or_id)
+
+        return index.currencies_by_symbol.get(symbol_or_id.upper())
+
+    def platform(self, id_or_id_name: Union[str, int]) -> Optional[PublicPlatform]:
+        index = self._get_index()
+        if isinstance(id_or_id_name, int):
+            return index.platforms_by_id.get(id_or_id_name)
+
+        return index.platforms_by_id_name.get(id_or_id_name)
+
+    def currency_id(self, symbol: str) -> Optional[int]:
+        currency = self.currency(symbol)
+        return currency.id if currency is not None else None
+
+    def platform_id(self, id_name: str) -> Optional[int]:
+        platform = self.platform(id_name)
+        return platform.id if platform is not None else None
+
+    def pair(self, symbol: str, platform: str) -> Optional[CurrencyPlatform]:
+        """Returns platform of the currency, e.g. `pair("USDT", "ethereum")`."""
+        return self._get_index().pairs.get((symbol.upper(), platform))
+
+    def can_pay(self, symbol: str, platform: Optional[str] = None) -> bool:
+        """Whether shopper can pay in the currency, optionally on the given platform."""
+        return self._is_available(symbol, platform, lambda merchant: merchant.pay)
+
+    def can_receive(self, symbol: str, platform: Optional[str] = None) -> bool:
+        """Whether merchant can receive settlements in the currency, optionally on the given platform."""
+        return self._is_available(symbol, platform, lambda merchant: merchant.receive)
+
+    def _is_available(self, symbol: str, platform: Optional[str], flag) -> bool:
+        currency = self.currency(symbol)
+        if currency is None or currency.disabled or currency.merchant is None:
+            return False
+
+        if not flag(currency.merchant):
+            return False
+
+        if platform is None:
+            return True
+
+        pair = self.pair(symbol, platform)
+        return pair is not None and pair.enabled
+
+    def _get_index(self) -> _CatalogIndex:
+        index = self._index
+        if index is not None:
+            return index
+
+        with self._lock:
+            if self._index is None:
+                self.refresh()
+
+        assert self._index is not None
+        return self._index
+
+    def _refresh_periodically(self) -> None:
+        while not self._stopped.wait(self._refresh_interval):
+            try:
+                self.refresh()
+                self.last_error = None
+            except Exception as e:
+                # Keep previous snapshot, try again on next tick
+                self.last_error = e
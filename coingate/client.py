@@ -1,8 +1,23 @@
 import posixpath
-from ast import With
-from typing import Any, Dict, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
 
+from .http_cache import CachedResponse, ResponseCache
 from .http_client import HTTPClient
+from .json_codec import JSONCodec
+from .metrics import MetricsRegistry
+from .parsing import M, parse_resource
+from .rate_limit import RateLimiter
+from .retry import RetryPolicy
 from .services import (
     LedgerService,
     OrderService,
@@ -10,6 +25,15 @@ from .services import (
     RefundService,
     WithdrawalService,
 )
+from .single_flight import SingleFlight
+from .streaming import JSONItemStream
+from .transport import PoolLimits, Transport
+
+
+if TYPE_CHECKING:
+    from .tracing import Tracing
+
+S = TypeVar("S")
 
 
 class CoinGate:
@@ -17,16 +41,23 @@ class CoinGate:
     BASE_SANDBOX_API_URL = "https://api-sandbox.coingate.com"
 
     def __init__(
-        self, api_key: Optional[str] = None, use_sanbox_mode: bool = False
+        self,
+        api_key: Optional[str] = None,
+        use_sanbox_mode: bool = False,
+        *,
+        pool_limits: Optional[PoolLimits] = None,
+        transport: Optional[Transport] = None,
     ) -> None:
-        self._http_client = HTTPClient(api_key)
+        self._http_client = HTTPClient(
+            api_key, pool_limits=pool_limits, transport=transport
+        )
         self._use_sandbox_mode = use_sanbox_mode
+        self._validate_resources = True
+        self._json_codec = JSONCodec()
+        self._single_flight: Optional[SingleFlight] = None
+        self._metrics: Optional[MetricsRegistry] = None
 
-        self._order = OrderService(self)
-        self._refund = RefundService(self)
-        self._public = PublicService(self)
-        self._ledger = LedgerService(self)
-        self._withdrawal = WithdrawalService(self)
+        self._set_services(None)
 
     @property
     def order(self) -> OrderService:
@@ -61,6 +92,63 @@ class CoinGate:
     def set_app_info(self, name: str, *, version: str):
         self._http_client.update_user_agent(name=name, version=version)
 
+    def set_rate_limiter(self, rate_limiter: Optional[RateLimiter]):
+        self._http_client.rate_limiter = rate_limiter
+
+    def set_resource_validation(self, enabled: bool):
+        """Disabling validation builds resources without pydantic validation, which is several times faster for large list responses.
+        Use it only with responses of the real CoinGate API."""
+        self._validate_resources = enabled
+
+    def set_json_codec(self, json_codec: JSONCodec):
+        """Sets codec used to decode response bodies. Default: :class:`coingate.json_codec.JSONCodec`"""
+        self._json_codec = json_codec
+
+    def set_retry_policy(self, retry_policy: Optional[RetryPolicy]):
+        self._http_client.retry_policy = retry_policy
+
+    def set_response_cache(self, response_cache: Optional[ResponseCache]):
+        self._http_client.response_cache = response_cache
+
+    def set_single_flight(self, single_flight: Optional[SingleFlight]):
+        """Makes identical concurrent `GET` requests share one API call and its parsed body."""
+        self._single_flight = single_flight
+
+    def add_hook(self, event: str, hook: Callable[..., Any]) -> Callable[..., Any]:
+        """Registers `hook` for a request lifecycle event, see :class:`coingate.hooks.RequestHooks`."""
+        return self._http_client.hooks.add(event, hook)
+
+    def remove_hook(self, event: str, hook: Callable[..., Any]):
+        self._http_client.hooks.remove(event, hook)
+
+    def set_tracing(self, tracing: Optional["Tracing"]):
+        """Records OpenTelemetry spans of service calls and API requests, see :class:`coingate.tracing.Tracing`."""
+        self._http_client.tracing = tracing
+        self._set_services(tracing)
+
+    def _set_services(self, tracing: Optional["Tracing"]) -> None:
+        def _create(service_class: Callable[["CoinGate"], S]) -> S:
+            service = service_class(self)
+            if tracing is None:
+                return service
+            return cast(S, tracing.trace_service(service))
+
+        self._order = _create(OrderService)
+        self._refund = _create(RefundService)
+        self._public = _create(PublicService)
+        self._ledger = _create(LedgerService)
+        self._withdrawal = _create(WithdrawalService)
+
+    def set_metrics(self, metrics: Optional[MetricsRegistry]):
+        """Records request metrics in `metrics`, replacing the previously set registry."""
+        if self._metrics is not None:
+            for event, hook in self._metrics.hooks().items():
+                self.remove_hook(event, hook)
+        self._metrics = metrics
+        if metrics is not None:
+            for event, hook in metrics.hooks().items():
+                self.add_hook(event, hook)
+
     def request(
         self,
         method: Union[str, bytes],
@@ -68,9 +156,86 @@ class CoinGate:
         *,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
     ):
         url = self._build_path_to_endpoint(endpoint)
-        return self._http_client.request(method, url, data=data, params=params)
+        single_flight = self._single_flight
+        if stream or single_flight is None or not single_flight.is_coalescable(method):
+            return self._http_client.request(
+                method, url, data=data, params=params, stream=stream
+            )
+
+        return single_flight.call(
+            single_flight.key(method, url, params, data, self._authorization()),
+            lambda: self._http_client.request(method, url, data=data, params=params),
+        )
+
+    def request_json(
+        self,
+        method: Union[str, bytes],
+        endpoint: str,
+        *,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Any:
+        single_flight = self._single_flight
+        if single_flight is None or not single_flight.is_coalescable(method):
+            return self._request_json(method, endpoint, data=data, params=params)
+
+        # Callers of `request` get the response, these get its parsed body
+        key = single_flight.json_key(
+            method,
+            self._build_path_to_endpoint(endpoint),
+            params,
+            data,
+            self._authorization(),
+        )
+        return single_flight.call(
+            key,
+            lambda: self._request_json(method, endpoint, data=data, params=params),
+        )
+
+    def _request_json(
+        self,
+        method: Union[str, bytes],
+        endpoint: str,
+        *,
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+    ) -> Any:
+        url = self._build_path_to_endpoint(endpoint)
+        response = self._http_client.request(method, url, data=data, params=params)
+        if isinstance(response, CachedResponse):
+            return response.decode(self._json_codec)
+
+        return self._json_codec.loads(response.content)
+
+    def stream_resources(
+        self,
+        model: Type[M],
+        key: str,
+        method: Union[str, bytes],
+        endpoint: str,
+        *,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> JSONItemStream[M]:
+        """Requests list endpoint and builds resources of the array under `key` one at a time while body is received."""
+        response = self.request(method, endpoint, data=data, params=params, stream=True)
+        return JSONItemStream(
+            response,
+            key,
+            lambda item: self.parse_resource(model, item),
+            loads=self._json_codec.loads,
+        )
+
+    def parse_resource(self, model: Type[M], data: Dict[str, Any]) -> M:
+        return parse_resource(model, data, validate=self._validate_resources)
+
+    def _authorization(self) -> Optional[str]:
+        # Part of coalescing keys, so clients with different API keys sharing
+        # one SingleFlight never get each other's responses
+        return self._http_client.default_headers.get("Authorization")
 
     def _base_api_url(self):
         return self.BASE_SANDBOX_API_URL if self.is_sandbox_mode else self.BASE_API_URL
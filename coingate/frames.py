@@ -0,0 +1,311 @@
+import sys
+from array import array
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Union,
+)
+
+from .resources.order import Order, PaginatedOrders
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_INT64_MIN, _INT64_MAX = -(2**63), 2**63 - 1
+_MAX_CATEGORIES = 2**16
+_MICROSECOND = timedelta(microseconds=1)
+
+_INTEGERS = ("id", "orderable_id")
+_BOOLEANS = ("do_not_convert", "lightning_network", "is_refundable")
+_CATEGORIES = ("status", "price_currency", "receive_currency", "orderable_type")
+_AMOUNTS = ("price_amount", "underpaid_amount", "overpaid_amount")
+_DATETIMES = ("created_at",)
+_STRINGS = ("receive_amount", "order_id", "payment_url", "payment_address")
+
+
+class OrderFrame:
+    """Columnar container of orders, much smaller than a list of :class:`Order` resources.
+
+    Every field is kept in its own column:
+
+    - `id` and `orderable_id` as 64-bit integer arrays
+    - `status`, `price_currency`, `receive_currency` and `orderable_type` as
+      16-bit codes into a table of at most 65536 interned strings
+    - `price_amount`, `underpaid_amount` and `overpaid_amount` as 64-bit
+      integers scaled by `10 ** scale`
+    - `created_at` as microseconds since epoch, timezone is normalized to UTC
+    - remaining strings as plain lists
+
+    Orders are materialized back to :class:`Order` only when accessed.
+
+    :param int `scale`: Number of decimal places kept for amounts. Default: 8
+
+    Basic Usage::
+      >>> frame = OrderFrame.from_orders(client.order.iter_all())
+      >>> paid = frame.filter(status="paid")
+      >>> {currency: group.sum("price_amount") for currency, group in paid.group_by("price_currency").items()}
+      {'EUR': Decimal('129.99000000'), 'USD': Decimal('80.00000000')}
+      >>> paid[0]
+      Order(id=1, status='paid', ...)
+
+    """
+
+    def __init__(self, *, scale: int = 8) -> None:
+        self._scale = scale
+        self._columns: Dict[str, Any] = {}
+        for name in _INTEGERS + _AMOUNTS + _DATETIMES:
+            self._columns[name] = array("q")
+        for name in _BOOLEANS:
+            self._columns[name] = array("b")
+        for name in _CATEGORIES:
+            self._columns[name] = array("H")
+        for name in _STRINGS:
+            self._columns[name] = []
+
+        self._categories: Dict[str, List[str]] = {name: [] for name in _CATEGORIES}
+        self._codes: Dict[str, Dict[str, int]] = {name: {} for name in _CATEGORIES}
+
+    @classmethod
+    def from_orders(cls, orders: Iterable[Order], *, scale: int = 8) -> "OrderFrame":
+        frame = cls(scale=scale)
+        frame.extend(orders)
+        return frame
+
+    @classmethod
+    def from_pages(
+        cls, pages: Iterable[PaginatedOrders], *, scale: int = 8
+    ) -> "OrderFrame":
+        frame = cls(scale=scale)
+        for page in pages:
+            frame.extend(page.orders)
+        return frame
+
+    @property
+    def scale(self) -> int:
+        return self._scale
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory used by columns, not counting shared strings."""
+        return sum(sys.getsizeof(column) for column in self._columns.values())
+
+    def __len__(self) -> int:
+        return len(self._columns["id"])
+
+    def __iter__(self) -> Iterator[Order]:
+        for index in range(len(self)):
+            yield self._row(index)
+
+    def __getitem__(self, index: int) -> Order:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("OrderFrame index out of range")
+
+        return self._row(index)
+
+    def append(self, order: Order) -> None:
+        # Encode every value first, so invalid order leaves columns aligned
+        values = {name: getattr(order, name) for name in self._columns}
+        for name in _INTEGERS:
+            _check_int64(name, values[name])
+        for name in _AMOUNTS:
+            values[name] = self._encode_amount(name, values[name])
+        for name in _DATETIMES:
+            values[name] = _encode_datetime(values[name])
+        for name in _CATEGORIES:
+            self._check_category(name, values[name])
+        for name in _CATEGORIES:
+            values[name] = self._encode_category(name, values[name])
+
+        for name, column in self._columns.items():
+            column.append(values[name])
+
+    def extend(self, orders: Iterable[Order]) -> None:
+        for order in orders:
+            self.append(order)
+
+    def column(self, name: str) -> List[Any]:
+        """Decoded values of the column, e.g. `Decimal` amounts for `price_amount`."""
+        column = self._get_column(name)
+        if name in _BOOLEANS:
+            return [bool(value) for value in column]
+        if name in _CATEGORIES:
+            categories = self._categories[name]
+            return [categories[code] for code in column]
+        if name in _AMOUNTS:
+            return [self._decode_amount(value) for value in column]
+        if name in _DATETIMES:
+            return [_decode_datetime(value) for value in column]
+
+        return list(column)
+
+    def categories(self, name: str) -> List[str]:
+        """Distinct values of `status`, `price_currency`, `receive_currency` or `orderable_type`."""
+        self._require_category(name)
+        return list(self._categories[name])
+
+    def sum(self, name: str) -> Decimal:
+        """Exact sum of an amount column."""
+        if name not in _AMOUNTS:
+            raise ValueError(f"{name} is not an amount column")
+
+        return self._decode_amount(sum(self._columns[name]))
+
+    def filter(self, **conditions: Union[Any, Callable[[Any], bool]]) -> "OrderFrame":
+        """Returns frame of orders matching every condition.
+
+        Condition is either a value the column must be equal to, or a callable
+        which receives decoded value of the column. Equality on category
+        columns compares codes and never decodes strings.
+
+          >>> frame.filter(status="paid", price_amount=lambda amount: amount > 100)
+
+        """
+        indexes: Sequence[int] = range(len(self))
+        for name, condition in conditions.items():
+            column = self._get_column(name)
+            if callable(condition):
+                values = self.column(name)
+                indexes = [i for i in indexes if condition(values[i])]
+            elif name in _CATEGORIES:
+                code = self._codes[name].get(condition)
+                indexes = [i for i in indexes if column[i] == code]
+            else:
+                encoded = self._encode_value(name, condition)
+                indexes = [i for i in indexes if column[i] == encoded]
+
+        return self.take(indexes)
+
+    def group_by(self, name: str) -> Dict[str, "OrderFrame"]:
+        """Splits frame by `status`, `price_currency`, `receive_currency` or `orderable_type`."""
+        self._require_category(name)
+
+        groups: Dict[int, List[int]] = {}
+        for index, code in enumerate(self._columns[name]):
+            groups.setdefault(code, []).append(index)
+
+        categories = self._categories[name]
+        return {
+            categories[code]: self.take(indexes) for code, indexes in groups.items()
+        }
+
+    def count_by(self, name: str) -> Dict[str, int]:
+        self._require_category(name)
+
+        counts: Dict[int, int] = {}
+        for code in self._columns[name]:
+            counts[code] = counts.get(code, 0) + 1
+
+        categories = self._categories[name]
+        return {categories[code]: count for code, count in counts.items()}
+
+    def take(self, indexes: Iterable[int]) -> "OrderFrame":
+        """Returns frame of orders at the given positions."""
+        indexes = list(indexes)
+
+        frame = OrderFrame(scale=self._scale)
+        for name, column in self._columns.items():
+            if isinstance(column, array):
+                frame._columns[name] = array(
+                    column.typecode, [column[i] for i in indexes]
+                )
+            else:
+                frame._columns[name] = [column[i] for i in indexes]
+
+        # Codes are copied as is, so category tables are copied too
+        for name in _CATEGORIES:
+            frame._categories[name] = list(self._categories[name])
+            frame._codes[name] = dict(self._codes[name])
+
+        return frame
+
+    def _row(self, index: int) -> Order:
+        values = {name: column[index] for name, column in self._columns.items()}
+        for name in _BOOLEANS:
+            values[name] = bool(values[name])
+        for name in _CATEGORIES:
+            values[name] = self._categories[name][values[name]]
+        for name in _AMOUNTS:
+            values[name] = self._decode_amount(values[name])
+        for name in _DATETIMES:
+            values[name] = _decode_datetime(values[name])
+
+        # Values were validated when the order was added
+        return Order.construct(**values)
+
+    def _get_column(self, name: str) -> Any:
+        try:
+            return self._columns[name]
+        except KeyError:
+            raise KeyError(f"Unknown column: {name}") from None
+
+    def _require_category(self, name: str) -> None:
+        if name not in _CATEGORIES:
+            raise ValueError(
+                f"{name} is not a category column, use one of: {', '.join(_CATEGORIES)}"
+            )
+
+    def _encode_value(self, name: str, value: Any) -> Any:
+        if name in _AMOUNTS:
+            return self._encode_amount(name, Decimal(value))
+        if name in _DATETIMES:
+            return _encode_datetime(value)
+
+        return value
+
+    def _check_category(self, name: str, value: str) -> None:
+        if (
+            value not in self._codes[name]
+            and len(self._categories[name]) >= _MAX_CATEGORIES
+        ):
+            raise ValueError(
+                f"{name}={value!r} exceeds {_MAX_CATEGORIES} distinct values of a category column"
+            )
+
+    def _encode_category(self, name: str, value: str) -> int:
+        codes = self._codes[name]
+        code = codes.get(value)
+        if code is None:
+            code = codes[value] = len(self._categories[name])
+            self._categories[name].append(sys.intern(value))
+
+        return code
+
+    def _encode_amount(self, name: str, value: Decimal) -> int:
+        scaled = value.scaleb(self._scale)
+        if scaled != scaled.to_integral_value():
+            raise ValueError(
+                f"{name}={value} has more than {self._scale} decimal places, increase scale"
+            )
+
+        encoded = int(scaled)
+        if not _INT64_MIN <= encoded <= _INT64_MAX:
+            raise ValueError(
+                f"{name}={value} does not fit 64 bits at scale {self._scale}, decrease scale"
+            )
+        return encoded
+
+    def _decode_amount(self, value: int) -> Decimal:
+        return Decimal(value).scaleb(-self._scale)
+
+
+def _check_int64(name: str, value: int) -> None:
+    if not _INT64_MIN <= value <= _INT64_MAX:
+        raise ValueError(f"{name}={value} does not fit 64 bits")
+
+
+def _encode_datetime(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+
+    return (value - _EPOCH) // _MICROSECOND
+
+
+def _decode_datetime(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Tuple
+
+EVENTS = ("before_request", "after_response", "on_error", "on_retry")
+
+
+@dataclass(frozen=True)
+class RequestTiming:
+    """Timing of one attempt of a request.
+
+    :param float `queued`: Seconds waited for the rate limiter before sending
+    :param float `elapsed`: Seconds from sending until response headers were received, or the request failed
+
+    """
+
+    queued: float
+    elapsed: float
+
+
+class RequestHooks:
+    """Callbacks called on request lifecycle events, in order of registration.
+
+    * `before_request(request)` - right before an attempt is sent, after the rate limiter admitted it
+    * `after_response(request, response, timing)` - response of an attempt is received, whatever its status
+    * `on_error(request, exception, timing)` - attempt failed with a network error or an error response
+    * `on_retry(request, attempt, exception, delay)` - retry policy will send the request again after `delay` seconds
+
+    `request` is :class:`coingate.transport.TransportRequest`. Hooks run on
+    the thread (or event loop) of the request, so they should be fast;
+    exceptions raised by hooks are propagated to the caller.
+
+    """
+
+    def __init__(self) -> None:
+        # Replaced, never mutated, so emitting needs no lock
+        self._hooks: Dict[str, Tuple[Callable[..., Any], ...]] = {
+            event: () for event in EVENTS
+        }
+
+    def add(self, event: str, hook: Callable[..., Any]) -> Callable[..., Any]:
+        self._check_event(event)
+        self._hooks = {**self._hooks, event: self._hooks[event] + (hook,)}
+        return hook
+
+    def remove(self, event: str, hook: Callable[..., Any]) -> None:
+        self._check_event(event)
+        hooks = list(self._hooks[event])
+        if hook in hooks:
+            hooks.remove(hook)
+        self._hooks = {**self._hooks, event: tuple(hooks)}
+
+    def emit(self, event: str, *args: Any) -> None:
+        for hook in self._hooks[event]:
+            hook(*args)
+
+    def __bool__(self) -> bool:
+        return any(self._hooks.values())
+
+    @staticmethod
+    def _check_event(event: str) -> None:
+        if event not in EVENTS:
+            raise ValueError(f"Unknown event {event!r}, expected one of {EVENTS}")
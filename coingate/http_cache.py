@@ -0,0 +1,304 @@
+import base64
+import hashlib
+import json
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Optional, Union
+from urllib.parse import urlencode
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+if TYPE_CHECKING:
+    from .json_codec import JSONCodec
+
+
+@dataclass
+class CacheEntry:
+    """Response body with validators, stored by :class:`ResponseCache`."""
+
+    url: str
+    headers: Dict[str, str]
+    content: bytes
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    parsed: Any = field(default=None, compare=False)
+    parsed_by: Any = field(default=None, compare=False)
+
+    @property
+    def size(self) -> int:
+        return len(self.content)
+
+
+class CacheStore(ABC):
+    """Storage of cache entries. Implementations must be thread-safe."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[CacheEntry]:
+        ...
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+
+class MemoryCacheStore(CacheStore):
+    """Least recently used in-memory store, limited by number of entries and total body size.
+
+    :param int `max_entries`: Default: 256
+    :param int `max_bytes`: Default: 16 MiB
+
+    """
+
+    def __init__(self, *, max_entries: int = 256, max_bytes: int = 16 * 1024 * 1024):
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        if entry.size > self._max_bytes:
+            return
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+
+            self._entries[key] = entry
+            self._size += entry.size
+
+            while (
+                len(self._entries) > self._max_entries or self._size > self._max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._size -= entry.size
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+class FileCacheStore(CacheStore):
+    """Stores every entry as a JSON file in the given directory, so cache survives restarts and can be shared between processes.
+
+    :param str `directory`: Created if it does not exist
+
+    """
+
+    def __init__(self, directory: Union[str, "os.PathLike[str]"]) -> None:
+        self._directory = os.fspath(directory)
+        os.makedirs(self._directory, exist_ok=True)
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        return CacheEntry(
+            url=data["url"],
+            headers=data["headers"],
+            content=base64.b64decode(data["content"]),
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+        )
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        data = {
+            "url": entry.url,
+            "headers": entry.headers,
+            "content": base64.b64encode(entry.content).decode("ascii"),
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+        }
+
+        # Write to temporary file first, so readers never see partial entry
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        os.replace(tmp_path, path)
+
+    def delete(self, key: str) -> None:
+        try:
+            os.remove(self._path(key))
+        except FileNotFoundError:
+            pass
+
+    def clear(self) -> None:
+        for name in os.listdir(self._directory):
+            if name.endswith(".json"):
+                self.delete(name[: -len(".json")])
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self._directory, f"{key}.json")
+
+
+class CachedResponse(requests.Response):
+    """Response rebuilt from a cache entry. Parsed JSON body is shared between all hits of the same entry, do not mutate it."""
+
+    def __init__(self, entry: CacheEntry) -> None:
+        super().__init__()
+        self._entry = entry
+        self._content = entry.content
+        self.status_code = 200
+        self.url = entry.url
+        self.headers = CaseInsensitiveDict(entry.headers)
+        self.encoding = requests.utils.get_encoding_from_headers(self.headers)
+
+    def json(self, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().json(**kwargs)
+
+        return self._parse(None, super().json)
+
+    def decode(self, codec: "JSONCodec") -> Any:
+        """Same as :meth:`json`, but decodes body with the given codec."""
+        return self._parse(codec, lambda: codec.loads(self.content))
+
+    def _parse(self, parser: Any, parse: Callable[[], Any]) -> Any:
+        entry = self._entry
+        if entry.parsed is None or entry.parsed_by is not parser:
+            entry.parsed, entry.parsed_by = parse(), parser
+
+        return entry.parsed
+
+
+class ResponseCache:
+    """HTTP conditional request cache for `GET` requests.
+
+    Responses which carry `ETag` or `Last-Modified` headers are stored. Next
+    request of the same URL sends `If-None-Match`/`If-Modified-Since` and, when
+    server answers `304 Not Modified`, cached body (and its parsed JSON) is
+    returned instead.
+
+    :param Optional[CacheStore] `store`: Default: :class:`MemoryCacheStore`
+
+    Basic Usage::
+      >>> cache = ResponseCache(MemoryCacheStore(max_bytes=4 * 1024 * 1024))
+      >>> client.set_response_cache(cache)
+      >>> cache.hits, cache.misses
+
+    """
+
+    def __init__(self, store: Optional[CacheStore] = None) -> None:
+        self.store = store if store is not None else MemoryCacheStore()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    @staticmethod
+    def is_cacheable(method: Union[str, bytes]) -> bool:
+        if isinstance(method, bytes):
+            method = method.decode()
+
+        return method.lower() == "get"
+
+    @staticmethod
+    def key(
+        url: Union[str, bytes],
+        params: Optional[Mapping[str, Any]] = None,
+        data: Optional[Mapping[str, Any]] = None,
+        authorization: Optional[str] = None,
+    ) -> str:
+        """Hash of the request, including its `Authorization` header, so responses of one API key are never returned for another."""
+        if isinstance(url, bytes):
+            url = url.decode()
+
+        # Some list endpoints send paging in form body even for GET requests
+        parts = [authorization or "", url]
+        for values in (params, data):
+            parts.append(
+                urlencode(
+                    sorted(
+                        (k, str(v)) for k, v in (values or {}).items() if v is not None
+                    )
+                )
+            )
+
+        return hashlib.sha256("?".join(parts).encode()).hexdigest()
+
+    @staticmethod
+    def conditional_headers(entry: CacheEntry) -> Dict[str, str]:
+        headers = {}
+        if entry.etag is not None:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified is not None:
+            headers["If-Modified-Since"] = entry.last_modified
+
+        return headers
+
+    def handle(
+        self, key: str, entry: Optional[CacheEntry], response: requests.Response
+    ) -> requests.Response:
+        """Returns cached response on `304 Not Modified`, otherwise stores response if it has validators."""
+        if response.status_code == 304 and entry is not None:
+            self._count(hit=True)
+            return CachedResponse(entry)
+
+        self._count(hit=False)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == 200 and (etag or last_modified):
+            self.store.set(
+                key,
+                CacheEntry(
+                    url=response.url,
+                    headers=dict(response.headers),
+                    content=response.content,
+                    etag=etag,
+                    last_modified=last_modified,
+                ),
+            )
+
+        return response
+
+    def _count(self, *, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
@@ -1,17 +1,34 @@
-from typing import Any, Dict, Optional, Union
+import itertools
+import time
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Union
 
 import requests
 
 from coingate import __version__
 
 from . import exceptions
+from .hooks import RequestHooks, RequestTiming
+from .http_cache import ResponseCache
+from .rate_limit import RateLimiter
+from .retry import RetryCallback, RetryPolicy
+from .transport import PoolLimits, RequestsTransport, Transport, TransportRequest
 
+if TYPE_CHECKING:
+    from .tracing import Tracing
 
-class HTTPClient:
+
+class BaseHTTPClient:
     def __init__(self, api_key: Optional[str]) -> None:
+        # Replaced, never mutated, so requests in other threads always see a
+        # consistent set of headers
+        self._default_headers: Mapping[str, str] = MappingProxyType({})
         self._api_key = api_key
-        self._session = requests.Session()
         self._timeout: Optional[int] = 60
+        self._rate_limiter: Optional[RateLimiter] = None
+        self._retry_policy: Optional[RetryPolicy] = None
+        self._hooks = RequestHooks()
+        self._tracing: Optional["Tracing"] = None
 
         self.update_user_agent()
 
@@ -24,6 +41,7 @@ class HTTPClient:
 
     @api_key.setter
     def api_key(self, value: Optional[str]) -> None:
+        self._api_key = value
         self._update_auth_headers(value)
 
     @property
@@ -34,8 +52,48 @@ class HTTPClient:
     def timeout(self, value: Optional[int]) -> None:
         self._timeout = value
 
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        return self._rate_limiter
+
+    @rate_limiter.setter
+    def rate_limiter(self, value: Optional[RateLimiter]) -> None:
+        self._rate_limiter = value
+
+    @property
+    def retry_policy(self) -> Optional[RetryPolicy]:
+        return self._retry_policy
+
+    @retry_policy.setter
+    def retry_policy(self, value: Optional[RetryPolicy]) -> None:
+        self._retry_policy = value
+
+    @property
+    def hooks(self) -> RequestHooks:
+        return self._hooks
+
+    @property
+    def tracing(self) -> Optional["Tracing"]:
+        return self._tracing
+
+    @tracing.setter
+    def tracing(self, value: Optional["Tracing"]) -> None:
+        self._tracing = value
+
+    def _retry_hook(self, request: TransportRequest) -> Optional[RetryCallback]:
+        tracing = self._tracing
+        if not self._hooks and tracing is None:
+            return None
+
+        def _on_retry(attempt: int, error: BaseException, delay: float) -> None:
+            if tracing is not None:
+                tracing.record_retry(attempt, error, delay)
+            self._hooks.emit("on_retry", request, attempt, error, delay)
+
+        return _on_retry
+
     def _update_auth_headers(self, value: Optional[str]) -> None:
-        self._session.headers.update({"Authorization": f"Token {value}"})
+        self._set_default_header("Authorization", f"Token {value}")
 
     def update_user_agent(
         self, *, name: Optional[str] = None, version: Optional[str] = None
@@ -45,7 +103,85 @@ class HTTPClient:
         if name is not None:
             user_agent += f", {name} v{version}"
 
-        self._session.headers.update({"User-Agent": user_agent})
+        self._set_default_header("User-Agent", user_agent)
+
+    @property
+    def default_headers(self) -> Mapping[str, str]:
+        """Read-only headers sent with every request."""
+        return self._default_headers
+
+    def _set_default_header(self, name: str, value: str) -> None:
+        self._default_headers = MappingProxyType({**self._default_headers, name: value})
+
+    def _build_request_headers(
+        self, method: Union[str, bytes], data: Optional[Dict[str, Any]]
+    ) -> Dict[str, str]:
+        headers = dict(self._default_headers)
+        if method in ("post", "patch") or data is not None:
+            headers.update({"Content-Type": "application/x-www-form-urlencoded"})
+
+        return headers
+
+    @staticmethod
+    def _is_error(response: Any) -> bool:
+        # Statuses of `requests.Response.raise_for_status`, other responses
+        # (e.g. 3xx) are returned to the caller by both clients
+        return 400 <= response.status_code < 600
+
+    def _raise_client_error(self, response: Any):
+        try:
+            body = response.json()
+            reason = body.get("reason")
+            message = body.get("message")
+            errors = body.get("errors")
+            exception = (
+                getattr(exceptions, f"{reason}Exception", None)
+                or exceptions.ApiException
+            )
+
+            return exception(
+                reason=reason,
+                status_code=response.status_code,
+                message=message,
+                errors=errors,
+            )
+        except ValueError:
+            return None
+
+
+class HTTPClient(BaseHTTPClient):
+    def __init__(
+        self,
+        api_key: Optional[str],
+        *,
+        pool_limits: Optional[PoolLimits] = None,
+        transport: Optional[Transport] = None,
+    ) -> None:
+        self._pool_limits = pool_limits or PoolLimits()
+        self._transport = transport or RequestsTransport(pool_limits=self._pool_limits)
+
+        self._response_cache: Optional[ResponseCache] = None
+
+        super().__init__(api_key)
+
+        if not self._pool_limits.keep_alive:
+            self._set_default_header("Connection", "close")
+
+    @property
+    def pool_limits(self) -> PoolLimits:
+        return self._pool_limits
+
+    @property
+    def transport(self) -> Transport:
+        return self._transport
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        return self._response_cache
+
+    @response_cache.setter
+    def response_cache(self, value: Optional[ResponseCache]) -> None:
+        self._response_cache = value
 
     def request(
         self,
@@ -54,22 +190,104 @@ class HTTPClient:
         *,
         data: Optional[Dict[str, Any]] = None,
         params: Optional[Dict[str, Any]] = None,
+        stream: bool = False,
     ) -> requests.Response:
-        headers = {}
-        if method in ("post", "patch") or data is not None:
-            headers.update({"Content-Type": "application/x-www-form-urlencoded"})
+        if self._tracing is None:
+            return self._request(method, url, data, params, stream)
+
+        with self._tracing.request_span(method, url, params, data) as span:
+            response = self._request(method, url, data, params, stream)
+            span.set_attribute("http.response.status_code", response.status_code)
+            return response
+
+    def _request(
+        self,
+        method: Union[str, bytes],
+        url: Union[str, bytes],
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        stream: bool,
+    ) -> requests.Response:
+        headers = self._build_request_headers(method, data)
+
+        # Caching needs the whole body, so streamed responses bypass it
+        cache = self._response_cache if not stream else None
+        cache_key, cached = None, None
+        if cache is not None and cache.is_cacheable(method):
+            cache_key = cache.key(url, params, data, headers.get("Authorization"))
+            if self._tracing is not None:
+                cached = self._tracing.lookup_cache(lambda: cache.store.get(cache_key))
+            else:
+                cached = cache.store.get(cache_key)
+            if cached is not None:
+                headers.update(cache.conditional_headers(cached))
 
-        response = self._session.request(
+        request = TransportRequest.build(
             method,
             url,
+            headers=headers,
             data=data,
             params=params,
             timeout=self._timeout,
-            headers=headers,
+            stream=stream,
         )
-        return self._process_response(response)
+
+        attempts = itertools.count()
+
+        def _send() -> requests.Response:
+            response = self._send(request, next(attempts))
+            if cache is not None and cache_key is not None:
+                return cache.handle(cache_key, cached, response)
+
+            return response
+
+        if self._retry_policy is not None:
+            return self._retry_policy.call(
+                method, _send, on_retry=self._retry_hook(request)
+            )
+
+        return _send()
+
+    def _send(self, request: TransportRequest, attempt: int = 0) -> requests.Response:
+        queued = 0.0
+        if self._rate_limiter is not None:
+            queued = self._rate_limiter.acquire(request.url)
+
+        if self._tracing is None:
+            return self._send_attempt(request, queued)
+
+        with self._tracing.attempt_span(request, attempt) as traced_request:
+            return self._send_attempt(traced_request, queued)
+
+    def _send_attempt(
+        self, request: TransportRequest, queued: float
+    ) -> requests.Response:
+        self._hooks.emit("before_request", request)
+        started = time.perf_counter()
+        try:
+            response = self._transport.send(request)
+        except Exception as e:
+            timing = RequestTiming(queued, time.perf_counter() - started)
+            self._hooks.emit("on_error", request, e, timing)
+            raise
+
+        timing = RequestTiming(queued, time.perf_counter() - started)
+        if self._rate_limiter is not None:
+            self._rate_limiter.observe(request.url, response.headers)
+        if self._tracing is not None:
+            self._tracing.record_response(response.status_code)
+
+        self._hooks.emit("after_response", request, response, timing)
+        try:
+            return self._process_response(response)
+        except Exception as e:
+            self._hooks.emit("on_error", request, e, timing)
+            raise
 
     def _process_response(self, response: requests.Response):
+        if not self._is_error(response):
+            return response
+
         try:
             response.raise_for_status()
         except requests.HTTPError as e:
@@ -77,23 +295,3 @@ class HTTPClient:
             raise client_exception or e
         else:
             return response
-
-    def _raise_client_error(self, response: requests.Response):
-        try:
-            body = response.json()
-            reason = body.get("reason")
-            message = body.get("message")
-            errors = body.get("errors")
-            exception = (
-                getattr(exceptions, f"{reason}Exception", None)
-                or exceptions.ApiException
-            )
-
-            return exception(
-                reason=reason,
-                status_code=response.status_code,
-                message=message,
-                errors=errors,
-            )
-        except ValueError:
-            return None
@@ -0,0 +1,221 @@
+import re
+import threading
+from bisect import bisect_left
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+from urllib.parse import urlsplit
+
+from .hooks import RequestTiming
+from .transport import TransportRequest
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+_VERSION = re.compile(r"v\d+")
+
+Labels = Tuple[Tuple[str, str], ...]
+Sample = Tuple[str, Dict[str, str], float]
+
+
+@lru_cache(maxsize=4096)
+def endpoint_template(url: str) -> str:
+    """Replaces ids in path of `url` with placeholders, e.g. `v2/orders/{id}/refunds`, to keep number of endpoints small.
+
+    Path segments with digits become `{id}`, upper case ones (currency codes of `v2/rates`) become `{currency}`.
+
+    """
+    segments = []
+    for i, segment in enumerate(s for s in urlsplit(url).path.split("/") if s):
+        if i == 0 and _VERSION.fullmatch(segment):
+            segments.append(segment)
+        elif any(char.isdigit() for char in segment):
+            segments.append("{id}")
+        elif segment.isupper():
+            segments.append("{currency}")
+        else:
+            segments.append(segment)
+
+    return "/".join(segments)
+
+
+class _Histogram:
+    __slots__ = ("counts", "sum")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.sum = 0.0
+
+
+class MetricsRegistry:
+    """Collects request metrics through client hooks, per method and endpoint template.
+
+    * `coingate_request_duration_seconds` - histogram of time until response headers
+    * `coingate_rate_limit_wait_seconds` - histogram of time waited for the rate limiter
+    * `coingate_responses_total` - responses by status code
+    * `coingate_errors_total` - network errors and error responses by exception class
+    * `coingate_retries_total`
+    * `coingate_request_bytes_total`, `coingate_response_bytes_total` - body sizes; streamed responses count `Content-Length`
+
+    Recording takes a few microseconds, under a single lock.
+
+    :param Sequence[float] `buckets`: Upper bounds of histogram buckets in seconds. Default: 5 ms to 10 s
+
+    Basic Usage::
+      >>> metrics = MetricsRegistry()
+      >>> client.set_metrics(metrics)
+      >>> print(metrics.prometheus())
+      coingate_request_duration_seconds_bucket{method="GET",endpoint="v2/orders/{id}",le="0.1"} 41
+      ...
+
+    """
+
+    def __init__(self, *, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self._buckets = tuple(sorted(buckets))
+        self._lock = threading.Lock()
+        self._durations: Dict[Labels, _Histogram] = {}
+        self._waits: Dict[Labels, _Histogram] = {}
+        self._responses: "Counter[Labels]" = Counter()
+        self._errors: "Counter[Labels]" = Counter()
+        self._retries: "Counter[Labels]" = Counter()
+        self._request_bytes: "Counter[Labels]" = Counter()
+        self._response_bytes: "Counter[Labels]" = Counter()
+
+    def hooks(self) -> Dict[str, Callable[..., Any]]:
+        """Hooks recording metrics, by event."""
+        return {
+            "after_response": self.after_response,
+            "on_error": self.on_error,
+            "on_retry": self.on_retry,
+        }
+
+    def after_response(
+        self, request: TransportRequest, response: Any, timing: RequestTiming
+    ) -> None:
+        labels = self._labels(request)
+        if request.stream:
+            received = int(response.headers.get("Content-Length") or 0)
+        else:
+            received = len(response.content)
+
+        with self._lock:
+            self._observe(self._durations, labels, timing.elapsed)
+            self._observe(self._waits, labels, timing.queued)
+            self._responses[labels + (("status", str(response.status_code)),)] += 1
+            self._request_bytes[labels] += len(request.body or b"")
+            self._response_bytes[labels] += received
+
+    def on_error(
+        self, request: TransportRequest, error: Exception, timing: RequestTiming
+    ) -> None:
+        labels = self._labels(request) + (("exception", type(error).__name__),)
+        with self._lock:
+            self._errors[labels] += 1
+
+    def on_retry(
+        self, request: TransportRequest, attempt: int, error: Exception, delay: float
+    ) -> None:
+        labels = self._labels(request)
+        with self._lock:
+            self._retries[labels] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            for metric in (
+                self._durations,
+                self._waits,
+                self._responses,
+                self._errors,
+                self._retries,
+                self._request_bytes,
+                self._response_bytes,
+            ):
+                metric.clear()
+
+    def samples(self) -> List[Sample]:
+        """Current values as `(name, labels, value)`, histograms expanded into `_bucket`, `_sum` and `_count` samples."""
+        with self._lock:
+            samples: List[Sample] = []
+            samples += self._histogram_samples(
+                "coingate_request_duration_seconds", self._durations
+            )
+            samples += self._histogram_samples(
+                "coingate_rate_limit_wait_seconds", self._waits
+            )
+            for name, counter in self._counters():
+                samples += [
+                    (name, dict(labels), value)
+                    for labels, value in sorted(counter.items())
+                ]
+
+        return samples
+
+    def prometheus(self) -> str:
+        """Metrics in Prometheus text exposition format."""
+        types = {
+            "coingate_request_duration_seconds": "histogram",
+            "coingate_rate_limit_wait_seconds": "histogram",
+        }
+        lines = []
+        current = None
+        for name, labels, value in self.samples():
+            family = re.sub(r"_(bucket|sum|count)$", "", name)
+            if family not in types:
+                family = name
+            if family != current:
+                current = family
+                lines.append(f"# TYPE {family} {types.get(family, 'counter')}")
+
+            rendered = ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items())
+            lines.append(f"{name}{{{rendered}}} {_format(value)}")
+
+        return "\n".join(lines) + "\n"
+
+    def _counters(self) -> List[Tuple[str, "Counter[Labels]"]]:
+        return [
+            ("coingate_responses_total", self._responses),
+            ("coingate_errors_total", self._errors),
+            ("coingate_retries_total", self._retries),
+            ("coingate_request_bytes_total", self._request_bytes),
+            ("coingate_response_bytes_total", self._response_bytes),
+        ]
+
+    def _observe(
+        self, histograms: Dict[Labels, _Histogram], labels: Labels, value: float
+    ) -> None:
+        histogram = histograms.get(labels)
+        if histogram is None:
+            histogram = histograms[labels] = _Histogram(len(self._buckets) + 1)
+        histogram.counts[bisect_left(self._buckets, value)] += 1
+        histogram.sum += value
+
+    def _histogram_samples(
+        self, name: str, histograms: Dict[Labels, _Histogram]
+    ) -> List[Sample]:
+        samples: List[Sample] = []
+        bounds = [_format(b) for b in self._buckets] + ["+Inf"]
+        for labels, histogram in sorted(histograms.items()):
+            cumulative = 0
+            for bound, count in zip(bounds, histogram.counts):
+                cumulative += count
+                samples.append(
+                    (f"{name}_bucket", {**dict(labels), "le": bound}, cumulative)
+                )
+            samples.append((f"{name}_sum", dict(labels), histogram.sum))
+            samples.append((f"{name}_count", dict(labels), cumulative))
+
+        return samples
+
+    @staticmethod
+    def _labels(request: TransportRequest) -> Labels:
+        return (
+            ("method", request.method),
+            ("endpoint", endpoint_template(request.url)),
+        )
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format(value: float) -> str:
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
@@ -0,0 +1,421 @@
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    Union,
+)
+
+from pydantic import BaseModel
+
+from .parsing import M
+from .resources.order import Order
+from .resources.refund import PaginatedRefundsRefund
+from .resources.withdrawal import Withdrawal
+
+if TYPE_CHECKING:
+    from .client import CoinGate
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS orders (
+    id INTEGER PRIMARY KEY,
+    order_id TEXT,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS orders_order_id ON orders (order_id);
+CREATE INDEX IF NOT EXISTS orders_status_created_at ON orders (status, created_at);
+CREATE INDEX IF NOT EXISTS orders_created_at ON orders (created_at);
+
+CREATE TABLE IF NOT EXISTS refunds (
+    id INTEGER PRIMARY KEY,
+    order_id INTEGER NOT NULL,
+    status TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS refunds_order_id ON refunds (order_id);
+CREATE INDEX IF NOT EXISTS refunds_status ON refunds (status);
+
+CREATE TABLE IF NOT EXISTS withdrawals (
+    id INTEGER PRIMARY KEY,
+    status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS withdrawals_status_created_at ON withdrawals (status, created_at);
+CREATE INDEX IF NOT EXISTS withdrawals_created_at ON withdrawals (created_at);
+
+CREATE TABLE IF NOT EXISTS sync_state (
+    resource TEXT PRIMARY KEY,
+    watermark TEXT NOT NULL,
+    synced_at TEXT NOT NULL
+);
+"""
+
+
+@dataclass
+class SyncResult:
+    """Number of records written by :meth:`SQLiteMirror.sync`, new and re-scanned ones."""
+
+    orders: int = 0
+    refunds: int = 0
+    withdrawals: int = 0
+
+
+class SQLiteMirror:
+    """Local SQLite copy of orders, refunds and withdrawals, answering queries without API requests.
+
+    Every :meth:`sync` fetches only records newer than the last watermark,
+    plus records of the `rescan_window` before it, whose status may have
+    changed since they were mirrored:
+
+    - orders are requested with `created_at[from]` set to the watermark minus `rescan_window`
+    - withdrawals are paged newest first until a page older than the watermark minus `rescan_window`
+    - refunds carry no creation time, so they are paged newest first until
+      `rescan_pages` pages contain no refund newer than the highest mirrored ID
+
+    Status changes of older records are not picked up, call :meth:`sync` with
+    `full=True` to re-scan everything.
+
+    Records are written in transactions of `batch_size`. Orders are fetched
+    oldest first and their watermark is saved with every batch, so an
+    interrupted sync resumes where it stopped. Refunds and withdrawals are
+    fetched newest first, so their watermark is saved only once the scan is
+    complete, and an interrupted sync scans the missed records again.
+
+    :param CoinGate `client`
+    :param str `path`: Database file. Default: `:memory:`
+    :param timedelta `rescan_window`: Default: 7 days
+    :param int `rescan_pages`: Number of already mirrored refund pages to re-scan. Default: 1
+    :param int `batch_size`: Number of records written per transaction. Default: 500
+
+    Basic Usage::
+      >>> mirror = SQLiteMirror(client, "coingate.sqlite3")
+      >>> mirror.sync()
+      SyncResult(orders=120, refunds=3, withdrawals=1)
+      >>> mirror.orders(status="paid", created_from=datetime(2022, 10, 1))
+      [Order(id=..., status='paid', ...), ...]
+      >>> mirror.orders_by_merchant_id("shop-1001")
+      [Order(id=..., order_id='shop-1001', ...)]
+
+    """
+
+    def __init__(
+        self,
+        client: "CoinGate",
+        path: str = ":memory:",
+        *,
+        rescan_window: timedelta = timedelta(days=7),
+        rescan_pages: int = 1,
+        batch_size: int = 500,
+    ) -> None:
+        self._client = client
+        self._rescan_window = rescan_window
+        self._rescan_pages = rescan_pages
+        self._batch_size = batch_size
+
+        self._connection = sqlite3.connect(path)
+        self._connection.executescript(_SCHEMA)
+
+    def __enter__(self) -> "SQLiteMirror":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._connection.close()
+
+    def sync(self, *, full: bool = False) -> SyncResult:
+        return SyncResult(
+            orders=self.sync_orders(full=full),
+            refunds=self.sync_refunds(full=full),
+            withdrawals=self.sync_withdrawals(full=full),
+        )
+
+    def sync_orders(self, *, full: bool = False) -> int:
+        watermark = None if full else self.watermark("orders")
+        created_from = (
+            watermark - self._rescan_window if watermark is not None else None
+        )
+
+        orders = self._client.order.iter_all(
+            sort="created_at_asc", created_from=created_from
+        )
+        return self._write_batches(
+            "orders",
+            (
+                (
+                    order.id,
+                    order.order_id,
+                    order.status,
+                    _encode_datetime(order.created_at),
+                    _dump(order),
+                )
+                for order in orders
+            ),
+            watermark_column=3,
+        )
+
+    def sync_withdrawals(self, *, full: bool = False) -> int:
+        watermark = None if full else self.watermark("withdrawals")
+        rescan_from = (
+            _encode_datetime(watermark - self._rescan_window)
+            if watermark is not None
+            else None
+        )
+
+        def _withdrawals() -> Iterable[Tuple[Any, ...]]:
+            page, total_pages = 1, 1
+            while page <= total_pages:
+                result = self._client.withdrawal.get_all(page=page)
+                rows = [
+                    (
+                        withdrawal.id,
+                        withdrawal.status,
+                        _encode_datetime(withdrawal.created_at),
+                        _dump(withdrawal),
+                    )
+                    for withdrawal in result.withdrawals
+                ]
+                yield from rows
+
+                if rescan_from is not None and all(
+                    row[2] < rescan_from for row in rows
+                ):
+                    return
+                page, total_pages = page + 1, result.total_pages
+
+        return self._write_batches(
+            "withdrawals", _withdrawals(), watermark_column=2, ascending=False
+        )
+
+    def sync_refunds(self, *, full: bool = False) -> int:
+        # Highest ID of the last complete scan, not of the mirrored refunds,
+        # which include the newest ones of an interrupted scan
+        stored = None if full else self._stored_watermark("refunds")
+        highest_id = int(stored) if stored is not None else None
+
+        def _refunds() -> Iterable[Tuple[Any, ...]]:
+            page, total_pages, mirrored_pages = 1, 1, 0
+            while page <= total_pages:
+                result = self._client.refund.get_refunds(page=page)
+                rows = [
+                    (refund.id, refund.order.id, refund.status, _dump(refund))
+                    for refund in result.refunds
+                ]
+                yield from rows
+
+                if highest_id is not None and all(row[0] <= highest_id for row in rows):
+                    mirrored_pages += 1
+                    if mirrored_pages >= self._rescan_pages:
+                        return
+                page, total_pages = page + 1, result.total_pages
+
+        return self._write_batches(
+            "refunds", _refunds(), watermark_column=0, ascending=False
+        )
+
+    def watermark(self, resource: str) -> Optional[datetime]:
+        """Creation time of the newest mirrored `orders` or `withdrawals` record."""
+        stored = self._stored_watermark(resource)
+        return datetime.fromisoformat(stored) if stored is not None else None
+
+    def order(self, id: int) -> Optional[Order]:
+        rows = self._select(Order, "SELECT data FROM orders WHERE id = ?", (id,))
+        return rows[0] if rows else None
+
+    def orders_by_merchant_id(self, order_id: str) -> List[Order]:
+        """Orders with the given merchant `order_id`, newest first."""
+        return self._select(
+            Order,
+            "SELECT data FROM orders WHERE order_id = ? ORDER BY created_at DESC",
+            (order_id,),
+        )
+
+    def orders(
+        self,
+        *,
+        status: Optional[str] = None,
+        created_from: Optional[Union[date, datetime]] = None,
+        created_to: Optional[Union[date, datetime]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Order]:
+        """Orders matching every given filter, newest first. `created_to` is exclusive."""
+        where, params = _filters(status, created_from, created_to)
+        return self._select(
+            Order,
+            f"SELECT data FROM orders{where} ORDER BY created_at DESC{_limit(limit)}",
+            params,
+        )
+
+    def refund(self, id: int) -> Optional[PaginatedRefundsRefund]:
+        rows = self._select(
+            PaginatedRefundsRefund, "SELECT data FROM refunds WHERE id = ?", (id,)
+        )
+        return rows[0] if rows else None
+
+    def refunds(
+        self, *, order_id: Optional[int] = None, status: Optional[str] = None
+    ) -> List[PaginatedRefundsRefund]:
+        """Refunds matching every given filter, newest first."""
+        conditions: List[str] = []
+        params: List[Any] = []
+        if order_id is not None:
+            conditions.append("order_id = ?")
+            params.append(order_id)
+        if status is not None:
+            conditions.append("status = ?")
+            params.append(status)
+
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self._select(
+            PaginatedRefundsRefund,
+            f"SELECT data FROM refunds{where} ORDER BY id DESC",
+            params,
+        )
+
+    def withdrawal(self, id: int) -> Optional[Withdrawal]:
+        rows = self._select(
+            Withdrawal, "SELECT data FROM withdrawals WHERE id = ?", (id,)
+        )
+        return rows[0] if rows else None
+
+    def withdrawals(
+        self,
+        *,
+        status: Optional[str] = None,
+        created_from: Optional[Union[date, datetime]] = None,
+        created_to: Optional[Union[date, datetime]] = None,
+        limit: Optional[int] = None,
+    ) -> List[Withdrawal]:
+        """Withdrawals matching every given filter, newest first. `created_to` is exclusive."""
+        where, params = _filters(status, created_from, created_to)
+        return self._select(
+            Withdrawal,
+            f"SELECT data FROM withdrawals{where} ORDER BY created_at DESC{_limit(limit)}",
+            params,
+        )
+
+    def _select(self, model: Type[M], sql: str, params: Sequence[Any]) -> List[M]:
+        return [
+            self._client.parse_resource(model, json.loads(data))
+            for (data,) in self._connection.execute(sql, params)
+        ]
+
+    def _stored_watermark(self, resource: str) -> Optional[str]:
+        row = self._connection.execute(
+            "SELECT watermark FROM sync_state WHERE resource = ?", (resource,)
+        ).fetchone()
+        return row[0] if row is not None else None
+
+    def _save_watermark(self, resource: str, watermark: Any) -> None:
+        stored = self._stored_watermark(resource)
+        # Watermark never moves back, e.g. during full sync
+        if stored is not None and type(watermark)(stored) > watermark:
+            watermark = stored
+        self._connection.execute(
+            "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?)",
+            (
+                resource,
+                str(watermark),
+                _encode_datetime(datetime.now(timezone.utc)),
+            ),
+        )
+
+    def _write_batches(
+        self,
+        table: str,
+        rows: Iterable[Tuple[Any, ...]],
+        *,
+        watermark_column: Optional[int] = None,
+        ascending: bool = True,
+    ) -> int:
+        count = 0
+        watermark: Any = None
+        batch: List[Tuple[Any, ...]] = []
+
+        def _flush(complete: bool) -> None:
+            with self._connection:
+                if batch:
+                    placeholders = ", ".join("?" * len(batch[0]))
+                    self._connection.executemany(
+                        f"INSERT OR REPLACE INTO {table} VALUES ({placeholders})",
+                        batch,
+                    )
+                # Rows in ascending order are committed with their watermark,
+                # so interrupted sync resumes. A watermark of rows in
+                # descending order would skip the older rows not reached yet.
+                if watermark is not None and (ascending or complete):
+                    self._save_watermark(table, watermark)
+            batch.clear()
+
+        for row in rows:
+            batch.append(row)
+            count += 1
+            if watermark_column is not None and (
+                watermark is None or row[watermark_column] > watermark
+            ):
+                watermark = row[watermark_column]
+            if len(batch) >= self._batch_size:
+                _flush(complete=False)
+        _flush(complete=True)
+
+        return count
+
+
+def _encode_datetime(value: Union[date, datetime]) -> str:
+    # Stored in UTC with fixed precision, so text comparison orders by time
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+
+    return value.astimezone(timezone.utc).isoformat(timespec="microseconds")
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.isoformat()
+
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _dump(resource: BaseModel) -> str:
+    return json.dumps(resource.dict(), default=_json_default)
+
+
+def _filters(
+    status: Optional[str],
+    created_from: Optional[Union[date, datetime]],
+    created_to: Optional[Union[date, datetime]],
+) -> Tuple[str, List[Any]]:
+    conditions: List[str] = []
+    params: List[Any] = []
+    if status is not None:
+        conditions.append("status = ?")
+        params.append(status)
+    if created_from is not None:
+        conditions.append("created_at >= ?")
+        params.append(_encode_datetime(created_from))
+    if created_to is not None:
+        conditions.append("created_at < ?")
+        params.append(_encode_datetime(created_to))
+
+    return (f" WHERE {' AND '.join(conditions)}" if conditions else ""), params
+
+
+def _limit(limit: Optional[int]) -> str:
+    return f" LIMIT {int(limit)}" if limit is not None else ""
@@ -0,0 +1,245 @@
+import asyncio
+import contextvars
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    TypeVar,
+)
+
+from typing_extensions import Protocol
+
+if TYPE_CHECKING:
+    from .streaming import JSONItemStream
+
+
+class Page(Protocol):
+    current_page: int
+    total_pages: int
+
+
+T = TypeVar("T")
+P = TypeVar("P", bound=Page)
+
+
+@dataclass
+class BulkPages(Generic[T]):
+    """Result of fetching every page of a list endpoint at once.
+
+    :param List `items`: Items of all successfully fetched pages in page order, without duplicates
+    :param int `total_pages`: Number of pages reported by the first page
+    :param Dict[int, Exception] `failed_pages`: Exceptions raised while fetching pages, by page number
+
+    """
+
+    items: List[T]
+    total_pages: int
+    failed_pages: Dict[int, Exception] = field(default_factory=dict)
+
+    @property
+    def is_complete(self) -> bool:
+        return not self.failed_pages
+
+
+def _merge_pages(
+    pages: Dict[int, List[T]], get_key: Callable[[T], Hashable]
+) -> List[T]:
+    # Records may shift to the next page while pages are being fetched, so the
+    # same record can show up twice. First occurrence in page order wins.
+    seen = set()
+    items = []
+    for number in sorted(pages):
+        for item in pages[number]:
+            key = get_key(item)
+            if key not in seen:
+                seen.add(key)
+                items.append(item)
+
+    return items
+
+
+def iterate_pages(
+    fetch_page: Callable[[int], P],
+    get_items: Callable[[P], List[T]],
+    *,
+    prefetch: bool = True,
+) -> Iterator[T]:
+    """Yields items of every page, starting from the first one.
+
+    While items of the current page are consumed, the next page is fetched in
+    a background thread, so at most two pages are held in memory at a time.
+
+    :param Callable[[int], Page] `fetch_page`: Fetches page by its number
+    :param Callable[[Page], List] `get_items`: Extracts items from fetched page
+    :param bool `prefetch`: Fetch next page in background. Default: True
+
+    """
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    next_page: Optional["Future[P]"] = None
+
+    try:
+        page = fetch_page(1)
+        while True:
+            has_next = page.current_page < page.total_pages
+            if has_next and executor is not None:
+                # Copied context keeps the fetch inside the caller's trace span
+                next_page = executor.submit(
+                    contextvars.copy_context().run,
+                    fetch_page,
+                    page.current_page + 1,
+                )
+
+            yield from get_items(page)
+
+            if not has_next:
+                return
+
+            if next_page is not None:
+                page, next_page = next_page.result(), None
+            else:
+                page = fetch_page(page.current_page + 1)
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+
+def iterate_streamed_pages(
+    fetch_stream: Callable[[int], "JSONItemStream[T]"]
+) -> Iterator[T]:
+    """Yields items of every page, decoding each item as soon as it is received.
+
+    Pages are fetched one after another, so only one item is held in memory.
+
+    :param Callable[[int], JSONItemStream] `fetch_stream`: Requests page by its number
+
+    """
+    number = 1
+    while True:
+        stream = fetch_stream(number)
+        yield from stream
+
+        total_pages = stream.fields.get("total_pages", number)
+        if number >= total_pages:
+            return
+        number += 1
+
+
+async def aiterate_pages(
+    fetch_page: Callable[[int], Awaitable[P]],
+    get_items: Callable[[P], List[T]],
+    *,
+    prefetch: bool = True,
+) -> AsyncIterator[T]:
+    """Asynchronous version of :func:`iterate_pages`.
+
+    Next page is fetched in a separate task while the current one is consumed.
+
+    """
+    next_page: Optional["asyncio.Future[P]"] = None
+
+    try:
+        page = await fetch_page(1)
+        while True:
+            has_next = page.current_page < page.total_pages
+            if has_next and prefetch:
+                next_page = asyncio.ensure_future(fetch_page(page.current_page + 1))
+
+            for item in get_items(page):
+                yield item
+
+            if not has_next:
+                return
+
+            if next_page is not None:
+                page, next_page = await next_page, None
+            else:
+                page = await fetch_page(page.current_page + 1)
+    finally:
+        if next_page is not None:
+            next_page.cancel()
+
+
+def fetch_pages_concurrently(
+    fetch_page: Callable[[int], P],
+    get_items: Callable[[P], List[T]],
+    *,
+    workers: int = 4,
+    get_key: Callable[[Any], Hashable] = attrgetter("id"),
+) -> BulkPages[T]:
+    """Fetches first page, then all remaining pages concurrently.
+
+    A failure of any page except the first one is recorded in
+    :attr:`BulkPages.failed_pages` instead of being raised, so items of
+    successfully fetched pages are not lost.
+
+    :param Callable[[int], Page] `fetch_page`: Fetches page by its number
+    :param Callable[[Page], List] `get_items`: Extracts items from fetched page
+    :param int `workers`: Number of pages fetched at the same time. Default: 4
+    :param Callable `get_key`: Returns identity of an item used for de-duplication. Default: item's `id`
+
+    """
+    first_page = fetch_page(1)
+    pages = {1: get_items(first_page)}
+    failed_pages: Dict[int, Exception] = {}
+
+    remaining = range(2, first_page.total_pages + 1)
+    if len(remaining):
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            futures = {
+                executor.submit(
+                    contextvars.copy_context().run, fetch_page, number
+                ): number
+                for number in remaining
+            }
+            for future in as_completed(futures):
+                number = futures[future]
+                try:
+                    pages[number] = get_items(future.result())
+                except Exception as e:
+                    failed_pages[number] = e
+
+    return BulkPages(_merge_pages(pages, get_key), first_page.total_pages, failed_pages)
+
+
+async def afetch_pages_concurrently(
+    fetch_page: Callable[[int], Awaitable[P]],
+    get_items: Callable[[P], List[T]],
+    *,
+    workers: int = 4,
+    get_key: Callable[[Any], Hashable] = attrgetter("id"),
+) -> BulkPages[T]:
+    """Asynchronous version of :func:`fetch_pages_concurrently`.
+
+    At most `workers` page requests are in flight at the same time.
+
+    """
+    first_page = await fetch_page(1)
+    pages = {1: get_items(first_page)}
+    failed_pages: Dict[int, Exception] = {}
+    semaphore = asyncio.Semaphore(max(1, workers))
+
+    async def _fetch(number: int) -> None:
+        async with semaphore:
+            try:
+                pages[number] = get_items(await fetch_page(number))
+            except Exception as e:
+                failed_pages[number] = e
+
+    await asyncio.gather(
+        *(_fetch(number) for number in range(2, first_page.total_pages + 1))
+    )
+
+    return BulkPages(_merge_pages(pages, get_key), first_page.total_pages, failed_pages)
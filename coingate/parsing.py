@@ -0,0 +1,140 @@
+from datetime import datetime
+from decimal import Decimal
+from inspect import isclass
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
+
+from pydantic import BaseModel
+from pydantic.datetime_parse import parse_datetime
+from pydantic.fields import (
+    SHAPE_DEFAULTDICT,
+    SHAPE_DICT,
+    SHAPE_LIST,
+    SHAPE_MAPPING,
+    SHAPE_SEQUENCE,
+    SHAPE_SINGLETON,
+    ModelField,
+)
+
+M = TypeVar("M", bound=BaseModel)
+
+Converter = Callable[[Any], Any]
+
+_DICT_SHAPES = (SHAPE_DICT, SHAPE_MAPPING, SHAPE_DEFAULTDICT)
+_LIST_SHAPES = (SHAPE_LIST, SHAPE_SEQUENCE)
+
+_plans: Dict[type, "_Plan"] = {}
+
+
+def parse_resource(model: Type[M], data: Dict[str, Any], *, validate: bool = True) -> M:
+    """Builds resource from API response.
+
+    With `validate=False` resource is built by :func:`construct_resource`,
+    which should be used only for responses of the real CoinGate API.
+
+    """
+    if validate:
+        return model(**data)
+
+    return construct_resource(model, data)
+
+
+def construct_resource(model: Type[M], data: Dict[str, Any]) -> M:
+    """Builds resource without pydantic validation.
+
+    Unlike `BaseModel.construct`, nested resources are built recursively and
+    `Decimal`, `datetime` and `str` fields are coerced the same way validation
+    would, so the result is equal to `model(**data)` for well-formed data.
+    Malformed data is not detected.
+
+    """
+    plan = _plans.get(model)
+    if plan is None:
+        plan = _plans[model] = _Plan(model)
+
+    values = {}
+    for name, alias, converter in plan.fields:
+        if alias in data:
+            value = data[alias]
+            if converter is not None and value is not None:
+                value = converter(value)
+            values[name] = value
+
+    fields_set = set(values)
+    if len(fields_set) < len(plan.fields):
+        for name, field in plan.model_fields:
+            if name not in values:
+                values[name] = field.get_default()
+
+    resource = model.__new__(model)
+    object.__setattr__(resource, "__dict__", values)
+    object.__setattr__(resource, "__fields_set__", fields_set)
+    if plan.has_private_attributes:
+        resource._init_private_attributes()
+    return resource
+
+
+class _Plan:
+    def __init__(self, model: Type[BaseModel]) -> None:
+        self.fields: List[Tuple[str, str, Optional[Converter]]] = [
+            (name, field.alias, _field_converter(field))
+            for name, field in model.__fields__.items()
+        ]
+        self.model_fields: List[Tuple[str, ModelField]] = list(model.__fields__.items())
+        self.has_private_attributes = bool(model.__private_attributes__)
+
+
+def _field_converter(field: ModelField) -> Optional[Converter]:
+    if field.shape == SHAPE_SINGLETON:
+        if field.sub_fields:
+            # Unions are rare in resources, leave them to pydantic
+            return lambda value: field.validate(value, {}, loc=field.name)[0]
+        return _type_converter(field.type_)
+
+    if not field.sub_fields:
+        return None
+
+    inner = _field_converter(field.sub_fields[0])
+    if inner is None:
+        return None
+
+    if field.shape in _LIST_SHAPES:
+        return lambda value: [
+            inner(item) if item is not None else None for item in value
+        ]
+
+    if field.shape in _DICT_SHAPES:
+        return lambda value: {
+            key: inner(item) if item is not None else None
+            for key, item in value.items()
+        }
+
+    return None
+
+
+def _type_converter(type_: Any) -> Optional[Converter]:
+    if isclass(type_) and issubclass(type_, BaseModel):
+        return lambda value: (
+            construct_resource(type_, value) if isinstance(value, dict) else value
+        )
+
+    if type_ is Decimal:
+        return _to_decimal
+
+    if type_ is datetime:
+        return parse_datetime
+
+    if type_ is str:
+        return _to_str
+
+    return None
+
+
+def _to_decimal(value: Any) -> Decimal:
+    if isinstance(value, Decimal):
+        return value
+
+    return Decimal(value if isinstance(value, (str, int)) else str(value))
+
+
+def _to_str(value: Any) -> str:
+    return value if type(value) is str else str(value)
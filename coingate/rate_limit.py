@@ -0,0 +1,236 @@
+import asyncio
+import math
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Dict, Mapping, Optional, Union
+from urllib.parse import urlsplit
+
+
+@dataclass(frozen=True)
+class BucketStats:
+    """Snapshot of a token bucket usage.
+
+    :param int `queue_depth`: Number of callers currently waiting for a token
+    :param int `acquired`: Number of tokens handed out so far
+    :param int `delayed`: Number of callers which had to wait for a token
+    :param float `total_wait`: Total time in seconds callers spent waiting
+    :param float `max_wait`: Longest single wait in seconds
+
+    """
+
+    queue_depth: int
+    acquired: int
+    delayed: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def average_wait(self) -> float:
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+
+class TokenBucket:
+    """Token bucket which refills `rate` tokens per second up to `capacity`.
+
+    Each caller reserves a token up front and then sleeps until the token is
+    due, so callers are served in the order they arrived.
+
+    :param float `rate`: Tokens added per second
+    :param Optional[int] `capacity`: Maximum burst size. Default: `rate` rounded up, at least 1
+
+    """
+
+    def __init__(self, rate: float, capacity: Optional[int] = None) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+
+        self._rate = rate
+        self._capacity = float(capacity or max(1, math.ceil(rate)))
+        self._tokens = self._capacity
+        self._updated_at = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+        self._queue_depth = 0
+        self._acquired = 0
+        self._delayed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def capacity(self) -> float:
+        return self._capacity
+
+    def acquire(self) -> float:
+        """Blocks until a token is available. Returns time waited in seconds."""
+        wait = self._reserve()
+        if wait > 0:
+            try:
+                time.sleep(wait)
+            finally:
+                self._release_waiter()
+
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Same as :meth:`acquire`, but does not block the event loop."""
+        wait = self._reserve()
+        if wait > 0:
+            try:
+                await asyncio.sleep(wait)
+            finally:
+                self._release_waiter()
+
+        return wait
+
+    def pause(self, seconds: float) -> None:
+        """Holds back every caller for the given number of seconds, e.g. when server asked to retry later."""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def stats(self) -> BucketStats:
+        with self._lock:
+            return BucketStats(
+                queue_depth=self._queue_depth,
+                acquired=self._acquired,
+                delayed=self._delayed,
+                total_wait=self._total_wait,
+                max_wait=self._max_wait,
+            )
+
+    def _reserve(self) -> float:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated_at) * self._rate
+            )
+            self._updated_at = now
+
+            # Tokens may go negative: every reserved but not yet available
+            # token pushes the next caller further back in the queue.
+            self._tokens -= 1
+            wait = max(-self._tokens / self._rate, self._paused_until - now, 0.0)
+
+            self._acquired += 1
+            if wait > 0:
+                self._queue_depth += 1
+                self._delayed += 1
+                self._total_wait += wait
+                self._max_wait = max(self._max_wait, wait)
+
+            return wait
+
+    def _release_waiter(self) -> None:
+        with self._lock:
+            self._queue_depth -= 1
+
+
+class RateLimiter:
+    """Client side rate limiter with separate token buckets per endpoint group.
+
+    Endpoint group is the first path segment after API version (`orders`,
+    `rates`, `ledger`, `withdrawals`, ...), except for order refunds
+    (`v2/orders/{id}/refunds`) which belong to `refunds` group.
+    Endpoints of groups without own bucket use `default` bucket, or are not
+    limited at all if `default` is not set.
+
+    :param Mapping[str, TokenBucket] `groups`: Token buckets by endpoint group
+    :param Optional[TokenBucket] `default`: Token bucket for other endpoints
+
+    Basic Usage::
+      >>> limiter = RateLimiter(
+      ...     {"orders": TokenBucket(5, 10), "refunds": TokenBucket(1), "rates": TokenBucket(20)}
+      ... )
+      >>> client.set_rate_limiter(limiter)
+
+    """
+
+    DEFAULT_GROUP = "default"
+
+    def __init__(
+        self,
+        groups: Optional[Mapping[str, TokenBucket]] = None,
+        *,
+        default: Optional[TokenBucket] = None,
+    ) -> None:
+        self._groups = dict(groups or {})
+        self._default = default
+
+    def bucket_for(self, url: Union[str, bytes]) -> Optional[TokenBucket]:
+        return self._groups.get(endpoint_group(url), self._default)
+
+    def acquire(self, url: Union[str, bytes]) -> float:
+        bucket = self.bucket_for(url)
+        return bucket.acquire() if bucket is not None else 0.0
+
+    async def acquire_async(self, url: Union[str, bytes]) -> float:
+        bucket = self.bucket_for(url)
+        return await bucket.acquire_async() if bucket is not None else 0.0
+
+    def observe(self, url: Union[str, bytes], headers: Mapping[str, str]) -> None:
+        """Pauses bucket of the endpoint if response headers say that limit was reached."""
+        bucket = self.bucket_for(url)
+        if bucket is None:
+            return
+
+        delay = retry_delay_from_headers(headers)
+        if delay:
+            bucket.pause(delay)
+
+    def stats(self) -> Dict[str, BucketStats]:
+        stats = {group: bucket.stats() for group, bucket in self._groups.items()}
+        if self._default is not None:
+            stats[self.DEFAULT_GROUP] = self._default.stats()
+
+        return stats
+
+
+def endpoint_group(url: Union[str, bytes]) -> str:
+    path = url.decode() if isinstance(url, bytes) else url
+    segments = [segment for segment in urlsplit(path).path.split("/") if segment]
+    if segments and segments[0] == "v2":
+        segments = segments[1:]
+
+    if not segments:
+        return RateLimiter.DEFAULT_GROUP
+
+    if segments[0] == "orders" and "refunds" in segments:
+        return "refunds"
+
+    return segments[0]
+
+
+def retry_delay_from_headers(headers: Mapping[str, str]) -> Optional[float]:
+    """Returns number of seconds to hold back requests, based on `Retry-After` or `X-RateLimit-*` headers."""
+    retry_after = headers.get("Retry-After")
+    if retry_after:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            try:
+                return max(
+                    parsedate_to_datetime(retry_after).timestamp() - time.time(), 0.0
+                )
+            except (TypeError, ValueError):
+                return None
+
+    remaining = headers.get("X-RateLimit-Remaining")
+    reset = headers.get("X-RateLimit-Reset")
+    if remaining is None or reset is None:
+        return None
+
+    try:
+        if int(remaining) > 0:
+            return None
+        reset_at = float(reset)
+    except ValueError:
+        return None
+
+    # Reset is either number of seconds left or a unix timestamp
+    return max(reset_at - time.time(), 0.0) if reset_at > 1e9 else reset_at
@@ -0,0 +1,260 @@
+import threading
+import time
+from decimal import Decimal
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from typing_extensions import Literal
+
+from .resources.public import ExchangesRates, NestedCurrencyObject
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+if TYPE_CHECKING:
+    from .client import CoinGate
+
+
+class ExchangeRateCache:
+    """Keeps a snapshot of all CoinGate exchange rates (`v2/rates`) and answers pair lookups from memory.
+
+    Snapshot is considered fresh for `ttl` seconds. For `stale_ttl` seconds
+    after that, lookups keep returning the stale snapshot while a single
+    background refresh is running, so callers never wait for the API once the
+    cache is warm. Older snapshots are refreshed before answering.
+
+    :param CoinGate `client`
+    :param float `ttl`: Number of seconds snapshot is fresh. Default: 60
+    :param float `stale_ttl`: Number of seconds stale snapshot may be served while refreshing. Default: 300
+
+    Basic Usage::
+      >>> client = CoinGate()
+      >>> rates = ExchangeRateCache(client, ttl=30)
+      >>> rates.merchant_rate("EUR", "BTC")
+      Decimal('0.0000472')
+
+    """
+
+    def __init__(
+        self,
+        client: "CoinGate",
+        *,
+        ttl: float = 60,
+        stale_ttl: float = 300,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._client = client
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        self._clock = clock
+
+        self._rates: Optional[ExchangesRates] = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._background_lock = threading.Lock()
+
+        self.last_error: Optional[Exception] = None
+
+    @property
+    def age(self) -> Optional[float]:
+        """Number of seconds since snapshot was fetched, `None` if nothing is cached yet."""
+        return None if self._rates is None else self._clock() - self._fetched_at
+
+    def merchant_rate(self, from_currency: str, to_currency: str) -> Optional[Decimal]:
+        """Exchange rate for merchant, same as :meth:`coingate.services.public.PublicService.get_exchange_rate_for_merchant`."""
+        return self._lookup(self.rates().merchant, from_currency, to_currency)
+
+    def trader_rate(
+        self, kind: Literal["buy", "sell"], from_currency: str, to_currency: str
+    ) -> Optional[Decimal]:
+        """Exchange rate for trader, same as :meth:`coingate.services.public.PublicService.get_exchange_rate_for_trader`."""
+        trader = self.rates().trader
+        rates = trader.buy if kind == "buy" else trader.sell
+        return self._lookup(rates, from_currency, to_currency)
+
+    def rates(self) -> ExchangesRates:
+        """Returns cached snapshot, fetching or refreshing it when needed."""
+        rates, age = self._rates, self.age
+        if rates is None or age is None or age >= self._ttl + self._stale_ttl:
+            return self._refresh_expired()
+
+        if age >= self._ttl:
+            self._refresh_in_background()
+
+        return rates
+
+    def refresh(self) -> ExchangesRates:
+        """Fetches new snapshot regardless of its age."""
+        with self._lock:
+            return self._fetch()
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._rates = None
+
+    def _refresh_expired(self) -> ExchangesRates:
+        # Callers which waited for the lock reuse snapshot fetched meanwhile
+        with self._lock:
+            age = self.age
+            if self._rates is not None and age is not None and age < self._ttl:
+                return self._rates
+
+            return self._fetch()
+
+    def _fetch(self) -> ExchangesRates:
+        rates = self._client.public.get_all_exchange_rates()
+        self._rates, self._fetched_at = rates, self._clock()
+        self.last_error = None
+        return rates
+
+    def _refresh_in_background(self) -> None:
+        # Held until background refresh finishes, so only one runs at a time
+        if not self._background_lock.acquire(blocking=False):
+            return
+
+        threading.Thread(target=self._background_refresh, daemon=True).start()
+
+    def _background_refresh(self) -> None:
+        try:
+            with self._lock:
+                self._fetch()
+        except Exception as e:
+            # Keep serving stale snapshot, next lookup will try again
+            self.last_error = e
+        finally:
+            self._background_lock.release()
+
+    @staticmethod
+    def _lookup(
+        rates: NestedCurrencyObject, from_currency: str, to_currency: str
+    ) -> Optional[Decimal]:
+        return rates.get(from_currency.upper(), {}).get(to_currency.upper())
+
+
+class RateMatrix:
+    """Dense matrix of exchange rates for converting many amounts at once.
+
+    Built from output of :meth:`coingate.services.public.PublicService.get_merchant_exchange_rates`
+    or :meth:`coingate.services.public.PublicService.get_trader_exchange_rates`.
+    Rates are stored as `float64` with a currency to index map, missing rates
+    are `nan`. Original `Decimal` rates are kept for :meth:`convert_exact`,
+    which should be used for amounts that are actually charged.
+
+    Requires `numpy`.
+
+    :param Mapping[str, Mapping[str, Optional[Decimal]]] `rates`: Rates by source and target currency
+
+    Basic Usage::
+      >>> matrix = RateMatrix(client.public.get_merchant_exchange_rates())
+      >>> matrix.convert([10, 25.5, 99.99], "EUR", "BTC")
+      array([0.00133510, 0.00340451, 0.01334966])
+      >>> matrix.convert_exact(Decimal("99.99"), "EUR", "BTC", quantize=Decimal("1e-8"))
+      Decimal('0.01334966')
+
+    """
+
+    def __init__(self, rates: Mapping[str, Mapping[str, Optional[Decimal]]]) -> None:
+        if np is None:
+            raise ImportError(
+                "RateMatrix requires numpy, install it with `pip install numpy`"
+            )
+
+        currencies = set(rates)
+        for targets in rates.values():
+            currencies.update(targets)
+
+        self._currencies: Tuple[str, ...] = tuple(sorted(currencies))
+        self._index: Dict[str, int] = {
+            currency: index for index, currency in enumerate(self._currencies)
+        }
+        self._exact: Dict[Tuple[str, str], Decimal] = {}
+
+        size = len(self._currencies)
+        self._matrix = np.full((size, size), np.nan, dtype=np.float64)
+        np.fill_diagonal(self._matrix, 1.0)
+
+        for source, targets in rates.items():
+            row = self._index[source]
+            for target, rate in targets.items():
+                if rate is None:
+                    continue
+                rate = Decimal(rate)
+                self._exact[(source, target)] = rate
+                self._matrix[row, self._index[target]] = float(rate)
+
+    @property
+    def currencies(self) -> Tuple[str, ...]:
+        return self._currencies
+
+    @property
+    def matrix(self) -> Any:
+        """Read-only view of the underlying `numpy.ndarray`, indexed by :meth:`index_of`."""
+        view = self._matrix.view()
+        view.flags.writeable = False
+        return view
+
+    def index_of(self, currency: str) -> int:
+        try:
+            return self._index[currency.upper()]
+        except KeyError:
+            raise KeyError(f"Unknown currency: {currency}") from None
+
+    def rate(self, from_currency: str, to_currency: str) -> Optional[Decimal]:
+        """Exact rate, `None` if CoinGate does not provide it."""
+        from_currency, to_currency = from_currency.upper(), to_currency.upper()
+        if from_currency == to_currency and from_currency in self._index:
+            return Decimal(1)
+
+        return self._exact.get((from_currency, to_currency))
+
+    def convert(
+        self, amounts: Iterable[float], from_currency: str, to_currency: str
+    ) -> Any:
+        """Converts array of amounts in one vectorized operation. Returns `numpy.ndarray`, `nan` where rate is missing."""
+        rate = self._matrix[self.index_of(from_currency), self.index_of(to_currency)]
+        return np.asarray(amounts, dtype=np.float64) * rate
+
+    def convert_to_all(
+        self,
+        amounts: Iterable[float],
+        from_currency: str,
+        to_currencies: Optional[Sequence[str]] = None,
+    ) -> Any:
+        """Converts array of amounts to every target currency.
+
+        Returns `numpy.ndarray` of shape `(len(amounts), len(to_currencies))`.
+        When `to_currencies` are not given, columns follow :attr:`currencies`.
+
+        """
+        row = self._matrix[self.index_of(from_currency)]
+        if to_currencies is not None:
+            row = row[[self.index_of(currency) for currency in to_currencies]]
+
+        return np.multiply.outer(np.asarray(amounts, dtype=np.float64), row)
+
+    def convert_exact(
+        self,
+        amount: Decimal,
+        from_currency: str,
+        to_currency: str,
+        *,
+        quantize: Optional[Decimal] = None,
+    ) -> Optional[Decimal]:
+        """Converts single amount using exact `Decimal` arithmetic, optionally quantized (e.g. `Decimal("1e-8")`)."""
+        rate = self.rate(from_currency, to_currency)
+        if rate is None:
+            return None
+
+        converted = Decimal(amount) * rate
+        return converted.quantize(quantize) if quantize is not None else converted
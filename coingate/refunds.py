@@ -0,0 +1,330 @@
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from .bulk import BulkResults, run_concurrently
+from .catalog import CurrencyCatalog
+from .exceptions import RefundIsNotValidException
+from .resources.ledger import LedgerAccount
+from .resources.order import Order
+from .resources.refund import Refund
+
+if TYPE_CHECKING:
+    from .client import CoinGate
+    from .rates import ExchangeRateCache
+
+
+# Refunds in these statuses were not paid out and do not count as refunded
+_VOID_REFUND_STATUSES = frozenset({"rejected", "failed", "canceled"})
+
+
+class RefundValidationError(RefundIsNotValidException):
+    """Refund rejected before sending it, for a reason CoinGate would reject it with `RefundIsNotValid`."""
+
+    def __init__(self, message: str) -> None:
+        super().__init__("RefundIsNotValid", 422, message, [message])
+
+
+@dataclass(frozen=True)
+class RefundRequest:
+    """Refund of an order, with currency and platform given by symbol and `id_name` instead of ids.
+
+    :param int `order_id`: ID of the order to be refunded
+    :param Decimal `amount`: Requesting amount in order price currency to refund
+    :param str `address`: Cryptocurrency address to which the refund will be sent
+    :param str `currency`: Symbol of the currency in which the refund will be issued, e.g. `USDT`
+    :param str `platform`: `id_name` of the platform of the currency, e.g. `ethereum`
+    :param str `reason`: Reason for issuing the refund
+    :param str `email`: Customer will receive updates on refund status to this email
+    :param Optional[str] `address_memo`
+    :param Optional[str] `ledger_account_id`: Default: active ledger account in `currency`
+
+    """
+
+    order_id: int
+    amount: Decimal
+    address: str
+    currency: str
+    platform: str
+    reason: str
+    email: str
+    address_memo: Optional[str] = None
+    ledger_account_id: Optional[str] = None
+
+
+@dataclass(frozen=True)
+class _PreparedRefund:
+    request: RefundRequest
+    currency_id: int
+    platform_id: int
+    ledger_account_id: str
+
+
+class BulkRefunder:
+    """Validates refunds locally and submits valid ones concurrently.
+
+    Before any refund is sent, every request is checked against data cached
+    in memory, so refunds CoinGate would reject do not cost a request:
+
+    * currency and platform are resolved to ids by `catalog` and must be enabled,
+    * the order must exist and be refundable, and refunds of one order in the
+      batch, together with refunds already made on it, must not exceed its price,
+    * the amount, converted to ledger account currency with `rates` when it
+      differs from order price currency, must be covered by the account
+      balance. Balances are reserved as refunds are validated, so one batch
+      cannot overdraw an account. Without a rate the balance is not checked.
+
+    Rejected requests get :class:`RefundValidationError`, failed submissions
+    get their exception, both in place of their refund.
+
+    Ledger balances are cached for `ledger_ttl` seconds and reloaded after
+    each batch. Orders are fetched concurrently, or read from `order_lookup`
+    (e.g. :meth:`coingate.mirror.SQLiteMirror.order`) when given. Refunds
+    already made on the orders are always fetched, as they change between
+    batches.
+
+    :param CoinGate `client`
+    :param Optional[CurrencyCatalog] `catalog`: Default: new :class:`coingate.catalog.CurrencyCatalog`
+    :param Optional[ExchangeRateCache] `rates`: Converts amounts to ledger currency. Default: None
+    :param int `concurrency`: Number of requests in flight. Default: 4
+    :param Optional[Callable[[int], Optional[Order]]] `order_lookup`: Returns order by id, `None` when not found
+    :param float `ledger_ttl`: Number of seconds ledger balances are cached. Default: 60
+
+    Basic Usage::
+      >>> refunder = BulkRefunder(client, catalog, rates=ExchangeRateCache(client))
+      >>> results = refunder.submit([
+      ...     RefundRequest(1001, Decimal("10"), "0xabc", "USDT", "ethereum", "Chargeback", "a@b.com"),
+      ... ])
+      >>> results.succeeded, results.errors
+
+    """
+
+    def __init__(
+        self,
+        client: "CoinGate",
+        catalog: Optional[CurrencyCatalog] = None,
+        *,
+        rates: Optional["ExchangeRateCache"] = None,
+        concurrency: int = 4,
+        order_lookup: Optional[Callable[[int], Optional[Order]]] = None,
+        ledger_ttl: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._client = client
+        self._catalog = catalog if catalog is not None else CurrencyCatalog(client)
+        self._rates = rates
+        self._concurrency = concurrency
+        self._order_lookup = order_lookup
+        self._ledger_ttl = ledger_ttl
+        self._clock = clock
+
+        self._accounts: Optional[Dict[str, LedgerAccount]] = None
+        self._accounts_loaded_at = 0.0
+        self._lock = threading.Lock()
+
+        self.rejected = 0
+
+    def refresh_ledger(self) -> Dict[str, LedgerAccount]:
+        """Loads ledger accounts from API, by id."""
+        accounts = {account.id: account for account in self._client.ledger.iter_all()}
+        with self._lock:
+            self._accounts, self._accounts_loaded_at = accounts, self._clock()
+        return accounts
+
+    def validate(self, requests: Iterable[RefundRequest]) -> List[Optional[Exception]]:
+        """Checks requests without sending them. Returns error of every request, `None` for valid ones."""
+        prepared = self._prepare(list(requests))
+        return [r if isinstance(r, Exception) else None for r in prepared]
+
+    def submit(self, requests: Iterable[RefundRequest]) -> BulkResults[Refund]:
+        """Validates requests and creates valid refunds concurrently. Results are aligned to requests."""
+        prepared = self._prepare(list(requests))
+        valid = {i: p for i, p in enumerate(prepared) if isinstance(p, _PreparedRefund)}
+        results: Dict[int, Union[Refund, Exception]] = {
+            i: p for i, p in enumerate(prepared) if isinstance(p, Exception)
+        }
+        self.rejected += sum(
+            isinstance(r, RefundValidationError) for r in results.values()
+        )
+
+        if valid:
+            created = run_concurrently(
+                self._create, list(valid.values()), concurrency=self._concurrency
+            )
+            results.update(zip(valid, created))
+            # Balances changed, next batch must not trust them
+            with self._lock:
+                self._accounts = None
+
+        return BulkResults([results[i] for i in range(len(prepared))])
+
+    def _prepare(
+        self, requests: Sequence[RefundRequest]
+    ) -> List[Union[_PreparedRefund, Exception]]:
+        order_ids = {r.order_id for r in requests}
+        orders = self._load_orders(order_ids)
+        already_refunded = self._load_refunded_amounts(order_ids)
+        accounts = self._ledger_accounts()
+        available = {id: account.balance for id, account in accounts.items()}
+        refunded: Dict[int, Decimal] = defaultdict(Decimal)
+
+        prepared: List[Union[_PreparedRefund, Exception]] = []
+        for request in requests:
+            try:
+                prepared.append(
+                    self._prepare_one(
+                        request,
+                        orders[request.order_id],
+                        already_refunded[request.order_id],
+                        accounts,
+                        available,
+                        refunded,
+                    )
+                )
+            except Exception as e:
+                prepared.append(e)
+
+        return prepared
+
+    def _prepare_one(
+        self,
+        request: RefundRequest,
+        order: Union[Order, Exception, None],
+        already_refunded: Union[Decimal, Exception],
+        accounts: Dict[str, LedgerAccount],
+        available: Dict[str, Decimal],
+        refunded: Dict[int, Decimal],
+    ) -> _PreparedRefund:
+        if request.amount <= 0:
+            raise RefundValidationError("Amount must be greater than 0")
+
+        if isinstance(order, Exception):
+            raise order
+        if order is None:
+            raise RefundValidationError(f"Order {request.order_id} not found")
+        if not order.is_refundable:
+            raise RefundValidationError(f"Order {order.id} is not refundable")
+        if isinstance(already_refunded, Exception):
+            raise already_refunded
+        if already_refunded + refunded[order.id] + request.amount > order.price_amount:
+            message = f"Refunds of order {order.id} exceed its price {order.price_amount} {order.price_currency}"
+            if already_refunded:
+                message += f", {already_refunded} of it is already refunded"
+            raise RefundValidationError(message)
+
+        pair = self._catalog.pair(request.currency, request.platform)
+        currency_id = self._catalog.currency_id(request.currency)
+        if pair is None or not pair.enabled or currency_id is None:
+            raise RefundValidationError(
+                f"{request.currency} is not available on {request.platform}"
+            )
+
+        account = self._ledger_account(request, accounts)
+        amount = self._convert(
+            request.amount, order.price_currency, account.currency.symbol
+        )
+        if amount is not None:
+            if amount > available[account.id]:
+                raise RefundValidationError(
+                    f"Ledger account {account.id} balance {available[account.id]} {account.currency.symbol} is lower than {amount}"
+                )
+            available[account.id] -= amount
+
+        refunded[order.id] += request.amount
+        return _PreparedRefund(request, currency_id, pair.id, account.id)
+
+    def _ledger_account(
+        self, request: RefundRequest, accounts: Dict[str, LedgerAccount]
+    ) -> LedgerAccount:
+        symbol = request.currency.upper()
+        if request.ledger_account_id is not None:
+            account = accounts.get(request.ledger_account_id)
+            if account is None:
+                raise RefundValidationError(
+                    f"Ledger account {request.ledger_account_id} not found"
+                )
+            if account.currency.symbol.upper() != symbol:
+                raise RefundValidationError(
+                    f"Ledger account {account.id} is in {account.currency.symbol}, not {symbol}"
+                )
+            return account
+
+        for account in accounts.values():
+            if account.currency.symbol.upper() == symbol and account.status == "active":
+                return account
+
+        raise RefundValidationError(f"No active ledger account in {symbol}")
+
+    def _convert(
+        self, amount: Decimal, from_currency: str, to_currency: str
+    ) -> Optional[Decimal]:
+        if from_currency.upper() == to_currency.upper():
+            return amount
+        if self._rates is None:
+            return None
+
+        rate = self._rates.merchant_rate(from_currency, to_currency)
+        return amount * rate if rate is not None else None
+
+    def _load_orders(
+        self, order_ids: Iterable[int]
+    ) -> Dict[int, Union[Order, Exception, None]]:
+        ids = list(order_ids)
+        lookup = self._order_lookup or self._client.order.get
+        orders = run_concurrently(lookup, ids, concurrency=self._concurrency)
+        return dict(zip(ids, orders))
+
+    def _load_refunded_amounts(
+        self, order_ids: Iterable[int]
+    ) -> Dict[int, Union[Decimal, Exception]]:
+        ids = list(order_ids)
+        amounts = run_concurrently(
+            self._refunded_amount, ids, concurrency=self._concurrency
+        )
+        return dict(zip(ids, amounts))
+
+    def _refunded_amount(self, order_id: int) -> Decimal:
+        return sum(
+            (
+                refund.request_amount
+                for refund in self._client.refund.iter_order_refunds(order_id)
+                if refund.status not in _VOID_REFUND_STATUSES
+            ),
+            Decimal(0),
+        )
+
+    def _ledger_accounts(self) -> Dict[str, LedgerAccount]:
+        accounts = self._accounts
+        if (
+            accounts is None
+            or self._clock() - self._accounts_loaded_at >= self._ledger_ttl
+        ):
+            accounts = self.refresh_ledger()
+
+        return accounts
+
+    def _create(self, prepared: _PreparedRefund) -> Refund:
+        request = prepared.request
+        return self._client.refund.create_order_refund(
+            request.order_id,
+            request.amount,
+            request.address,
+            prepared.currency_id,
+            prepared.platform_id,
+            request.reason,
+            request.email,
+            prepared.ledger_account_id,
+            address_memo=request.address_memo,
+        )
@@ -0,0 +1,29 @@
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Optional
+
+from pydantic import BaseModel, validator
+
+
+class OrderCallback(BaseModel):
+    """Payment callback, sent by CoinGate to `callback_url` of an order when its status changes."""
+
+    id: int
+    order_id: Optional[str]
+    status: str
+    price_amount: Decimal
+    price_currency: str
+    receive_currency: str
+    receive_amount: Optional[Decimal]
+    pay_amount: Optional[Decimal]
+    pay_currency: Optional[str]
+    underpaid_amount: Optional[Decimal]
+    overpaid_amount: Optional[Decimal]
+    is_refundable: Optional[bool]
+    created_at: datetime
+    token: Optional[str]
+
+    @validator("*", pre=True)
+    def empty_string_to_none(cls, value: Any) -> Any:
+        # Form encoding has no null, missing values are sent as empty strings
+        return None if value == "" else value
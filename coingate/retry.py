@@ -0,0 +1,223 @@
+import asyncio
+import math
+import random
+import threading
+import time
+from collections import deque
+from typing import (
+    Awaitable,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
+
+import requests
+
+from .exceptions import InternalServerErrorException
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
+T = TypeVar("T")
+
+# Called with number of failed attempts, their exception and delay before the next one
+RetryCallback = Callable[[int, BaseException, float], None]
+
+DEFAULT_RETRY_ON: Tuple[Type[BaseException], ...] = (
+    InternalServerErrorException,
+    requests.ConnectionError,
+    requests.Timeout,
+)
+if httpx is not None:
+    DEFAULT_RETRY_ON += (httpx.TransportError,)
+
+
+class RetryStats:
+    """Timing of every attempt made under a retry policy.
+
+    Durations of the latest `window` attempts are kept for each attempt number
+    (1 - first try, 2 - first retry, ...), along with durations of whole calls
+    including backoff delays.
+
+    """
+
+    def __init__(self, window: int = 1024) -> None:
+        self._window = window
+        self._lock = threading.Lock()
+        self.calls = 0
+        self.retries = 0
+        self.exhausted = 0
+        self._attempts: Dict[int, Deque[float]] = {}
+        self._calls: Deque[float] = deque(maxlen=window)
+
+    def record_attempt(self, attempt: int, duration: float) -> None:
+        with self._lock:
+            if attempt > 1:
+                self.retries += 1
+            durations = self._attempts.get(attempt)
+            if durations is None:
+                durations = self._attempts[attempt] = deque(maxlen=self._window)
+            durations.append(duration)
+
+    def record_call(self, duration: float, *, exhausted: bool = False) -> None:
+        with self._lock:
+            self.calls += 1
+            if exhausted:
+                self.exhausted += 1
+            self._calls.append(duration)
+
+    def attempt_durations(self, attempt: int) -> Tuple[float, ...]:
+        with self._lock:
+            return tuple(self._attempts.get(attempt, ()))
+
+    def percentile(self, q: float, *, attempt: Optional[int] = None) -> Optional[float]:
+        """Returns q-th percentile (0-100) of call durations, or of given attempt durations."""
+        with self._lock:
+            values = sorted(
+                self._calls if attempt is None else self._attempts.get(attempt, ())
+            )
+
+        if not values:
+            return None
+
+        index = min(len(values) - 1, max(0, math.ceil(q / 100 * len(values)) - 1))
+        return values[index]
+
+
+class RetryPolicy:
+    """Retries failed requests with exponential backoff and full jitter.
+
+    Delay before n-th retry is a random value between 0 and
+    `min(max_delay, base_delay * 2 ** (n - 1))`.
+
+    :param int `max_attempts`: Maximum number of attempts, including the first one. Default: 3
+    :param float `base_delay`: Backoff base in seconds. Default: 0.5
+    :param float `max_delay`: Maximum backoff in seconds. Default: 10
+    :param Iterable[Type[BaseException]] `retry_on`: Exception classes which are retried. Default: internal server errors, timeouts and connection errors
+    :param Iterable[str] `methods`: HTTP methods which are retried. Default: GET only
+
+    Basic Usage::
+      >>> client = CoinGate('YOUR_API_KEY')
+      >>> client.set_retry_policy(RetryPolicy(max_attempts=5))
+
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        *,
+        base_delay: float = 0.5,
+        max_delay: float = 10.0,
+        retry_on: Iterable[Type[BaseException]] = DEFAULT_RETRY_ON,
+        methods: Iterable[str] = ("get",),
+    ) -> None:
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retry_on = tuple(retry_on)
+        self.methods = frozenset(method.lower() for method in methods)
+        self.stats = RetryStats()
+
+    def is_retryable(self, method: Union[str, bytes]) -> bool:
+        if isinstance(method, bytes):
+            method = method.decode()
+
+        return method.lower() in self.methods
+
+    def should_retry(self, exception: BaseException, attempt: int) -> bool:
+        return attempt < self.max_attempts and isinstance(exception, self.retry_on)
+
+    def backoff(self, attempt: int) -> float:
+        """Returns delay in seconds before next attempt, after `attempt` attempts have failed."""
+        return random.uniform(
+            0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        )
+
+    def call(
+        self,
+        method: Union[str, bytes],
+        send: Callable[[], T],
+        *,
+        on_retry: Optional[RetryCallback] = None,
+    ) -> T:
+        if not self.is_retryable(method):
+            return send()
+
+        started = time.perf_counter()
+        attempt = 1
+        while True:
+            attempt_started = time.perf_counter()
+            try:
+                result = send()
+            except Exception as e:
+                self.stats.record_attempt(
+                    attempt, time.perf_counter() - attempt_started
+                )
+                if not self.should_retry(e, attempt):
+                    self.stats.record_call(
+                        time.perf_counter() - started,
+                        exhausted=isinstance(e, self.retry_on),
+                    )
+                    raise
+
+                delay = self.backoff(attempt)
+                if on_retry is not None:
+                    on_retry(attempt, e, delay)
+                time.sleep(delay)
+                attempt += 1
+            else:
+                self.stats.record_attempt(
+                    attempt, time.perf_counter() - attempt_started
+                )
+                self.stats.record_call(time.perf_counter() - started)
+                return result
+
+    async def acall(
+        self,
+        method: Union[str, bytes],
+        send: Callable[[], Awaitable[T]],
+        *,
+        on_retry: Optional[RetryCallback] = None,
+    ) -> T:
+        if not self.is_retryable(method):
+            return await send()
+
+        started = time.perf_counter()
+        attempt = 1
+        while True:
+            attempt_started = time.perf_counter()
+            try:
+                result = await send()
+            except Exception as e:
+                self.stats.record_attempt(
+                    attempt, time.perf_counter() - attempt_started
+                )
+                if not self.should_retry(e, attempt):
+                    self.stats.record_call(
+                        time.perf_counter() - started,
+                        exhausted=isinstance(e, self.retry_on),
+                    )
+                    raise
+
+                delay = self.backoff(attempt)
+                if on_retry is not None:
+                    on_retry(attempt, e, delay)
+                await asyncio.sleep(delay)
+                attempt += 1
+            else:
+                self.stats.record_attempt(
+                    attempt, time.perf_counter() - attempt_started
+                )
+                self.stats.record_call(time.perf_counter() - started)
+                return result
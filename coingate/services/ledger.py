@@ -1,5 +1,11 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
+from ..pagination import (
+    BulkPages,
+    fetch_pages_concurrently,
+    iterate_pages,
+    iterate_streamed_pages,
+)
 from ..resources.ledger import LedgerAccount, PaginatedLedgerAccounts
 
 if TYPE_CHECKING:
@@ -22,8 +28,8 @@ class LedgerService:
           >>> client.ledger.get('ledger_id')
 
         """
-        response = self._client.request("get", f"v2/ledger/accounts/{id}").json()
-        return LedgerAccount(**response)
+        response = self._client.request_json("get", f"v2/ledger/accounts/{id}")
+        return self._client.parse_resource(LedgerAccount, response)
 
     def get_all(
         self, *, page: Optional[int] = None, per_page: Optional[int] = None
@@ -40,8 +46,62 @@ class LedgerService:
           >>> client.ledger.get_all()
 
         """
-        response = self._client.request(
+        response = self._client.request_json(
             "get", "v2/ledger/accounts", data={"page": page, "per_page": per_page}
-        ).json()
+        )
 
-        return PaginatedLedgerAccounts(**response)
+        return self._client.parse_resource(PaginatedLedgerAccounts, response)
+
+    def iter_all(
+        self, *, per_page: Optional[int] = None, stream: bool = False
+    ) -> Iterator[LedgerAccount]:
+        """Iterates over ledger accounts of every page. Next page is fetched in background while current one is consumed.
+        With `stream=True` pages are fetched one by one instead and every account is built as soon as it is received.
+
+        :param Optional[int] `per_page`: Number of accounts per page. Max: 100. Default: 100
+        :param bool `stream`: Decode accounts while response is received. Default: False
+
+        :rtype Iterator[:class:`<coingate.resources.ledger.LedgerAccount>`]
+
+        Basic Usage::
+          >>> client = CoinGate('YOUR_API_KEY')
+          >>> for account in client.ledger.iter_all():
+          ...     print(account.balance)
+
+        """
+        if stream:
+            return iterate_streamed_pages(
+                lambda page: self._client.stream_resources(
+                    LedgerAccount,
+                    "accounts",
+                    "get",
+                    "v2/ledger/accounts",
+                    data={"page": page, "per_page": per_page},
+                )
+            )
+
+        return iterate_pages(
+            lambda page: self.get_all(page=page, per_page=per_page),
+            lambda accounts: accounts.accounts,
+        )
+
+    def fetch_all(
+        self, *, workers: int = 4, per_page: Optional[int] = None
+    ) -> BulkPages[LedgerAccount]:
+        """Fetches ledger accounts of every page. Once the first page is received, remaining pages are fetched concurrently.
+
+        :param int `workers`: Number of pages fetched at the same time. Default: 4
+        :param Optional[int] `per_page`: Number of accounts per page. Max: 100. Default: 100
+
+        :rtype `:class:`<coingate.pagination.BulkPages>`
+
+        Basic Usage::
+          >>> client = CoinGate('YOUR_API_KEY')
+          >>> client.ledger.fetch_all()
+
+        """
+        return fetch_pages_concurrently(
+            lambda page: self.get_all(page=page, per_page=per_page),
+            lambda accounts: accounts.accounts,
+            workers=workers,
+        )
@@ -1,8 +1,30 @@
 from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING, Optional
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Mapping,
+    Optional,
+    Union,
+)
 
-from ..resources.order import Checkout, NewOrder, Order, PaginatedOrders
+from ..bulk import (
+    BulkResults,
+    find_duplicate_order_ids,
+    pending_order_ids,
+    reuse_existing_orders,
+    run_concurrently,
+)
+from ..pagination import (
+    BulkPages,
+    fetch_pages_concurrently,
+    iterate_pages,
+    iterate_streamed_pages,
+)
+from ..resources.order import BaseOrder, Checkout, NewOrder, Order, PaginatedOrders
 from ..utils import date_to_str_or_none
 
 if TYPE_CHECKING:
@@ -49,25 +71,83 @@ class OrderService:
           >>> client.order.create(Decimal('10'), 'EUR', 'EUR')
 
         """
-        response = self._client.request(
+        response = self._client.request_json(
             "post",
             "v2/orders",
-            data={
-                "order_id": order_id,
-                "price_amount": price_amount,
-                "price_currency": price_currency,
-                "receive_currency": receive_currency,
-                "title": title,
-                "description": description,
-                "callback_url": callback_url,
-                "cancel_url": cancel_url,
-                "success_url": success_url,
-                "token": token,
-                "purchaser_email": purchaser_email,
-            },
-        ).json()
-
-        return NewOrder(**response)
+            data=self._create_data(
+                price_amount,
+                price_currency,
+                receive_currency,
+                order_id=order_id,
+                title=title,
+                description=description,
+                callback_url=callback_url,
+                cancel_url=cancel_url,
+                success_url=success_url,
+                token=token,
+                purchaser_email=purchaser_email,
+            ),
+        )
+
+        return self._client.parse_resource(NewOrder, response)
+
+    def create_many(
+        self,
+        specs: Iterable[Mapping[str, Any]],
+        *,
+        concurrency: int = 4,
+        existing_since: Optional[datetime] = None,
+    ) -> BulkResults[BaseOrder]:
+        """Creates orders concurrently. Every spec holds keyword arguments of :meth:`create`.
+
+        Results are aligned to specs: a failed creation (e.g. `OrderIsNotValidException`) is returned
+        in place of its order instead of aborting the batch. A spec repeating merchant `order_id`
+        of an earlier spec is not sent and gets :class:`coingate.bulk.DuplicateOrderIdError`.
+
+        When retrying a batch, pass `existing_since` (e.g. start time of the first attempt): orders
+        created since then are listed first, and specs whose `order_id` is found get the existing
+        :class:`Order` instead of creating another invoice.
+
+        Requests go through the client's rate limiter, so `concurrency` only bounds requests in flight.
+
+        :param Iterable[Mapping[str, Any]] `specs`: Keyword arguments of :meth:`create`, one mapping per order
+        :param int `concurrency`: Number of orders created at the same time. Default: 4
+        :param Optional[datetime] `existing_since`: Skip specs whose `order_id` belongs to an order created since then
+
+        :rtype `:class:`<coingate.bulk.BulkResults>`
+
+        Basic Usage::
+          >>> client = CoinGate('YOUR_API_KEY')
+          >>> results = client.order.create_many(
+          ...     [{"price_amount": Decimal("10"), "price_currency": "EUR", "receive_currency": "EUR", "order_id": "shop-1"}],
+          ...     concurrency=8,
+          ... )
+          >>> results.succeeded, results.errors
+
+        """
+        specs = list(specs)
+        results: Dict[int, Union[BaseOrder, Exception]] = dict(
+            find_duplicate_order_ids(specs)
+        )
+
+        if existing_since is not None:
+            order_ids = pending_order_ids(specs, results)
+            existing: Dict[str, Order] = {}
+            if order_ids:
+                for order in self.iter_all(
+                    sort="created_at_asc", created_from=existing_since
+                ):
+                    if order.order_id in order_ids:
+                        existing.setdefault(order.order_id, order)
+            reuse_existing_orders(specs, results, existing)
+
+        pending = [i for i in range(len(specs)) if i not in results]
+        created = run_concurrently(
+            lambda i: self.create(**specs[i]), pending, concurrency=concurrency
+        )
+        results.update(zip(pending, created))
+
+        return BulkResults([results[i] for i in range(len(specs))])
 
     def checkout(
         self,
@@ -93,18 +173,18 @@ class OrderService:
           >>> client.order.checkout(123, 'EUR')
 
         """
-        response = self._client.request(
+        response = self._client.request_json(
             "post",
             f"v2/orders/{id}/checkout",
-            data={
-                "pay_currency": pay_currency,
-                "lightning_network": lightning_network,
-                "purchaser_email": purchaser_email,
-                "platform_id": platform_id,
-            },
-        ).json()
+            data=self._checkout_data(
+                pay_currency,
+                lightning_network=lightning_network,
+                purchaser_email=purchaser_email,
+                platform_id=platform_id,
+            ),
+        )
 
-        return Checkout(**response)
+        return self._client.parse_resource(Checkout, response)
 
     def get(self, id: int) -> Order:
         """Before making a GET order request, a user should have an already CREATED order, which can be paid or canceled.
@@ -119,8 +199,8 @@ class OrderService:
           >>> client.order.get(123)
 
         """
-        response = self._client.request("get", f"v2/orders/{id}").json()
-        return Order(**response)
+        response = self._client.request_json("get", f"v2/orders/{id}")
+        return self._client.parse_resource(Order, response)
 
     def get_all(
         self,
@@ -146,16 +226,161 @@ class OrderService:
           >>> client.order.get_all()
 
         """
-        response = self._client.request(
+        response = self._client.request_json(
             "get",
             "v2/orders",
-            params={
-                "per_page": per_page,
-                "page": page,
-                "sort": sort,
-                "created_at[from]": date_to_str_or_none(created_from),
-                "created_at[to]": date_to_str_or_none(created_to),
-            },
-        ).json()
-
-        return PaginatedOrders(**response)
+            params=self._get_all_params(per_page, page, sort, created_from, created_to),
+        )
+
+        return self._client.parse_resource(PaginatedOrders, response)
+
+    def iter_all(
+        self,
+        *,
+        per_page: Optional[int] = None,
+        sort: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+        stream: bool = False,
+    ) -> Iterator[Order]:
+        """Iterates over orders of every page. Next page is fetched in background while current one is consumed.
+        With `stream=True` pages are fetched one by one instead and every order is built as soon as it is received,
+        so memory usage does not depend on page size.
+
+        :param Optional[int] `per_page`: How many orders per page. Max: 100. Default: 100
+        :param Optional[str] `sort`: Sort orders by field. Available sort options: created_at_asc, created_at_desc. Default: created_at_desc
+        :param Optional[str] `created_from`: Where order creation time is equal or greater
+        :param Optional[str] `created_to`: Where order creation time is equal or greater
+        :param bool `stream`: Decode orders while response is received. Default: False
+
+        :rtype Iterator[:class:`<coingate.resources.order.Order>`]
+
+        Basic Usage::
+          >>> client = CoinGate('YOUR_API_KEY')
+          >>> for order in client.order.iter_all():
+          ...     print(order.id)
+
+        """
+        if stream:
+            return iterate_streamed_pages(
+                lambda page: self._client.stream_resources(
+                    Order,
+                    "orders",
+                    "get",
+                    "v2/orders",
+                    params=self._get_all_params(
+                        per_page, page, sort, created_from, created_to
+                    ),
+                )
+            )
+
+        return iterate_pages(
+            lambda page: self.get_all(
+                per_page=per_page,
+                page=page,
+                sort=sort,
+                created_from=created_from,
+                created_to=created_to,
+            ),
+            lambda orders: orders.orders,
+        )
+
+    def fetch_all(
+        self,
+        *,
+        workers: int = 4,
+        per_page: Optional[int] = None,
+        sort: Optional[str] = None,
+        created_from: Optional[datetime] = None,
+        created_to: Optional[datetime] = None,
+    ) -> BulkPages[Order]:
+        """Fetches orders of every page. Once the first page is received, remaining pages are fetched concurrently.
+        Orders are merged in page order without duplicates, pages which failed to load are reported in `failed_pages`.
+
+        :param int `workers`: Number of pages fetched at the same time. Default: 4
+        :param Optional[int] `per_page`: How many orders per page. Max: 100. Default: 100
+        :param Optional[str] `sort`: Sort orders by field. Available sort options: created_at_asc, created_at_desc. Default: created_at_desc
+        :param Optional[str] `created_from`: Where order creation time is equal or greater
+        :param Optional[str] `created_to`: Where order creation time is equal or greater
+
+        :rtype `:class:`<coingate.pagination.BulkPages>`
+
+        Basic Usage::
+          >>> client = CoinGate('YOUR_API_KEY')
+          >>> result = client.order.fetch_all(workers=8)
+          >>> result.items, result.failed_pages
+
+        """
+        return fetch_pages_concurrently(
+            lambda page: self.get_all(
+                per_page=per_page,
+                page=page,
+                sort=sort,
+                created_from=created_from,
+                created_to=created_to,
+            ),
+            lambda orders: orders.orders,
+            workers=workers,
+        )
+
+    # Request bodies and params are built here for AsyncOrderService as well
+
+    @staticmethod
+    def _create_data(
+        price_amount: Decimal,
+        price_currency: str,
+        receive_currency: str,
+        *,
+        order_id: Optional[str],
+        title: Optional[str],
+        description: Optional[str],
+        callback_url: Optional[str],
+        cancel_url: Optional[str],
+        success_url: Optional[str],
+        token: Optional[str],
+        purchaser_email: Optional[str],
+    ) -> Dict[str, Any]:
+        return {
+            "order_id": order_id,
+            "price_amount": price_amount,
+            "price_currency": price_currency,
+            "receive_currency": receive_currency,
+            "title": title,
+            "description": description,
+            "callback_url": callback_url,
+            "cancel_url": cancel_url,
+            "success_url": success_url,
+            "token": token,
+            "purchaser_email": purchaser_email,
+        }
+
+    @staticmethod
+    def _checkout_data(
+        pay_currency: str,
+        *,
+        lightning_network: Optional[bool],
+        purchaser_email: Optional[str],
+        platform_id: Optional[int],
+    ) -> Dict[str, Any]:
+        return {
+            "pay_currency": pay_currency,
+            "lightning_network": lightning_network,
+            "purchaser_email": purchaser_email,
+            "platform_id": platform_id,
+        }
+
+    @staticmethod
+    def _get_all_params(
+        per_page: Optional[int],
+        page: Optional[int],
+        sort: Optional[str],
+        created_from: Optional[datetime],
+        created_to: Optional[datetime],
+    ) -> Dict[str, Any]:
+        return {
+            "per_page": per_page,
+            "page": page,
+            "sort": sort,
+            "created_at[from]": date_to_str_or_none(created_from),
+            "created_at[to]": date_to_str_or_none(created_to),
+        }
@@ -61,10 +61,9 @@ class PublicService:
         self, sideType: str, from_currency: str, to_currency: str
     ) -> Optional[Decimal]:
         response = self._client.request(
-            "get", f"v2/rates/{sideType}/{from_currency}/{to_currency}"
-        ).text
-
-        return Decimal(response) if len(response) else None
+            "get", self._exchange_rate_endpoint(sideType, from_currency, to_currency)
+        )
+        return self._parse_exchange_rate(response.text)
 
     def get_all_exchange_rates(self) -> ExchangesRates:
         """Get current CoinGate exchange rates for Merchants and Traders
@@ -77,7 +76,7 @@ class PublicService:
 
         """
         response = self._get_exchange_rates()
-        return ExchangesRates(**response)
+        return self._client.parse_resource(ExchangesRates, response)
 
     def get_merchant_exchange_rates(self) -> NestedCurrencyObject:
         """Get current CoinGate exchange rates for Merchant
@@ -109,14 +108,13 @@ class PublicService:
         sideType = "trader" if kind is None else f"trader/{kind}"
         response = self._get_exchange_rates(sideType)
         return (
-            ExchangeTrader(**response)
+            self._client.parse_resource(ExchangeTrader, response)
             if kind is None
             else NestedCurrencyObject(response)
         )
 
     def _get_exchange_rates(self, sideType: Optional[str] = None) -> Dict[str, Any]:
-        endpoint = "v2/rates" if sideType is None else f"v2/rates/{sideType}"
-        return self._client.request("get", endpoint).json()
+        return self._client.request_json("get", self._exchange_rates_endpoint(sideType))
 
     def ping(self) -> Ping:
         """A health check endpoint for CoinGate API
@@ -128,8 +126,8 @@ class PublicService:
           >>> client.public.ping()
 
         """
-        response = self._client.request("get", "v2/ping").json()
-        return Ping(**response)
+        response = self._client.request_json("get", "v2/ping")
+        return self._client.parse_resource(Ping, response)
 
     def get_ip_addresses(self, separator: Optional[str] = None) -> str:
         """Get IP addresses of CoinGate servers
@@ -150,19 +148,19 @@ class PublicService:
 
     def get_currencies(
         self,
-        native: bool,
-        enabled: bool,
-        merchant_pay: bool,
-        merchant_receive: bool,
-        kind: Literal["crypto", "fiat"],
+        native: Optional[bool] = None,
+        enabled: Optional[bool] = None,
+        merchant_pay: Optional[bool] = None,
+        merchant_receive: Optional[bool] = None,
+        kind: Optional[Literal["crypto", "fiat"]] = None,
     ) -> List[PublicCurrency]:
-        """Retrieves all currencies.
+        """Retrieves all currencies. Filters which are not given are not applied.
 
-        :param bool `native`
-        :param bool `enabled`
-        :param bool `merchant_pay`
-        :param bool `merchant_receive`
-        :param Literal["crypto", "fiat"] `kind`
+        :param Optional[bool] `native`
+        :param Optional[bool] `enabled`
+        :param Optional[bool] `merchant_pay`
+        :param Optional[bool] `merchant_receive`
+        :param Optional[Literal["crypto", "fiat"]] `kind`
 
         :rtype List[:class:`<coingate.resources.public.PublicCurrency>`]
 
@@ -171,24 +169,23 @@ class PublicService:
           >>> client.public.get_currencies()
 
         """
-        response = self._client.request(
+        response = self._client.request_json(
             "get",
             "v2/currencies",
-            params={
-                "native": native,
-                "enabled": enabled,
-                "merchant_pay": merchant_pay,
-                "merchant_receive": merchant_receive,
-                "kind": kind,
-            },
-        ).json()
-
-        return [PublicCurrency(**currency) for currency in response]
-
-    def get_platforms(self, enabled: bool) -> List[PublicPlatform]:
+            params=self._currencies_params(
+                native, enabled, merchant_pay, merchant_receive, kind
+            ),
+        )
+
+        return [
+            self._client.parse_resource(PublicCurrency, currency)
+            for currency in response
+        ]
+
+    def get_platforms(self, enabled: Optional[bool] = None) -> List[PublicPlatform]:
         """Get all platforms
 
-        :param bool `enabled`: List only enabled platforms
+        :param Optional[bool] `enabled`: List only enabled platforms
 
         :rtype List[:class:`<coingate.resources.public.Platform>`]
 
@@ -197,8 +194,43 @@ class PublicService:
           >>> client.public.get_platforms()
 
         """
-        response = self._client.request(
+        response = self._client.request_json(
             "get", "v2/platforms", params={"enabled": enabled}
-        ).json()
+        )
 
-        return [PublicPlatform(**platform) for platform in response]
+        return [
+            self._client.parse_resource(PublicPlatform, platform)
+            for platform in response
+        ]
+
+    # Endpoints, params and parsing below are shared with AsyncPublicService
+
+    @staticmethod
+    def _exchange_rate_endpoint(
+        sideType: str, from_currency: str, to_currency: str
+    ) -> str:
+        return f"v2/rates/{sideType}/{from_currency}/{to_currency}"
+
+    @staticmethod
+    def _parse_exchange_rate(text: str) -> Optional[Decimal]:
+        return Decimal(text) if len(text) else None
+
+    @staticmethod
+    def _exchange_rates_endpoint(sideType: Optional[str]) -> str:
+        return "v2/rates" if sideType is None else f"v2/rates/{sideType}"
+
+    @staticmethod
+    def _currencies_params(
+        native: Optional[bool],
+        enabled: Optional[bool],
+        merchant_pay: Optional[bool],
+        merchant_receive: Optional[bool],
+        kind: Optional[str],
+    ) -> Dict[str, Any]:
+        return {
+            "native": native,
+            "enabled": enabled,
+            "merchant_pay": merchant_pay,
+            "merchant_receive": merchant_receive,
+            "kind": kind,
+        }
@@ -1,7 +1,13 @@
 from decimal import Decimal
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Optional
 
-from ..resources.refund import PaginatedRefunds, Refund
+from ..pagination import (
+    BulkPages,
+    fetch_pages_concurrently,
+    iterate_pages,
+    iterate_streamed_pages,
+)
+from ..resources.refund import PaginatedRefunds, PaginatedRefundsRefund, Refund
 
 if TYPE_CHECKING:
     from ..client import CoinGate
@@ -43,22 +49,22 @@ class RefundService:
           >>> client.refund.create_order_refund(1, Decimal('10'), 'addy', 1, 1, 'refund', 'email@email.com', 'id')
 
         """
-        res = self._client.request(
+        res = self._client.request_json(
             "post",
             f"v2/orders/{order_id}/refunds",
-            data={
-                "amount": amount,
-                "address": address,
-                "address_memo": address_memo,
-                "currency_id": currency_id,
-                "platform_id": platform_id,
-                "reason": reason,
-                "email": email,
-                "ledger_account_id": ledger_account_id,
-            },
-        ).json()
+            data=self._create_order_refund_data(
+                amount,
+                address,
+                currency_id,
+                platform_id,
+                reason,
+                email,
+                ledger_account_id,
+                address_memo=address_memo,
+            ),
+        )
 
-        return Refund(**res)
+        return self._client.parse_resource(Refund, res)
 
     def get_order_refund(self, order_id: int, id: int) -> Refund:
         """Retrieves a specific refund for an order.
@@ -73,8 +79,8 @@ class RefundService:
           >>> client.refund.get_order_refund(1, 1)
 
         """
-        res = self._client.request("get", f"v2/orders/{order_id}/refunds/{id}").json()
-        return Refund(**res)
+        res = self._client.request_json("get", f"v2/orders/{order_id}/refunds/{id}")
+        return self._client.parse_resource(Refund, res)
 
     def get_order_refunds(
         self, order_id: int, *, page: Optional[int] = 1, per_page: Optional[int] = 100
@@ -92,16 +98,16 @@ class RefundService:
           >>> client.refund.get_order_refunds(1)
 
         """
-        res = self._client.request(
+        res = self._client.request_json(
             "get",
             f"v2/orders/{order_id}/refunds",
             data={
                 "page": page,
                 "per_page": per_page,
             },
-        ).json()
+        )
 
-        return PaginatedRefunds(**res)
+        return self._client.parse_resource(PaginatedRefunds, res)
 
     def get_refunds(self, *, page: int = 1, per_page: int = 100) -> PaginatedRefunds:
         """Retrieves all refunds.
@@ -116,10 +122,144 @@ class RefundService:
           >>> client.refund.get_refunds()
 
         """
-        res = self._client.request(
+        res = self._client.request_json(
             "get",
             "v2/refunds",
             data={"page": page, "per_page": per_page},
-        ).json()
+        )
+
+        return self._client.parse_resource(PaginatedRefunds, res)
+
+    def iter_order_refunds(
+        self, order_id: int, *, per_page: int = 100, stream: bool = False
+    ) -> Iterator[PaginatedRefundsRefund]:
+        """Iterates over refunds of an order on every page. Next page is fetched in background while current one is consumed.
+        With `stream=True` pages are fetched one by one instead and every refund is built as soon as it is received.
+
+        :param int `order_id`: ID of the order to be refunded
+        :param int `per_page`: Number of refunds per page
+        :param bool `stream`: Decode refunds while response is received. Default: False
+
+        :rtype Iterator[:class:`<coingate.resources.refund.PaginatedRefundsRefund>`]
+
+        Basic Usage::
+          >>> client = CoinGate('YOUR_API_KEY')
+          >>> for refund in client.refund.iter_order_refunds(1):
+          ...     print(refund.status)
+
+        """
+        if stream:
+            return iterate_streamed_pages(
+                lambda page: self._client.stream_resources(
+                    PaginatedRefundsRefund,
+                    "refunds",
+                    "get",
+                    f"v2/orders/{order_id}/refunds",
+                    data={"page": page, "per_page": per_page},
+                )
+            )
 
-        return PaginatedRefunds(**res)
+        return iterate_pages(
+            lambda page: self.get_order_refunds(order_id, page=page, per_page=per_page),
+            lambda refunds: refunds.refunds,
+        )
+
+    def iter_refunds(
+        self, *, per_page: int = 100, stream: bool = False
+    ) -> Iterator[PaginatedRefundsRefund]:
+        """Iterates over all refunds on every page. Next page is fetched in background while current one is consumed.
+        With `stream=True` pages are fetched one by one instead and every refund is built as soon as it is received.
+
+        :param int `per_page`: Number of refunds per page
+        :param bool `stream`: Decode refunds while response is received. Default: False
+
+        :rtype Iterator[:class:`<coingate.resources.refund.PaginatedRefundsRefund>`]
+
+        Basic Usage::
+          >>> client = CoinGate('YOUR_API_KEY')
+          >>> for refund in client.refund.iter_refunds():
+          ...     print(refund.status)
+
+        """
+        if stream:
+            return iterate_streamed_pages(
+                lambda page: self._client.stream_resources(
+                    PaginatedRefundsRefund,
+                    "refunds",
+                    "get",
+                    "v2/refunds",
+                    data={"page": page, "per_page": per_page},
+                )
+            )
+
+        return iterate_pages(
+            lambda page: self.get_refunds(page=page, per_page=per_page),
+            lambda refunds: refunds.refunds,
+        )
+
+    def fetch_order_refunds(
+        self, order_id: int, *, workers: int = 4, per_page: int = 100
+    ) -> BulkPages[PaginatedRefundsRefund]:
+        """Fetches refunds of an order on every page. Once the first page is received, remaining pages are fetched concurrently.
+
+        :param int `order_id`: ID of the order to be refunded
+        :param int `workers`: Number of pages fetched at the same time. Default: 4
+        :param int `per_page`: Number of refunds per page
+
+        :rtype `:class:`<coingate.pagination.BulkPages>`
+
+        Basic Usage::
+          >>> client = CoinGate('YOUR_API_KEY')
+          >>> client.refund.fetch_order_refunds(1)
+
+        """
+        return fetch_pages_concurrently(
+            lambda page: self.get_order_refunds(order_id, page=page, per_page=per_page),
+            lambda refunds: refunds.refunds,
+            workers=workers,
+        )
+
+    def fetch_refunds(
+        self, *, workers: int = 4, per_page: int = 100
+    ) -> BulkPages[PaginatedRefundsRefund]:
+        """Fetches all refunds on every page. Once the first page is received, remaining pages are fetched concurrently.
+
+        :param int `workers`: Number of pages fetched at the same time. Default: 4
+        :param int `per_page`: Number of refunds per page
+
+        :rtype `:class:`<coingate.pagination.BulkPages>`
+
+        Basic Usage::
+          >>> client = CoinGate('YOUR_API_KEY')
+          >>> client.refund.fetch_refunds(workers=8)
+
+        """
+        return fetch_pages_concurrently(
+            lambda page: self.get_refunds(page=page, per_page=per_page),
+            lambda refunds: refunds.refunds,
+            workers=workers,
+        )
+
+    # Also builds the request of AsyncRefundService
+    @staticmethod
+    def _create_order_refund_data(
+        amount: Decimal,
+        address: str,
+        currency_id: int,
+        platform_id: int,
+        reason: str,
+        email: str,
+        ledger_account_id: str,
+        *,
+        address_memo: Optional[str],
+    ) -> Dict[str, Any]:
+        return {
+            "amount": amount,
+            "address": address,
+            "address_memo": address_memo,
+            "currency_id": currency_id,
+            "platform_id": platform_id,
+            "reason": reason,
+            "email": email,
+            "ledger_account_id": ledger_account_id,
+        }
@@ -1,5 +1,11 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Iterator, Optional
 
+from ..pagination import (
+    BulkPages,
+    fetch_pages_concurrently,
+    iterate_pages,
+    iterate_streamed_pages,
+)
 from ..resources.withdrawal import PaginatedWithdrawals, Withdrawal
 
 if TYPE_CHECKING:
@@ -22,12 +28,17 @@ class WithdrawalService:
           >>> client.withdrawal.get(1)
 
         """
-        response = self._client.request("get", f"v2/withdrawals/{id}").json()
-        return Withdrawal(**response)
+        response = self._client.request_json("get", f"v2/withdrawals/{id}")
+        return self._client.parse_resource(Withdrawal, response)
 
-    def get_all(self) -> PaginatedWithdrawals:
+    def get_all(
+        self, *, page: Optional[int] = None, per_page: Optional[int] = None
+    ) -> PaginatedWithdrawals:
         """Retrieves all withdrawals.
 
+        :param Optional[int] `page`: Current page number. Default: 1
+        :param Optional[int] `per_page`: Number of withdrawals per page. Max: 100. Default: 100
+
         :rtype `:class:`<coingate.resources.withdrawal.PaginatedWithdrawals>`
 
         Basic Usage::
@@ -35,5 +46,62 @@ class WithdrawalService:
           >>> client.withdrawal.get_all()
 
         """
-        response = self._client.request("get", "v2/withdrawals").json()
-        return PaginatedWithdrawals(**response)
+        response = self._client.request_json(
+            "get", "v2/withdrawals", params={"page": page, "per_page": per_page}
+        )
+
+        return self._client.parse_resource(PaginatedWithdrawals, response)
+
+    def iter_all(
+        self, *, per_page: Optional[int] = None, stream: bool = False
+    ) -> Iterator[Withdrawal]:
+        """Iterates over withdrawals of every page. Next page is fetched in background while current one is consumed.
+        With `stream=True` pages are fetched one by one instead and every withdrawal is built as soon as it is received.
+
+        :param Optional[int] `per_page`: Number of withdrawals per page. Max: 100. Default: 100
+        :param bool `stream`: Decode withdrawals while response is received. Default: False
+
+        :rtype Iterator[:class:`<coingate.resources.withdrawal.Withdrawal>`]
+
+        Basic Usage::
+          >>> client = CoinGate('YOUR_API_KEY')
+          >>> for withdrawal in client.withdrawal.iter_all():
+          ...     print(withdrawal.status)
+
+        """
+        if stream:
+            return iterate_streamed_pages(
+                lambda page: self._client.stream_resources(
+                    Withdrawal,
+                    "withdrawals",
+                    "get",
+                    "v2/withdrawals",
+                    params={"page": page, "per_page": per_page},
+                )
+            )
+
+        return iterate_pages(
+            lambda page: self.get_all(page=page, per_page=per_page),
+            lambda withdrawals: withdrawals.withdrawals,
+        )
+
+    def fetch_all(
+        self, *, workers: int = 4, per_page: Optional[int] = None
+    ) -> BulkPages[Withdrawal]:
+        """Fetches withdrawals of every page. Once the first page is received, remaining pages are fetched concurrently.
+
+        :param int `workers`: Number of pages fetched at the same time. Default: 4
+        :param Optional[int] `per_page`: Number of withdrawals per page. Max: 100. Default: 100
+
+        :rtype `:class:`<coingate.pagination.BulkPages>`
+
+        Basic Usage::
+          >>> client = CoinGate('YOUR_API_KEY')
+          >>> client.withdrawal.fetch_all()
+
+        """
+        return fetch_pages_concurrently(
+            lambda page: self.get_all(page=page, per_page=per_page),
+            lambda withdrawals: withdrawals.withdrawals,
+            workers=workers,
+        )
@@ -0,0 +1,138 @@
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable, Mapping, Optional, Union
+
+from .http_cache import ResponseCache
+
+
+class _Call:
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """Coalesces identical concurrent `GET` requests into one.
+
+    While a request is in flight, identical requests (same method, URL,
+    params and body) made from other threads wait for it and receive the same
+    response, or the same exception, instead of calling the API themselves.
+    Requests of parsed JSON bodies share the parsed body as well. Requests
+    made after it completes are sent again, nothing is cached. Responses and
+    parsed bodies are shared between all callers, do not mutate them.
+
+    `saved` counts requests which were answered by a call of another caller,
+    `calls` counts requests which were actually sent.
+
+    Basic Usage::
+      >>> single_flight = SingleFlight()
+      >>> client.set_single_flight(single_flight)
+      >>> single_flight.calls, single_flight.saved
+
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+        self._tasks: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.calls = 0
+        self.saved = 0
+
+    def __len__(self) -> int:
+        """Number of requests in flight."""
+        return len(self._calls) + len(self._tasks)
+
+    @property
+    def saved_ratio(self) -> float:
+        total = self.calls + self.saved
+        return self.saved / total if total else 0.0
+
+    @staticmethod
+    def is_coalescable(method: Union[str, bytes]) -> bool:
+        return ResponseCache.is_cacheable(method)
+
+    @staticmethod
+    def key(
+        method: Union[str, bytes],
+        url: Union[str, bytes],
+        params: Optional[Mapping[str, Any]] = None,
+        data: Optional[Mapping[str, Any]] = None,
+        authorization: Optional[str] = None,
+    ) -> str:
+        if isinstance(method, bytes):
+            method = method.decode()
+
+        return f"{method.lower()} {ResponseCache.key(url, params, data, authorization)}"
+
+    @classmethod
+    def json_key(
+        cls,
+        method: Union[str, bytes],
+        url: Union[str, bytes],
+        params: Optional[Mapping[str, Any]] = None,
+        data: Optional[Mapping[str, Any]] = None,
+        authorization: Optional[str] = None,
+    ) -> str:
+        """Same as :meth:`key`, for calls returning parsed body instead of response."""
+        return f"json {cls.key(method, url, params, data, authorization)}"
+
+    def call(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """Returns result of `fetch`, or of the call of `fetch` in flight under the same key."""
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+                self.calls += 1
+            else:
+                self.saved += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fetch()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    async def acall(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """Same as :meth:`call` for coroutines. Waiting callers must run in the same event loop.
+
+        Shared call runs in its own task, so cancelling any caller, the first
+        one included, does not cancel it for the others.
+
+        """
+        with self._lock:
+            task = self._tasks.get(key)
+            if task is None:
+                task = self._tasks[key] = asyncio.ensure_future(self._run(key, fetch))
+                task.add_done_callback(_retrieve_exception)
+                self.calls += 1
+            else:
+                self.saved += 1
+
+        return await asyncio.shield(task)
+
+    async def _run(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            return await fetch()
+        finally:
+            with self._lock:
+                del self._tasks[key]
+
+
+def _retrieve_exception(task: "asyncio.Future[Any]") -> None:
+    # Marks exception as retrieved when every caller was cancelled
+    if not task.cancelled():
+        task.exception()
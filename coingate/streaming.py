@@ -0,0 +1,219 @@
+import codecs
+import json
+import re
+from typing import Any, Callable, Dict, Generic, Iterable, Iterator, List, TypeVar
+
+import requests
+
+T = TypeVar("T")
+
+_NON_WHITESPACE = re.compile(r"\S")
+_STRUCTURAL = re.compile(r'[\[\]{}"]')
+_STRING_END = re.compile(r'["\\]')
+_SCALAR_END = re.compile(r"[\s,\]}]")
+
+# Parser states
+_START, _KEY, _COLON, _VALUE, _ITEMS, _DONE = range(6)
+
+_INCOMPLETE = object()
+
+
+class _ItemParser:
+    """Push parser of a JSON object, which decodes items of the array under `key` one at a time.
+
+    Other top-level values are decoded whole and collected in `fields`.
+    Scanning of an incomplete value resumes where previous chunk ended, so
+    every character is scanned once.
+
+    """
+
+    def __init__(self, key: str, loads: Callable[[str], Any] = json.loads) -> None:
+        self.key = key
+        self.loads = loads
+        self.fields: Dict[str, Any] = {}
+
+        self._buffer = ""
+        self._start = 0
+        self._state = _START
+        self._current_key = ""
+
+        # Progress of scanning the value which starts at `_start`
+        self._pos = -1
+        self._depth = 0
+        self._in_string = False
+
+    def feed(self, text: str) -> List[Any]:
+        self._buffer = self._buffer[self._start :] + text
+        if self._pos >= 0:
+            self._pos -= self._start
+        self._start = 0
+
+        items = []
+        while self._state != _DONE:
+            match = _NON_WHITESPACE.search(self._buffer, self._start)
+            if match is None:
+                self._start = len(self._buffer)
+                break
+            self._start = match.start()
+
+            char = self._buffer[self._start]
+            if self._state == _START:
+                self._expect(char, "{")
+                self._state = _KEY
+            elif self._state == _KEY:
+                if char in ",}":
+                    self._start += 1
+                    if char == "}":
+                        self._state = _DONE
+                    continue
+                value = self._scan_value()
+                if value is _INCOMPLETE:
+                    break
+                self._current_key = value
+                self._state = _COLON
+            elif self._state == _COLON:
+                self._expect(char, ":")
+                self._state = _VALUE
+            elif self._state == _VALUE:
+                if char == "[" and self._current_key == self.key:
+                    self._start += 1
+                    self._state = _ITEMS
+                    continue
+                value = self._scan_value()
+                if value is _INCOMPLETE:
+                    break
+                self.fields[self._current_key] = value
+                self._state = _KEY
+            elif self._state == _ITEMS:
+                if char in ",]":
+                    self._start += 1
+                    if char == "]":
+                        self._state = _KEY
+                    continue
+                value = self._scan_value()
+                if value is _INCOMPLETE:
+                    break
+                items.append(value)
+
+        return items
+
+    def close(self) -> None:
+        if self._state != _DONE:
+            raise ValueError("Unexpected end of JSON document")
+
+    def _expect(self, char: str, expected: str) -> None:
+        if char != expected:
+            raise ValueError(
+                f"Expecting {expected!r}, got {char!r} at position {self._start}"
+            )
+        self._start += 1
+
+    def _scan_value(self) -> Any:
+        end = self._find_value_end()
+        if end < 0:
+            return _INCOMPLETE
+
+        value = self.loads(self._buffer[self._start : end])
+        self._start = end
+        self._pos, self._depth, self._in_string = -1, 0, False
+        return value
+
+    def _find_value_end(self) -> int:
+        buffer = self._buffer
+        if buffer[self._start] not in '[{"':
+            # Number or literal ends with the first delimiter after it
+            match = _SCALAR_END.search(buffer, self._start)
+            return match.start() if match else -1
+
+        pos = self._start if self._pos < 0 else self._pos
+        while True:
+            if self._in_string:
+                match = _STRING_END.search(buffer, pos)
+                if match is None:
+                    self._pos = len(buffer)
+                    return -1
+                if match.group() == "\\":
+                    if match.end() >= len(buffer):
+                        # Escaped character is in the next chunk
+                        self._pos = match.start()
+                        return -1
+                    pos = match.end() + 1
+                    continue
+                self._in_string = False
+                pos = match.end()
+                if self._depth == 0:
+                    return pos
+            else:
+                match = _STRUCTURAL.search(buffer, pos)
+                if match is None:
+                    self._pos = len(buffer)
+                    return -1
+                pos = match.end()
+                char = match.group()
+                if char == '"':
+                    self._in_string = True
+                elif char in "[{":
+                    self._depth += 1
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        return pos
+
+
+class JSONItemStream(Generic[T]):
+    """Iterates over items of a list response while it is still being received.
+
+    Response must be requested with `stream=True`. Items of the array under
+    `key` are decoded one at a time and passed to `build` as soon as they are
+    complete, so only one item is held in memory instead of the whole body.
+    Other top-level values (e.g. `total_pages`) are available in
+    :attr:`fields` once they are received, all of them after iteration ends.
+
+    :param requests.Response `response`: Streamed response, closed after iteration
+    :param str `key`: Top-level key of the array, e.g. `orders`
+    :param Callable `build`: Builds resource from decoded item
+    :param int `chunk_size`: Number of bytes read from socket at a time. Default: 16384
+    :param Callable `loads`: Decodes JSON of a single item or field. Default: `json.loads`
+
+    Basic Usage::
+      >>> response = client.request("get", "v2/orders", stream=True)
+      >>> for order in JSONItemStream(response, "orders", lambda item: Order(**item)):
+      ...     print(order.id)
+
+    """
+
+    def __init__(
+        self,
+        response: requests.Response,
+        key: str,
+        build: Callable[[Any], T],
+        *,
+        chunk_size: int = 16384,
+        loads: Callable[[str], Any] = json.loads,
+    ) -> None:
+        self._response = response
+        self._build = build
+        self._chunk_size = chunk_size
+        self._parser = _ItemParser(key, loads)
+
+    @property
+    def fields(self) -> Dict[str, Any]:
+        return self._parser.fields
+
+    def __iter__(self) -> Iterator[T]:
+        try:
+            yield from self._iter_items(
+                self._response.iter_content(chunk_size=self._chunk_size)
+            )
+        finally:
+            self._response.close()
+
+    def _iter_items(self, chunks: Iterable[bytes]) -> Iterator[T]:
+        decoder = codecs.getincrementaldecoder(self._response.encoding or "utf-8")()
+        for chunk in chunks:
+            for item in self._parser.feed(decoder.decode(chunk)):
+                yield self._build(item)
+
+        for item in self._parser.feed(decoder.decode(b"", final=True)):
+            yield self._build(item)
+        self._parser.close()
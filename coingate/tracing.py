@@ -0,0 +1,226 @@
+import functools
+import inspect
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    Mapping,
+    Optional,
+    Union,
+)
+
+from coingate import __version__
+
+from .metrics import endpoint_template
+from .transport import TransportRequest
+
+try:
+    from opentelemetry import propagate, trace
+    from opentelemetry.trace import SpanKind, Status, StatusCode
+except ImportError:  # pragma: no cover
+    trace = None  # type: ignore
+
+
+class Tracing:
+    """Records OpenTelemetry spans of client calls.
+
+    * `OrderService.checkout`, `RefundService.create_order_refund`, ... - one span per service method call,
+      kept open while items of `iter_*` methods are consumed
+    * `GET v2/orders/{id}` - one span per API request, including retries and cache lookup. Carries
+      `coingate.endpoint`, `coingate.page` of paging steps, `coingate.retry_count` and `http.response.status_code`
+    * `HTTP GET` - one client span per attempt, whose context is sent in `traceparent` header
+    * `coingate.cache_lookup` - lookup of :class:`coingate.http_cache.ResponseCache`, with `coingate.cache.hit`
+
+    Without tracing set, clients do not import `opentelemetry` and take no
+    extra steps. Requires `opentelemetry-api`.
+
+    :param Optional[Tracer] `tracer`: Default: tracer of the global tracer provider
+    :param bool `propagate`: Send trace context headers. Default: True
+
+    Basic Usage::
+      >>> from coingate.tracing import Tracing
+      >>> client.set_tracing(Tracing())
+
+    """
+
+    def __init__(self, tracer: Any = None, *, propagate: bool = True) -> None:
+        if trace is None:
+            raise ImportError(
+                "Tracing requires opentelemetry-api, install it with `pip install opentelemetry-api`"
+            )
+
+        self._tracer = tracer or trace.get_tracer("coingate", __version__)
+        self._propagate = propagate
+
+    def span(self, name: str, **kwargs: Any):
+        return self._tracer.start_as_current_span(name, **kwargs)
+
+    @contextmanager
+    def request_span(
+        self,
+        method: Union[str, bytes],
+        url: Union[str, bytes],
+        params: Optional[Mapping[str, Any]] = None,
+        data: Optional[Mapping[str, Any]] = None,
+    ) -> Iterator[Any]:
+        """Span of an API request, ended once its response is processed."""
+        method = (method.decode() if isinstance(method, bytes) else method).upper()
+        endpoint = endpoint_template(url.decode() if isinstance(url, bytes) else url)
+        attributes: Dict[str, Any] = {
+            "http.request.method": method,
+            "coingate.endpoint": endpoint,
+            "coingate.retry_count": 0,
+        }
+        # Refunds, ledger and withdrawals send paging in form body
+        page = next(
+            (
+                values["page"]
+                for values in (params, data)
+                if values and values.get("page") is not None
+            ),
+            None,
+        )
+        if page is not None:
+            attributes["coingate.page"] = int(page)
+
+        with self.span(f"{method} {endpoint}", attributes=attributes) as span:
+            try:
+                yield span
+            except Exception as e:
+                status_code = getattr(e, "status_code", None)
+                if status_code is not None:
+                    span.set_attribute("http.response.status_code", status_code)
+                raise
+
+    @contextmanager
+    def attempt_span(
+        self, request: TransportRequest, attempt: int
+    ) -> Iterator[TransportRequest]:
+        """Client span of one attempt. Yields `request` with trace context headers."""
+        attributes: Dict[str, Any] = {
+            "http.request.method": request.method,
+            "url.full": request.url,
+        }
+        if attempt:
+            attributes["http.request.resend_count"] = attempt
+
+        with self.span(
+            f"HTTP {request.method}", kind=SpanKind.CLIENT, attributes=attributes
+        ):
+            if not self._propagate:
+                yield request
+                return
+
+            headers = dict(request.headers)
+            propagate.inject(headers)
+            yield replace(request, headers=headers)
+
+    def record_response(self, status_code: int) -> None:
+        """Sets status of the current attempt span."""
+        span = trace.get_current_span()
+        span.set_attribute("http.response.status_code", status_code)
+        if status_code >= 400:
+            span.set_status(Status(StatusCode.ERROR))
+
+    def record_retry(self, attempt: int, error: BaseException, delay: float) -> None:
+        """Counts a retry on the current request span."""
+        span = trace.get_current_span()
+        span.set_attribute("coingate.retry_count", attempt)
+        span.add_event(
+            "coingate.retry",
+            {"exception.type": type(error).__name__, "coingate.retry_delay": delay},
+        )
+
+    def lookup_cache(self, lookup: Callable[[], Any]) -> Any:
+        with self.span("coingate.cache_lookup") as span:
+            cached = lookup()
+            span.set_attribute("coingate.cache.hit", cached is not None)
+            return cached
+
+    def trace_service(self, service: Any) -> "TracedService":
+        return TracedService(service, self)
+
+    def wrap(self, name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+        """Wraps `func` to run in a span named `name`. Iterators returned by `func` are consumed in the span."""
+        if inspect.iscoroutinefunction(func):
+
+            @functools.wraps(func)
+            async def _async_traced(*args: Any, **kwargs: Any) -> Any:
+                with self.span(name):
+                    return await func(*args, **kwargs)
+
+            return _async_traced
+
+        @functools.wraps(func)
+        def _traced(*args: Any, **kwargs: Any) -> Any:
+            span = self._tracer.start_span(name)
+            try:
+                with trace.use_span(span, end_on_exit=False):
+                    result = func(*args, **kwargs)
+            except BaseException:
+                span.end()
+                raise
+
+            if hasattr(result, "__anext__"):
+                return self._aiterate_in_span(span, result)
+            if hasattr(result, "__next__"):
+                return self._iterate_in_span(span, result)
+
+            span.end()
+            return result
+
+        return _traced
+
+    @staticmethod
+    def _iterate_in_span(span: Any, iterator: Iterator[Any]) -> Iterator[Any]:
+        try:
+            while True:
+                with trace.use_span(span, end_on_exit=False):
+                    try:
+                        item = next(iterator)
+                    except StopIteration:
+                        return
+                yield item
+        finally:
+            if hasattr(iterator, "close"):
+                iterator.close()
+            span.end()
+
+    @staticmethod
+    async def _aiterate_in_span(
+        span: Any, iterator: AsyncIterator[Any]
+    ) -> AsyncIterator[Any]:
+        try:
+            while True:
+                with trace.use_span(span, end_on_exit=False):
+                    try:
+                        item = await iterator.__anext__()
+                    except StopAsyncIteration:
+                        return
+                yield item
+        finally:
+            if hasattr(iterator, "aclose"):
+                await iterator.aclose()
+            span.end()
+
+
+class TracedService:
+    """Service whose public methods run in spans named `<ServiceClass>.<method>`."""
+
+    def __init__(self, service: Any, tracing: Tracing) -> None:
+        self._service = service
+        self._tracing = tracing
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._service, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        traced = self._tracing.wrap(f"{type(self._service).__name__}.{name}", attr)
+        # Cached, later lookups do not reach __getattr__
+        setattr(self, name, traced)
+        return traced
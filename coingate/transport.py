@@ -0,0 +1,295 @@
+import io
+import json
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Mapping, Optional, Union
+from urllib.parse import urlencode
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from urllib3.exceptions import (
+    ConnectTimeoutError,
+    HTTPError,
+    NewConnectionError,
+    ReadTimeoutError,
+)
+from urllib3.exceptions import SSLError as URLLib3SSLError
+
+
+@dataclass(frozen=True)
+class PoolLimits:
+    """Connection pool settings of :class:`RequestsTransport` and :class:`Urllib3Transport`.
+
+    When all `maxsize` connections to the API are busy, another thread either
+    waits for one to be returned (`block=True`), or opens an extra connection
+    which is closed after its request (`block=False`). For a worker of N
+    threads sharing one client, set `maxsize` to N so connections are reused
+    instead of re-opened.
+
+    :param int `connections`: Number of hosts whose connections are kept. Default: 10
+    :param int `maxsize`: Number of connections kept open per host. Default: 10
+    :param bool `block`: Wait for a free connection instead of opening an extra one. Default: False
+    :param bool `keep_alive`: Reuse connections between requests, sends `Connection: close` when disabled. Default: True
+
+    """
+
+    connections: int = 10
+    maxsize: int = 10
+    block: bool = False
+    keep_alive: bool = True
+
+
+@dataclass(frozen=True)
+class TransportRequest:
+    """Request ready to be sent: query string and form body are already encoded."""
+
+    method: str
+    url: str
+    headers: Mapping[str, str]
+    body: Optional[bytes] = None
+    timeout: Optional[float] = None
+    stream: bool = False
+
+    @classmethod
+    def build(
+        cls,
+        method: Union[str, bytes],
+        url: Union[str, bytes],
+        *,
+        headers: Mapping[str, str],
+        data: Optional[Mapping[str, Any]] = None,
+        params: Optional[Mapping[str, Any]] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> "TransportRequest":
+        if isinstance(method, bytes):
+            method = method.decode()
+        if isinstance(url, bytes):
+            url = url.decode()
+
+        query = encode_form(params)
+        if query:
+            url = f"{url}{'&' if '?' in url else '?'}{query}"
+
+        body = encode_form(data)
+        return cls(
+            method=method.upper(),
+            url=url,
+            headers=headers,
+            body=body.encode() if body else None,
+            timeout=timeout,
+            stream=stream,
+        )
+
+
+def encode_form(values: Optional[Mapping[str, Any]]) -> str:
+    """Encodes query string or form body the same way `requests` does: `None` values are dropped, other values are passed through `str()`."""
+    if not values:
+        return ""
+
+    return urlencode(
+        [(key, value) for key, value in values.items() if value is not None],
+        doseq=True,
+    )
+
+
+def build_response(
+    request: TransportRequest,
+    status_code: int,
+    headers: Mapping[str, str],
+    *,
+    content: Optional[bytes] = None,
+    raw: Any = None,
+    reason: Optional[str] = None,
+) -> requests.Response:
+    """Builds `requests.Response` from status, headers and either the whole body or a file-like `raw` body read while streaming."""
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = get_encoding_from_headers(response.headers)
+    response.url = request.url
+    response.reason = reason or ""
+    response.raw = raw if raw is not None else io.BytesIO(content or b"")
+    if content is not None:
+        response._content = content
+        response._content_consumed = True  # type: ignore[attr-defined]
+
+    return response
+
+
+class Transport(ABC):
+    """Sends :class:`TransportRequest` and returns `requests.Response`.
+
+    Implementations raise `requests.ConnectionError`/`requests.Timeout` on
+    network failures, so retries, caching and streaming work the same over
+    any transport.
+
+    """
+
+    @abstractmethod
+    def send(self, request: TransportRequest) -> requests.Response:
+        ...
+
+    def close(self) -> None:
+        pass
+
+
+class RequestsTransport(Transport):
+    """Sends requests through `requests.Session`. Honours proxy environment variables and `.netrc`. Default transport.
+
+    :param Optional[PoolLimits] `pool_limits`: Default: :class:`PoolLimits`
+
+    """
+
+    def __init__(self, *, pool_limits: Optional[PoolLimits] = None) -> None:
+        pool_limits = pool_limits or PoolLimits()
+        self.session = requests.Session()
+        for prefix in ("https://", "http://"):
+            self.session.mount(
+                prefix,
+                HTTPAdapter(
+                    pool_connections=pool_limits.connections,
+                    pool_maxsize=pool_limits.maxsize,
+                    pool_block=pool_limits.block,
+                ),
+            )
+
+    def send(self, request: TransportRequest) -> requests.Response:
+        return self.session.request(
+            request.method,
+            request.url,
+            data=request.body,
+            headers=request.headers,
+            timeout=request.timeout,
+            stream=request.stream,
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+
+class Urllib3Transport(Transport):
+    """Sends requests straight through a `urllib3.PoolManager`.
+
+    Skips the per-request work of `requests.Session` (settings merging, proxy
+    environment lookup, cookies, hooks), which lowers overhead of every call.
+    Proxy environment variables are not honoured.
+
+    :param Optional[PoolLimits] `pool_limits`: Default: :class:`PoolLimits`
+
+    """
+
+    DEFAULT_HEADERS = {"Accept": "*/*", "Accept-Encoding": "gzip, deflate"}
+
+    def __init__(self, *, pool_limits: Optional[PoolLimits] = None) -> None:
+        pool_limits = pool_limits or PoolLimits()
+        self.pool_manager = urllib3.PoolManager(
+            num_pools=pool_limits.connections,
+            maxsize=pool_limits.maxsize,
+            block=pool_limits.block,
+        )
+
+    def send(self, request: TransportRequest) -> requests.Response:
+        try:
+            response = self.pool_manager.urlopen(
+                request.method,
+                request.url,
+                body=request.body,
+                headers={**self.DEFAULT_HEADERS, **request.headers},
+                timeout=urllib3.Timeout(connect=request.timeout, read=request.timeout),
+                retries=False,
+                preload_content=not request.stream,
+            )
+        # NewConnectionError is a subclass of ConnectTimeoutError
+        except NewConnectionError as e:
+            raise requests.ConnectionError(e) from e
+        except ConnectTimeoutError as e:
+            raise requests.ConnectTimeout(e) from e
+        except ReadTimeoutError as e:
+            raise requests.ReadTimeout(e) from e
+        except URLLib3SSLError as e:
+            raise requests.exceptions.SSLError(e) from e
+        except HTTPError as e:
+            raise requests.ConnectionError(e) from e
+
+        return build_response(
+            request,
+            response.status,
+            response.headers,
+            content=None if request.stream else response.data,
+            raw=response,
+            reason=response.reason,
+        )
+
+    def close(self) -> None:
+        self.pool_manager.clear()
+
+
+@dataclass
+class InMemoryResponse:
+    """Response returned by handler of :class:`InMemoryTransport`."""
+
+    status_code: int = 200
+    content: bytes = b""
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    @classmethod
+    def json(
+        cls,
+        data: Any,
+        status_code: int = 200,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> "InMemoryResponse":
+        return cls(
+            status_code,
+            json.dumps(data).encode(),
+            {"Content-Type": "application/json", **(headers or {})},
+        )
+
+
+class InMemoryTransport(Transport):
+    """Answers requests in process by calling `handler`, without sockets. For tests and load tests of code built on the client.
+
+    With `record`, every sent request is kept in `requests`. It is off by
+    default, so long load tests do not grow memory.
+
+    :param Callable[[TransportRequest], InMemoryResponse] `handler`
+    :param bool `record`: Keep sent requests in `requests`. Default: False
+
+    Basic Usage::
+      >>> transport = InMemoryTransport(lambda request: InMemoryResponse.json(order), record=True)
+      >>> client = CoinGate("api_key", transport=transport)
+      >>> client.order.get(1)
+      >>> transport.requests[0].url
+      'https://api.coingate.com/v2/orders/1'
+
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[TransportRequest], InMemoryResponse],
+        *,
+        record: bool = False,
+    ) -> None:
+        self._handler = handler
+        self._record = record
+        self._lock = threading.Lock()
+        self.requests: List[TransportRequest] = []
+
+    def send(self, request: TransportRequest) -> requests.Response:
+        if self._record:
+            with self._lock:
+                self.requests.append(request)
+
+        answer = self._handler(request)
+        return build_response(
+            request,
+            answer.status_code,
+            answer.headers,
+            content=None if request.stream else answer.content,
+            raw=io.BytesIO(answer.content),
+        )
@@ -0,0 +1,317 @@
+import asyncio
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import (
+    TYPE_CHECKING,
+    AsyncIterator,
+    Callable,
+    Collection,
+    Dict,
+    List,
+    Optional,
+)
+
+from .resources.order import Checkout, Order
+
+if TYPE_CHECKING:
+    from .client import CoinGate
+
+FINAL_STATUSES = frozenset({"paid", "invalid", "expired", "canceled", "refunded"})
+
+
+@dataclass(frozen=True)
+class OrderTransition:
+    """Status change of a watched order. `previous_status` is `None` on the first observation of an order watched without status."""
+
+    order: Order
+    previous_status: Optional[str]
+
+    @property
+    def status(self) -> str:
+        return self.order.status
+
+
+@dataclass
+class _WatchedOrder:
+    id: int
+    status: Optional[str]
+    created_at: Optional[datetime]
+    expire_at: Optional[datetime]
+    next_poll_at: datetime
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _as_utc(value: Optional[datetime]) -> Optional[datetime]:
+    """Aware UTC time, naive times are taken as UTC."""
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+class OrderWatcher:
+    """Polls watched orders and reports their status transitions.
+
+    Every order is polled at an interval proportional to its age
+    (`age * age_factor`, between `min_interval` and `max_interval` seconds),
+    and right after its `expire_at`, when known. Orders due within
+    `min_interval` of each other are polled together: when at least
+    `scan_threshold` of them are due, they are read from pages of
+    `v2/orders` created since the oldest of them instead of one request per
+    order, so number of requests grows with number of pages, not orders.
+    Scanning stops as soon as the pages left outnumber the orders not found
+    yet, which are then polled one by one, so a scan never costs more than
+    one request above polling every due order.
+
+    Orders reaching one of `final_statuses` are reported and stop being watched.
+
+    :param CoinGate `client`
+    :param float `min_interval`: Default: 5
+    :param float `max_interval`: Default: 300
+    :param float `age_factor`: Default: 0.1
+    :param int `scan_threshold`: Minimum number of due orders read by scanning pages. Default: 20
+    :param int `per_page`: Number of orders per scanned page. Default: 100
+    :param Collection[str] `final_statuses`: Default: paid, invalid, expired, canceled, refunded
+
+    Basic Usage::
+      >>> watcher = OrderWatcher(client)
+      >>> watcher.on_transition(lambda t: print(t.order.id, t.previous_status, t.status))
+      >>> watcher.watch_checkout(client.order.checkout(order.id, pay_currency="BTC"))
+      >>> watcher.start()
+
+    """
+
+    def __init__(
+        self,
+        client: "CoinGate",
+        *,
+        min_interval: float = 5,
+        max_interval: float = 300,
+        age_factor: float = 0.1,
+        scan_threshold: int = 20,
+        per_page: int = 100,
+        final_statuses: Collection[str] = FINAL_STATUSES,
+        now: Callable[[], datetime] = _utcnow,
+    ) -> None:
+        self._client = client
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._age_factor = age_factor
+        self._scan_threshold = scan_threshold
+        self._per_page = per_page
+        self._final_statuses = frozenset(final_statuses)
+        self._now = now
+
+        self._watched: Dict[int, _WatchedOrder] = {}
+        self._callbacks: List[Callable[[OrderTransition], None]] = []
+        self._lock = threading.Lock()
+        self._stopped = threading.Event()
+        # Wakes the polling thread to re-compute its wait
+        self._woken = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        self.requests = 0
+        self.last_error: Optional[Exception] = None
+
+    def __len__(self) -> int:
+        return len(self._watched)
+
+    def __contains__(self, order_id: object) -> bool:
+        return order_id in self._watched
+
+    def watch(
+        self,
+        order_id: int,
+        *,
+        status: Optional[str] = None,
+        created_at: Optional[datetime] = None,
+        expire_at: Optional[datetime] = None,
+    ) -> None:
+        """Starts watching the order. Orders without `created_at` are polled once individually to learn it."""
+        now = self._now()
+        watched = _WatchedOrder(
+            order_id, status, _as_utc(created_at), _as_utc(expire_at), now
+        )
+        if created_at is not None:
+            watched.next_poll_at += timedelta(seconds=self._interval(watched, now))
+
+        with self._lock:
+            self._watched[order_id] = watched
+        self._woken.set()
+
+    def watch_order(self, order: Order) -> None:
+        self.watch(order.id, status=order.status, created_at=order.created_at)
+
+    def watch_checkout(self, checkout: Checkout) -> None:
+        self.watch(
+            checkout.id,
+            status=checkout.status,
+            created_at=checkout.created_at,
+            expire_at=checkout.expire_at,
+        )
+
+    def unwatch(self, order_id: int) -> None:
+        with self._lock:
+            self._watched.pop(order_id, None)
+
+    def on_transition(self, callback: Callable[[OrderTransition], None]) -> None:
+        self._callbacks.append(callback)
+
+    def next_poll_in(self) -> float:
+        """Number of seconds until the next order is due, `max_interval` when nothing is watched."""
+        with self._lock:
+            if not self._watched:
+                return self._max_interval
+            next_poll_at = min(w.next_poll_at for w in self._watched.values())
+
+        return max(0.0, (next_poll_at - self._now()).total_seconds())
+
+    def poll(self) -> List[OrderTransition]:
+        """Polls orders which are due and returns their transitions, after passing them to callbacks."""
+        now = self._now()
+        window = now + timedelta(seconds=self._min_interval)
+        with self._lock:
+            due = [w for w in self._watched.values() if w.next_poll_at <= window]
+        if not due:
+            return []
+
+        orders: Dict[int, Order] = {}
+        scannable = [w for w in due if w.created_at is not None]
+        if len(scannable) >= self._scan_threshold:
+            orders.update(self._scan(scannable))
+
+        for watched in due:
+            if watched.id not in orders:
+                order = self._get(watched.id)
+                if order is not None:
+                    orders[watched.id] = order
+
+        transitions = []
+        with self._lock:
+            for watched in due:
+                if self._watched.get(watched.id) is not watched:
+                    # Unwatched or watched again while polling
+                    continue
+
+                order = orders.get(watched.id)
+                if order is not None:
+                    if order.status != watched.status:
+                        transitions.append(OrderTransition(order, watched.status))
+                    watched.status = order.status
+                    watched.created_at = _as_utc(order.created_at)
+                    if order.status in self._final_statuses:
+                        del self._watched[watched.id]
+                        continue
+
+                watched.next_poll_at = now + timedelta(
+                    seconds=self._interval(watched, now)
+                )
+
+        for transition in transitions:
+            for callback in self._callbacks:
+                callback(transition)
+
+        return transitions
+
+    def start(self) -> None:
+        """Polls in a background thread until :meth:`stop` is called. Watching an order wakes the thread, so it is polled on time."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._poll_periodically, daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._woken.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    async def transitions(self) -> AsyncIterator[OrderTransition]:
+        """Yields transitions until every watched order reaches a final status. Polls in the default executor.
+
+        >>> async for transition in watcher.transitions():
+        ...     print(transition.order.id, transition.status)
+
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            for transition in await loop.run_in_executor(None, self.poll):
+                yield transition
+            if not self._watched:
+                return
+            await asyncio.sleep(self.next_poll_in())
+
+    def _interval(self, watched: _WatchedOrder, now: datetime) -> float:
+        age = (now - watched.created_at).total_seconds() if watched.created_at else 0
+        interval = min(
+            max(age * self._age_factor, self._min_interval), self._max_interval
+        )
+
+        if watched.expire_at is not None:
+            until_expiry = (watched.expire_at - now).total_seconds()
+            if until_expiry >= 0:
+                # Observe expiration soon after it happens
+                interval = min(interval, until_expiry + self._min_interval)
+
+        return interval
+
+    def _scan(self, due: List[_WatchedOrder]) -> Dict[int, Order]:
+        missing = {w.id for w in due}
+        created_from = min(w.created_at for w in due if w.created_at is not None)
+
+        found: Dict[int, Order] = {}
+        page, total_pages = 1, 1
+        while missing and page <= total_pages:
+            if page > 1 and total_pages - page + 1 >= len(missing):
+                # Polling the rest one by one takes fewer requests
+                break
+            try:
+                result = self._client.order.get_all(
+                    per_page=self._per_page,
+                    page=page,
+                    sort="created_at_asc",
+                    created_from=created_from,
+                )
+            except Exception as e:
+                # Orders not found by the scan are polled individually
+                self.last_error = e
+                break
+            finally:
+                self.requests += 1
+
+            for order in result.orders:
+                if order.id in missing:
+                    missing.discard(order.id)
+                    found[order.id] = order
+            page, total_pages = page + 1, result.total_pages
+
+        return found
+
+    def _get(self, order_id: int) -> Optional[Order]:
+        try:
+            return self._client.order.get(order_id)
+        except Exception as e:
+            # Polled again on its next interval
+            self.last_error = e
+            return None
+        finally:
+            self.requests += 1
+
+    def _poll_periodically(self) -> None:
+        while not self._stopped.is_set():
+            # Cleared before the wait is computed, so no watched order is missed
+            self._woken.clear()
+            if self._woken.wait(self.next_poll_in()):
+                continue
+            try:
+                self.poll()
+            except Exception as e:
+                self.last_error = e
@@ -0,0 +1,110 @@
+import asyncio
+from decimal import Decimal
+from urllib.parse import parse_qs
+
+import pytest
+from coingate.exceptions import OrderNotFoundException
+from coingate.resources.order import NewOrder, Order
+
+httpx = pytest.importorskip("httpx")
+
+from coingate.aio import AsyncCoinGate  # noqa: E402
+
+ORDER = {
+    "id": 123,
+    "status": "new",
+    "do_not_convert": False,
+    "price_currency": "EUR",
+    "price_amount": "10.0",
+    "lightning_network": False,
+    "receive_currency": "EUR",
+    "receive_amount": "10.0",
+    "created_at": "2022-10-10T12:23:22+00:00",
+    "order_id": "",
+    "payment_url": "https://pay-sandbox.coingate.com/invoice/1",
+    "underpaid_amount": "0",
+    "overpaid_amount": "0",
+    "is_refundable": False,
+    "orderable_type": "ApiOrder",
+    "orderable_id": 1,
+    "payment_address": None,
+}
+
+
+class TestAsyncCoinGate:
+    def setup_method(self):
+        self.requests = []
+
+    def _client(self, handler) -> AsyncCoinGate:
+        def _record(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return handler(request)
+
+        return AsyncCoinGate("api_key", True, transport=httpx.MockTransport(_record))
+
+    def test_get_order(self):
+        client = self._client(lambda request: httpx.Response(200, json=ORDER))
+
+        order = asyncio.run(client.order.get(123))
+
+        assert isinstance(order, Order)
+        assert order.price_amount == Decimal("10.0")
+
+        request = self.requests[0]
+        assert str(request.url) == "https://api-sandbox.coingate.com/v2/orders/123"
+        assert request.headers["Authorization"] == "Token api_key"
+        assert request.headers["User-Agent"].startswith("CoinGate/v2")
+
+    def test_create_order_drops_empty_fields(self):
+        new_order = {**ORDER, "token": "token"}
+        client = self._client(lambda request: httpx.Response(200, json=new_order))
+
+        order = asyncio.run(client.order.create(Decimal("10"), "EUR", "EUR"))
+
+        assert isinstance(order, NewOrder)
+
+        body = parse_qs(self.requests[0].content.decode())
+        assert body == {
+            "price_amount": ["10"],
+            "price_currency": ["EUR"],
+            "receive_currency": ["EUR"],
+        }
+
+    def test_raises_client_exceptions(self):
+        error = {"message": "Order not found", "reason": "OrderNotFound"}
+        client = self._client(lambda request: httpx.Response(404, json=error))
+
+        with pytest.raises(OrderNotFoundException) as exc_info:
+            asyncio.run(client.order.get(1))
+
+        assert exc_info.value.message == "Order not found"
+        assert exc_info.value.status_code == 404
+
+    def test_returns_redirects_like_sync_client(self):
+        client = self._client(
+            lambda request: httpx.Response(302, headers={"Location": "/v2/ping"})
+        )
+
+        response = asyncio.run(client.request("get", "v2/ping"))
+
+        assert response.status_code == 302
+
+    def test_exchange_rate(self):
+        client = self._client(lambda request: httpx.Response(200, text="0.0000472"))
+
+        rate = asyncio.run(client.public.get_exchange_rate_for_merchant("EUR", "BTC"))
+
+        assert rate == Decimal("0.0000472")
+
+    def test_concurrent_requests_share_client(self):
+        client = self._client(lambda request: httpx.Response(200, json=ORDER))
+
+        async def _gather():
+            async with client:
+                return await asyncio.gather(*(client.order.get(i) for i in range(20)))
+
+        orders = asyncio.run(_gather())
+
+        assert len(orders) == 20
+        assert len(self.requests) == 20
+        assert orders[0].id == ORDER["id"]
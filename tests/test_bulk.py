@@ -0,0 +1,174 @@
+import asyncio
+import json
+import threading
+from datetime import datetime, timezone
+from decimal import Decimal
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+from coingate import CoinGate
+from coingate.bulk import DuplicateOrderIdError
+from coingate.exceptions import OrderIsNotValidException
+from coingate.resources.order import NewOrder, Order
+from coingate.transport import InMemoryResponse, InMemoryTransport
+
+try:
+    import httpx
+    from coingate.aio import AsyncCoinGate
+except ImportError:  # `async` extra is not installed
+    httpx = None  # type: ignore
+
+requires_httpx = pytest.mark.skipif(httpx is None, reason="httpx is not installed")
+
+
+def _order(id, order_id):
+    return {
+        "id": id,
+        "status": "new",
+        "do_not_convert": False,
+        "price_currency": "EUR",
+        "price_amount": "10.0",
+        "lightning_network": False,
+        "receive_currency": "EUR",
+        "receive_amount": "10.0",
+        "created_at": "2022-10-10T12:23:22+00:00",
+        "order_id": order_id,
+        "payment_url": f"https://pay.coingate.com/invoice/{id}",
+        "underpaid_amount": "0",
+        "overpaid_amount": "0",
+        "is_refundable": False,
+        "orderable_type": "ApiOrder",
+        "orderable_id": id,
+        "payment_address": None,
+    }
+
+
+class FakeOrders:
+    """Creates orders, rejecting ones priced at zero, and lists created ones."""
+
+    def __init__(self, existing=()):
+        self.lock = threading.Lock()
+        self.orders = list(existing)
+        self.created = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def __call__(self, method, url, body):
+        path = urlsplit(url).path
+        if method == "GET":
+            page = {
+                "current_page": 1,
+                "per_page": 100,
+                "total_orders": len(self.orders),
+                "total_pages": 1,
+                "orders": self.orders,
+            }
+            return 200, page
+
+        form = {k: v[0] for k, v in parse_qs(body.decode()).items()}
+        assert path == "/v2/orders"
+        if Decimal(form["price_amount"]) <= 0:
+            error = {
+                "message": "Order is not valid",
+                "reason": "OrderIsNotValid",
+                "errors": ["Price must be greater than 0"],
+            }
+            return 422, error
+
+        with self.lock:
+            self.created += 1
+            order = _order(len(self.orders) + 1, form.get("order_id", ""))
+            self.orders.append(order)
+        return 200, {**order, "token": "token"}
+
+    def transport(self):
+        def handle(request):
+            with self.lock:
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            try:
+                status, body = self(request.method, request.url, request.body or b"")
+                return InMemoryResponse.json(body, status)
+            finally:
+                with self.lock:
+                    self.in_flight -= 1
+
+        return InMemoryTransport(handle)
+
+
+def _spec(order_id, price="10"):
+    return {
+        "price_amount": Decimal(price),
+        "price_currency": "EUR",
+        "receive_currency": "EUR",
+        "order_id": order_id,
+    }
+
+
+def test_results_are_aligned_with_per_item_errors():
+    api = FakeOrders()
+    client = CoinGate(transport=api.transport())
+    specs = [_spec(f"shop-{i}", "0" if i == 3 else "10") for i in range(20)]
+    specs.append({"price_currency": "EUR"})
+
+    results = client.order.create_many(specs, concurrency=8)
+
+    assert len(results) == 21
+    assert isinstance(results[3], OrderIsNotValidException)
+    assert isinstance(results[20], TypeError)
+    assert set(results.errors) == {3, 20}
+    assert not results.is_complete
+    for i in (0, 1, 19):
+        assert isinstance(results[i], NewOrder)
+        assert results[i].order_id == f"shop-{i}"
+    assert len(results.succeeded) == api.created == 19
+    assert api.max_in_flight <= 8
+
+
+def test_duplicate_order_ids_are_created_once():
+    api = FakeOrders()
+    client = CoinGate(transport=api.transport())
+
+    results = client.order.create_many(
+        [_spec("shop-1"), _spec("shop-2"), _spec("shop-1"), _spec(None), _spec(None)]
+    )
+
+    assert isinstance(results[2], DuplicateOrderIdError)
+    assert results[2].index == 0
+    assert api.created == 4
+
+
+def test_retried_batch_skips_orders_created_since():
+    api = FakeOrders(existing=[_order(1, "shop-1"), _order(2, "other")])
+    client = CoinGate(transport=api.transport())
+    started = datetime(2022, 10, 10, tzinfo=timezone.utc)
+
+    results = client.order.create_many(
+        [_spec("shop-1"), _spec("shop-2")], existing_since=started
+    )
+
+    assert isinstance(results[0], Order) and results[0].id == 1
+    assert isinstance(results[1], NewOrder)
+    assert api.created == 1
+
+
+@requires_httpx
+def test_async_create_many_bounds_concurrency():
+    api = FakeOrders()
+
+    async def handle(request):
+        api.in_flight += 1
+        api.max_in_flight = max(api.max_in_flight, api.in_flight)
+        await asyncio.sleep(0.001)
+        api.in_flight -= 1
+        status, body = api(request.method, str(request.url), request.content)
+        return httpx.Response(status, content=json.dumps(body).encode())
+
+    client = AsyncCoinGate(transport=httpx.MockTransport(handle))
+    specs = [_spec(f"shop-{i}") for i in range(10)] + [_spec("shop-0")]
+
+    results = asyncio.run(client.order.create_many(specs, concurrency=3))
+
+    assert api.max_in_flight == 3
+    assert api.created == 10
+    assert isinstance(results[10], DuplicateOrderIdError)
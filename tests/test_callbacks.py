@@ -0,0 +1,207 @@
+import asyncio
+import io
+import threading
+from decimal import Decimal
+from http import HTTPStatus
+from urllib.parse import urlencode
+
+from coingate.callbacks import CallbackProcessor
+
+TOKENS = {"shop-1": "secret-1", "shop-2": "secret-2"}
+
+
+def payload(id=1, order_id="shop-1", status="paid", token="secret-1", **kwargs):
+    data = {
+        "id": id,
+        "order_id": order_id,
+        "status": status,
+        "price_amount": "10.50",
+        "price_currency": "EUR",
+        "receive_currency": "EUR",
+        "receive_amount": "",
+        "pay_amount": "0.000512",
+        "pay_currency": "BTC",
+        "underpaid_amount": "0",
+        "overpaid_amount": "0",
+        "is_refundable": "true",
+        "created_at": "2022-10-10T12:23:22+00:00",
+        "token": token,
+    }
+    data.update(kwargs)
+    return urlencode(data).encode()
+
+
+def make_processor(**kwargs):
+    return CallbackProcessor(lambda callback: TOKENS.get(callback.order_id), **kwargs)
+
+
+def test_parses_verifies_and_dispatches():
+    processor = make_processor()
+    received = []
+    done = threading.Event()
+
+    @processor.handler
+    def handle(callback):
+        received.append(callback)
+        done.set()
+
+    result = processor.process(payload())
+
+    assert result.status == HTTPStatus.OK
+    assert done.wait(1)
+    callback = received[0]
+    assert callback.price_amount == Decimal("10.50")
+    assert callback.receive_amount is None
+    assert callback.is_refundable is True
+    processor.shutdown()
+
+
+def test_rejects_invalid_token_unknown_order_and_malformed_body():
+    processor = make_processor()
+
+    assert processor.process(payload(token="secret-2")).status == HTTPStatus.FORBIDDEN
+    assert processor.process(payload(order_id="other")).status == HTTPStatus.FORBIDDEN
+    assert processor.process(payload(token="")).status == HTTPStatus.FORBIDDEN
+    assert processor.process(b"id=abc").status == HTTPStatus.BAD_REQUEST
+    assert processor.process(b"x" * 70000).status == HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+    processor.shutdown()
+
+
+def test_drops_repeated_deliveries_until_status_changes():
+    processor = make_processor()
+    calls = []
+    processor.handler(calls.append)
+
+    first = processor.process(payload(status="pending"))
+    repeated = processor.process(payload(status="pending"))
+    changed = processor.process(payload(status="paid"))
+    processor.shutdown()
+
+    assert not first.duplicate and repeated.duplicate and not changed.duplicate
+    assert [c.status for c in calls] == ["pending", "paid"]
+    assert processor.duplicates == 1
+
+
+def test_expired_deliveries_are_processed_again():
+    now = [0.0]
+    processor = make_processor(dedupe_ttl=60, clock=lambda: now[0])
+
+    assert not processor.process(payload()).duplicate
+    now[0] = 61
+    assert not processor.process(payload()).duplicate
+    processor.shutdown()
+
+
+def test_answers_503_when_handlers_are_saturated():
+    processor = make_processor(workers=1, max_pending=2)
+    release = threading.Event()
+    processor.handler(lambda callback: release.wait(1))
+
+    statuses = [processor.process(payload(id=i)).status for i in range(4)]
+    release.set()
+    processor.shutdown()
+
+    assert statuses == [
+        HTTPStatus.OK,
+        HTTPStatus.OK,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+    ]
+    # Rejected deliveries are not remembered, so their retries are processed
+    assert processor._seen.add((2, "paid"))
+
+
+def test_failed_callbacks_are_kept_for_retry():
+    processor = make_processor(workers=1)
+    errors = []
+    broken = [True]
+
+    @processor.handler
+    def handle(callback):
+        if broken[0]:
+            raise ZeroDivisionError()
+
+    processor.error_handler(lambda callback, error: errors.append(error))
+
+    assert processor.process(payload()).status == HTTPStatus.OK
+    processor.shutdown()
+
+    assert isinstance(errors[0], ZeroDivisionError)
+    assert [c.id for c in processor.failed] == [1]
+    assert processor.retry_failed() == 0
+    assert len(processor.failed) == 1
+
+    broken[0] = False
+    assert processor.retry_failed() == 1
+    assert processor.failed == []
+    # Delivery resent from CoinGate is processed again as well
+    assert processor._seen.add((1, "paid"))
+
+
+def test_wsgi_adapter():
+    processor = make_processor()
+    body = payload()
+    responses = []
+
+    def start_response(status, headers):
+        responses.append(status)
+
+    environ = {
+        "REQUEST_METHOD": "POST",
+        "CONTENT_LENGTH": str(len(body)),
+        "CONTENT_TYPE": "application/x-www-form-urlencoded",
+        "wsgi.input": io.BytesIO(body),
+    }
+    assert processor.wsgi_app(environ, start_response) == [b"OK"]
+    processor.wsgi_app({"REQUEST_METHOD": "GET"}, start_response)
+    processor.shutdown()
+
+    assert responses == ["200 OK", "405 Method Not Allowed"]
+
+
+def test_asgi_adapter():
+    processor = make_processor()
+    body = payload(token="wrong")
+    messages = [
+        {"type": "http.request", "body": body[:10], "more_body": True},
+        {"type": "http.request", "body": body[10:], "more_body": False},
+    ]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "POST", "headers": []}
+    asyncio.run(processor.asgi_app(scope, receive, send))
+    processor.shutdown()
+
+    assert sent[0]["status"] == 403
+    assert sent[1]["body"] == b"Forbidden"
+
+
+def test_asgi_adapter_verifies_off_the_event_loop():
+    threads = []
+
+    def token_for(callback):
+        threads.append(threading.get_ident())
+        return TOKENS.get(callback.order_id)
+
+    processor = CallbackProcessor(token_for)
+    messages = [{"type": "http.request", "body": payload(), "more_body": False}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": "POST", "headers": []}
+    asyncio.run(processor.asgi_app(scope, receive, send))
+    processor.shutdown()
+
+    assert sent[0]["status"] == 200
+    assert threads and threads[0] != threading.get_ident()
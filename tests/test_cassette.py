@@ -0,0 +1,137 @@
+import gzip
+from decimal import Decimal
+
+import pytest
+import requests
+from coingate import CoinGate
+from coingate.cassette import (
+    Cassette,
+    CassetteMissError,
+    RecordingTransport,
+    ReplayTransport,
+)
+from coingate.exceptions import ApiException
+from coingate.http_cache import ResponseCache
+from coingate.retry import RetryPolicy
+from coingate.transport import InMemoryResponse, InMemoryTransport
+
+from .test_transport import _order, api
+
+
+def _record(calls, handler=api) -> Cassette:
+    recorder = RecordingTransport(InMemoryTransport(handler))
+    calls(CoinGate("secret_api_key", transport=recorder))
+    return recorder.cassette
+
+
+def test_replays_recorded_session_from_file(tmp_path):
+    cassette = _record(
+        lambda client: (
+            client.order.get(7),
+            list(client.order.iter_all(per_page=2, stream=True)),
+        )
+    )
+    path = str(tmp_path / "orders.jsonl.gz")
+    cassette.save(path)
+
+    client = CoinGate("other_key", transport=ReplayTransport(Cassette.load(path)))
+
+    assert client.order.get(7).id == 7
+    assert [o.id for o in client.order.iter_all(per_page=2, stream=True)] == [
+        10,
+        11,
+        20,
+        21,
+    ]
+    with gzip.open(path, "rt") as f:
+        assert "secret_api_key" not in f.read()
+
+
+def test_replays_responses_of_same_request_in_order():
+    answers = [
+        InMemoryResponse.json(_order(1), headers={"ETag": '"v1"'}),
+        InMemoryResponse(304),
+    ]
+
+    def _get_twice(client):
+        client.set_response_cache(ResponseCache())
+        client.order.get(1)
+        client.order.get(1)
+
+    cassette = _record(_get_twice, lambda request: answers.pop(0))
+    assert [i.status_code for i in cassette.interactions] == [200, 304]
+
+    client = CoinGate(transport=ReplayTransport(cassette))
+    cache = ResponseCache()
+    client.set_response_cache(cache)
+
+    assert client.order.get(1).id == client.order.get(1).id == 1
+    assert cache.hits == 1
+
+
+def test_unknown_and_exhausted_requests_raise():
+    cassette = _record(lambda client: client.order.get(1))
+    client = CoinGate(transport=ReplayTransport(cassette, repeat=False))
+
+    with pytest.raises(CassetteMissError):
+        client.order.get(2)
+    client.order.get(1)
+    with pytest.raises(CassetteMissError):
+        client.order.get(1)
+
+
+@pytest.mark.parametrize("error_status", [None, 500])
+def test_injected_errors_are_retried(error_status):
+    cassette = _record(lambda client: client.order.get(1))
+    replay = ReplayTransport(
+        cassette, error_rate=0.3, error_status=error_status, seed=2
+    )
+    client = CoinGate(transport=replay)
+    client.set_retry_policy(RetryPolicy(base_delay=0, max_attempts=10))
+
+    assert all(client.order.get(1).id == 1 for _ in range(20))
+    assert replay.replayed == 20
+    assert replay.injected_errors > 0
+
+
+def test_injected_connection_error_without_retries():
+    cassette = _record(lambda client: client.order.get(1))
+    client = CoinGate(transport=ReplayTransport(cassette, error_rate=1))
+
+    with pytest.raises(requests.ConnectionError):
+        client.order.get(1)
+
+
+def test_tokens_and_emails_are_redacted(tmp_path):
+    def create(client):
+        return client.order.create(
+            Decimal("10"),
+            "EUR",
+            "EUR",
+            token="order-secret",
+            purchaser_email="buyer@example.com",
+        )
+
+    cassette = _record(
+        create,
+        lambda request: InMemoryResponse.json({**_order(5), "token": "order-secret"}),
+    )
+    path = str(tmp_path / "orders.jsonl")
+    cassette.save(path)
+    with open(path) as f:
+        text = f.read()
+
+    assert "order-secret" not in text and "buyer@example.com" not in text
+    order = create(CoinGate(transport=ReplayTransport(Cassette.load(path))))
+    assert (order.id, order.token) == (5, "REDACTED")
+
+
+def test_injected_non_standard_status():
+    cassette = _record(lambda client: client.order.get(1))
+    client = CoinGate(
+        transport=ReplayTransport(cassette, error_rate=1, error_status=520)
+    )
+
+    with pytest.raises(ApiException) as error:
+        client.order.get(1)
+    assert error.value.status_code == 520
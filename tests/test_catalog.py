@@ -0,0 +1,118 @@
+import time
+
+from coingate.catalog import CurrencyCatalog
+from coingate.resources.public import PublicCurrency, PublicPlatform
+
+CURRENCIES = [
+    {
+        "id": 1,
+        "title": "Bitcoin",
+        "symbol": "BTC",
+        "kind": "crypto",
+        "native": True,
+        "disabled": False,
+        "disabled_message": None,
+        "merchant": {"price": True, "pay": True, "receive": True},
+        "platforms": [
+            {"id": 8, "id_name": "bitcoin", "title": "Bitcoin", "enabled": True}
+        ],
+    },
+    {
+        "id": 5,
+        "title": "Tether",
+        "symbol": "USDT",
+        "kind": "crypto",
+        "native": False,
+        "disabled": False,
+        "disabled_message": None,
+        "merchant": {"price": True, "pay": True, "receive": False},
+        "platforms": [
+            {"id": 7, "id_name": "ethereum", "title": "Ethereum", "enabled": True},
+            {"id": 2, "id_name": "tron", "title": "Tron", "enabled": False},
+        ],
+    },
+    {
+        "id": 2,
+        "title": "Euro",
+        "symbol": "EUR",
+        "kind": "fiat",
+        "native": True,
+        "disabled": False,
+        "disabled_message": None,
+        "merchant": {"price": True, "pay": False, "receive": True},
+        "platforms": None,
+    },
+]
+
+PLATFORMS = [
+    {
+        "id": 8,
+        "title": "Bitcoin",
+        "id_name": "bitcoin",
+        "disabled": False,
+        "disabled_message": None,
+        "currencies": [{"id": 1, "title": "Bitcoin", "symbol": "BTC", "enabled": True}],
+    },
+    {
+        "id": 7,
+        "title": "Ethereum",
+        "id_name": "ethereum",
+        "disabled": False,
+        "disabled_message": None,
+        "currencies": [{"id": 5, "title": "Tether", "symbol": "USDT", "enabled": True}],
+    },
+]
+
+
+class FakePublicService:
+    def __init__(self):
+        self.calls = 0
+
+    def get_currencies(self):
+        self.calls += 1
+        return [PublicCurrency(**currency) for currency in CURRENCIES]
+
+    def get_platforms(self):
+        return [PublicPlatform(**platform) for platform in PLATFORMS]
+
+
+class FakeClient:
+    def __init__(self):
+        self.public = FakePublicService()
+
+
+class TestCurrencyCatalog:
+    def setup_method(self):
+        self.client = FakeClient()
+        self.catalog = CurrencyCatalog(self.client)
+
+    def test_lookups(self):
+        assert self.catalog.currency_id("btc") == 1
+        assert self.catalog.currency(5).symbol == "USDT"
+        assert self.catalog.platform_id("ethereum") == 7
+        assert self.catalog.platform(8).id_name == "bitcoin"
+        assert self.catalog.pair("USDT", "tron").id == 2
+        assert self.catalog.currency_id("XYZ") is None
+
+        assert self.client.public.calls == 1
+
+    def test_can_pay(self):
+        assert self.catalog.can_pay("BTC")
+        assert self.catalog.can_pay("USDT", "ethereum")
+        assert not self.catalog.can_pay("USDT", "tron")
+        assert not self.catalog.can_pay("USDT", "bitcoin")
+        assert not self.catalog.can_pay("EUR")
+
+    def test_can_receive(self):
+        assert self.catalog.can_receive("EUR")
+        assert self.catalog.can_receive("BTC", "bitcoin")
+        assert not self.catalog.can_receive("USDT")
+        assert not self.catalog.can_receive("XYZ")
+
+    def test_refreshes_on_schedule(self):
+        catalog = CurrencyCatalog(self.client, refresh_interval=0.01)
+
+        with catalog:
+            time.sleep(0.1)
+
+        assert self.client.public.calls > 2
@@ -0,0 +1,136 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from coingate.frames import OrderFrame
+from coingate.resources.order import Order, PaginatedOrders
+
+
+def make_order(id, status="paid", currency="EUR", amount="10.5", **kwargs):
+    data = {
+        "id": id,
+        "status": status,
+        "do_not_convert": False,
+        "price_currency": currency,
+        "price_amount": amount,
+        "lightning_network": False,
+        "receive_currency": "BTC",
+        "receive_amount": "",
+        "created_at": "2022-10-10T12:23:22+00:00",
+        "order_id": f"shop-{id}",
+        "payment_url": f"https://pay.coingate.com/invoice/{id}",
+        "underpaid_amount": "0",
+        "overpaid_amount": "0",
+        "is_refundable": True,
+        "orderable_type": "ApiOrder",
+        "orderable_id": id,
+        "payment_address": None,
+    }
+    data.update(kwargs)
+    return Order(**data)
+
+
+@pytest.fixture
+def frame():
+    return OrderFrame.from_orders(
+        [
+            make_order(1, "paid", "EUR", "10.5"),
+            make_order(2, "new", "USD", "3"),
+            make_order(3, "paid", "EUR", "0.00000001"),
+            make_order(4, "paid", "USD", "100"),
+        ]
+    )
+
+
+def test_materializes_equal_orders():
+    order = make_order(7, payment_address="0xabc")
+    frame = OrderFrame.from_pages(
+        [
+            PaginatedOrders(
+                current_page=1,
+                per_page=1,
+                total_orders=1,
+                total_pages=1,
+                orders=[order],
+            )
+        ]
+    )
+
+    assert len(frame) == 1
+    assert frame[0] == order
+    assert frame[-1] == order
+    assert list(frame) == [order]
+    with pytest.raises(IndexError):
+        frame[1]
+
+
+def test_timezone_normalized_to_utc():
+    frame = OrderFrame.from_orders(
+        [make_order(1, created_at="2022-10-10T14:23:22+02:00")]
+    )
+
+    assert frame[0].created_at == datetime(
+        2022, 10, 10, 12, 23, 22, tzinfo=timezone.utc
+    )
+
+
+def test_interns_categories(frame):
+    assert frame.categories("status") == ["paid", "new"]
+    assert frame.column("price_currency") == ["EUR", "USD", "EUR", "USD"]
+
+
+def test_filter_by_value_and_callable(frame):
+    paid = frame.filter(status="paid")
+    assert [order.id for order in paid] == [1, 3, 4]
+
+    large = frame.filter(status="paid", price_amount=lambda amount: amount > 1)
+    assert large.column("id") == [1, 4]
+
+    assert len(frame.filter(status="expired")) == 0
+    assert frame.filter(price_amount=Decimal("3")).column("id") == [2]
+
+
+def test_group_by_and_sum(frame):
+    groups = frame.filter(status="paid").group_by("price_currency")
+
+    assert groups.keys() == {"EUR", "USD"}
+    assert groups["EUR"].sum("price_amount") == Decimal("10.50000001")
+    assert groups["USD"].sum("price_amount") == Decimal("100")
+    assert frame.count_by("status") == {"paid": 3, "new": 1}
+
+
+def test_group_by_requires_category_column(frame):
+    with pytest.raises(ValueError):
+        frame.group_by("order_id")
+
+
+def test_rejects_amounts_beyond_scale():
+    frame = OrderFrame(scale=2)
+
+    with pytest.raises(ValueError):
+        frame.append(make_order(1, amount="0.001"))
+    assert len(frame) == 0
+    assert all(len(frame.column(name)) == 0 for name in ("id", "status", "order_id"))
+
+
+def test_rejects_amounts_beyond_64_bits_without_misaligning_columns():
+    frame = OrderFrame.from_orders([make_order(1)])
+
+    with pytest.raises(ValueError):
+        frame.append(make_order(2, amount="100000000000"))
+    assert all(len(frame.column(name)) == 1 for name in ("id", "price_amount"))
+    assert frame[0].id == 1
+
+
+def test_rejects_category_beyond_16_bit_codes_without_misaligning_columns():
+    order = make_order(1)
+    frame = OrderFrame.from_orders(
+        order.copy(update={"price_currency": str(i)}) for i in range(2**16)
+    )
+
+    with pytest.raises(ValueError):
+        frame.append(make_order(2, status="new", currency="EUR"))
+    assert all(len(frame.column(name)) == 2**16 for name in ("id", "status"))
+    assert frame.categories("status") == ["paid"]
+    frame.append(make_order(3, currency="0"))
+    assert frame[-1].price_currency == "0"
@@ -0,0 +1,153 @@
+import json
+
+import pytest
+import requests
+from coingate import CoinGate
+from coingate.http_cache import (
+    CacheEntry,
+    CacheStore,
+    FileCacheStore,
+    MemoryCacheStore,
+    ResponseCache,
+)
+from requests.adapters import BaseAdapter
+
+PLATFORMS = [
+    {
+        "id": 1,
+        "title": "Ethereum (ERC20)",
+        "id_name": "ethereum",
+        "disabled": False,
+        "disabled_message": None,
+        "currencies": [],
+    }
+]
+
+
+class ETagAdapter(BaseAdapter):
+    def __init__(self, body, etag='"v1"'):
+        super().__init__()
+        self.body = json.dumps(body).encode()
+        self.etag = etag
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        if request.headers.get("If-None-Match") == self.etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = self.body
+            response.headers["ETag"] = self.etag
+            response.headers["Content-Type"] = "application/json"
+
+        return response
+
+    def close(self):
+        pass
+
+
+def _entry(size: int) -> CacheEntry:
+    return CacheEntry(url="https://example.com", headers={}, content=b"x" * size)
+
+
+class TestResponseCache:
+    def setup_method(self):
+        self.client = CoinGate()
+        self.adapter = ETagAdapter(PLATFORMS)
+        self.client._http_client.transport.session.mount("https://", self.adapter)
+        self.cache = ResponseCache()
+        self.client.set_response_cache(self.cache)
+
+    def test_serves_cached_body_on_not_modified(self):
+        first = self.client.public.get_platforms()
+        second = self.client.public.get_platforms()
+
+        assert first == second
+        assert "If-None-Match" not in self.adapter.requests[0].headers
+        assert self.adapter.requests[1].headers["If-None-Match"] == '"v1"'
+        assert (self.cache.hits, self.cache.misses) == (1, 1)
+
+    def test_reuses_parsed_body(self):
+        self.client.request("get", "v2/platforms")
+        cached = self.client.request("get", "v2/platforms")
+
+        assert cached.json() is cached.json()
+
+    def test_separate_entries_per_params(self):
+        self.client.public.get_platforms(enabled=True)
+        self.client.public.get_platforms(enabled=False)
+
+        assert "If-None-Match" not in self.adapter.requests[1].headers
+        assert len(self.cache.store) == 2
+
+    def test_separate_entries_per_api_key(self):
+        self.client.set_api_key("first")
+        self.client.public.get_platforms()
+        self.client.set_api_key("second")
+        self.client.public.get_platforms()
+
+        assert "If-None-Match" not in self.adapter.requests[1].headers
+        assert len(self.cache.store) == 2
+        assert ResponseCache.key("https://x", authorization="Token a") != (
+            ResponseCache.key("https://x", authorization="Token b")
+        )
+
+    def test_does_not_cache_unsafe_methods(self):
+        assert ResponseCache.is_cacheable("get")
+        assert not ResponseCache.is_cacheable("post")
+
+
+class TestMemoryCacheStore:
+    def test_evicts_least_recently_used(self):
+        store = MemoryCacheStore(max_entries=2)
+        store.set("a", _entry(1))
+        store.set("b", _entry(1))
+        store.get("a")
+        store.set("c", _entry(1))
+
+        assert store.get("b") is None
+        assert store.get("a") is not None
+        assert store.evictions == 1
+
+    def test_limits_total_size(self):
+        store = MemoryCacheStore(max_bytes=10)
+        store.set("a", _entry(6))
+        store.set("b", _entry(6))
+        store.set("too-big", _entry(11))
+
+        assert store.get("a") is None
+        assert store.get("too-big") is None
+        assert store.size == 6
+
+
+class TestFileCacheStore:
+    def test_round_trip(self, tmp_path):
+        store = FileCacheStore(tmp_path / "cache")
+        entry = CacheEntry(
+            url="https://example.com",
+            headers={"ETag": '"v1"'},
+            content=b"\x00body",
+            etag='"v1"',
+        )
+
+        store.set("key", entry)
+
+        assert FileCacheStore(tmp_path / "cache").get("key") == entry
+
+        store.clear()
+        assert store.get("key") is None
+
+
+def test_store_missing_methods_cannot_be_created():
+    class Incomplete(CacheStore):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,102 @@
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+from coingate import CoinGate
+from coingate.transport import PoolLimits
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+ACCOUNT = {
+    "id": "01G3",
+    "balance": "1.5",
+    "status": "active",
+    "currency": {"id": 1, "title": "Bitcoin", "symbol": "BTC"},
+}
+
+
+class EchoAdapter(BaseAdapter):
+    def __init__(self):
+        super().__init__()
+        self.lock = threading.Lock()
+        self.headers = []
+
+    def send(self, request, **kwargs):
+        with self.lock:
+            self.headers.append(dict(request.headers))
+
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.status_code = 200
+        response._content = json.dumps(ACCOUNT).encode()
+        return response
+
+    def close(self):
+        pass
+
+
+def test_mounts_adapters_with_pool_limits():
+    client = CoinGate(pool_limits=PoolLimits(maxsize=64, block=True))
+
+    for prefix in ("https://", "http://"):
+        adapter = client._http_client.transport.session.adapters[prefix]
+        assert isinstance(adapter, HTTPAdapter)
+        assert adapter._pool_maxsize == 64
+        assert adapter._pool_block is True
+
+
+def test_default_headers_are_immutable():
+    client = CoinGate("first")
+    headers = client._http_client.default_headers
+
+    client.set_api_key("second")
+
+    assert headers["Authorization"] == "Token first"
+    assert client._http_client.default_headers["Authorization"] == "Token second"
+    assert client._http_client.api_key == "second"
+    with pytest.raises(TypeError):
+        headers["Authorization"] = "Token third"  # type: ignore
+
+
+def test_keep_alive_can_be_disabled():
+    client = CoinGate(pool_limits=PoolLimits(keep_alive=False))
+    adapter = EchoAdapter()
+    client._http_client.transport.session.mount("https://", adapter)
+
+    client.ledger.get("01G3")
+
+    assert adapter.headers[0]["Connection"] == "close"
+
+
+def test_headers_stay_consistent_while_updated_from_other_threads():
+    client = CoinGate("key-0")
+    adapter = EchoAdapter()
+    client._http_client.transport.session.mount("https://", adapter)
+    stop = threading.Event()
+
+    def update_headers():
+        version = 0
+        while not stop.is_set():
+            version += 1
+            client.set_api_key(f"key-{version}")
+            client.set_app_info("shop", version=str(version))
+
+    updater = threading.Thread(target=update_headers)
+    updater.start()
+    try:
+        with ThreadPoolExecutor(64) as executor:
+            accounts = list(
+                executor.map(lambda _: client.ledger.get("01G3"), range(640))
+            )
+    finally:
+        stop.set()
+        updater.join()
+
+    assert len(accounts) == 640
+    for headers in adapter.headers:
+        assert headers["Authorization"].startswith("Token key-")
+        assert headers["User-Agent"].startswith("CoinGate/v2")
+    # Session defaults are never touched, headers are built per request
+    assert "Authorization" not in client._http_client.transport.session.headers
@@ -0,0 +1,106 @@
+import json
+from decimal import Decimal
+
+import pytest
+import requests
+from coingate import CoinGate
+from coingate.http_cache import ResponseCache
+from coingate.json_codec import JSONCodec, OrjsonCodec
+from requests.adapters import BaseAdapter
+
+RATES = {"EUR": {"BTC": "0.0000472", "USD": "1.08"}}
+
+
+class StaticAdapter(BaseAdapter):
+    def __init__(self, body: bytes, headers=None):
+        super().__init__()
+        self.body = body
+        self.headers = headers or {}
+
+    def send(self, request, **kwargs):
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        etag = self.headers.get("ETag")
+        if etag is not None and request.headers.get("If-None-Match") == etag:
+            response.status_code = 304
+            response._content = b""
+        else:
+            response.status_code = 200
+            response._content = self.body
+            response.headers.update(self.headers)
+        return response
+
+    def close(self):
+        pass
+
+
+class CountingCodec(JSONCodec):
+    def __init__(self):
+        self.calls = 0
+
+    def loads(self, data):
+        self.calls += 1
+        return super().loads(data)
+
+
+def test_decodes_floats_into_exact_decimals():
+    data = JSONCodec().loads(b'{"rate": 0.10000000000000000555, "count": 3}')
+
+    assert data == {"rate": Decimal("0.10000000000000000555"), "count": 3}
+    assert type(data["count"]) is int
+
+
+@pytest.mark.parametrize(
+    "body",
+    [
+        json.dumps(RATES).encode(),
+        b'{"note": "ratio:1.5", "id": 1, "paid": true, "fee": null}',
+        '{"name": "ünïcödé"}',
+    ],
+)
+def test_orjson_codec_matches_stdlib_codec(body):
+    pytest.importorskip("orjson")
+
+    assert OrjsonCodec().loads(body) == JSONCodec().loads(body)
+
+
+def test_client_decodes_exact_decimals_by_default():
+    client = CoinGate()
+    client._http_client.transport.session.mount(
+        "https://", StaticAdapter(b'{"EUR": {"BTC": 0.10000000000000000555}}')
+    )
+
+    rates = client.public.get_merchant_exchange_rates()
+
+    assert rates["EUR"]["BTC"] == Decimal("0.10000000000000000555")
+
+
+def test_client_decodes_with_configured_codec():
+    client = CoinGate()
+    client._http_client.transport.session.mount(
+        "https://", StaticAdapter(json.dumps(RATES).encode())
+    )
+    codec = CountingCodec()
+    client.set_json_codec(codec)
+
+    rates = client.public.get_merchant_exchange_rates()
+
+    assert codec.calls == 1
+    assert rates["EUR"]["BTC"] == "0.0000472"
+
+
+def test_cached_body_is_decoded_once_per_codec():
+    client = CoinGate()
+    client._http_client.transport.session.mount(
+        "https://", StaticAdapter(json.dumps(RATES).encode(), {"ETag": '"v1"'})
+    )
+    client.set_response_cache(ResponseCache())
+    codec = CountingCodec()
+    client.set_json_codec(codec)
+
+    for _ in range(3):
+        client.public.get_merchant_exchange_rates()
+
+    # First response is decoded, then the first hit decodes cached body once
+    assert codec.calls == 2
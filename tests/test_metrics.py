@@ -0,0 +1,146 @@
+import pytest
+from coingate import CoinGate
+from coingate.exceptions import InternalServerErrorException, OrderNotFoundException
+from coingate.metrics import MetricsRegistry, endpoint_template
+from coingate.retry import RetryPolicy
+from coingate.transport import InMemoryResponse, InMemoryTransport
+
+from .test_transport import _order
+
+
+def _client(*answers):
+    answers = list(answers)
+    client = CoinGate("api_key", transport=InMemoryTransport(lambda r: answers.pop(0)))
+    client.set_retry_policy(RetryPolicy(base_delay=0))
+    return client
+
+
+@pytest.mark.parametrize(
+    "url, template",
+    [
+        ("https://api.coingate.com/v2/orders/123", "v2/orders/{id}"),
+        ("https://api.coingate.com/v2/orders?page=2", "v2/orders"),
+        (
+            "https://api.coingate.com/v2/orders/1/refunds/2",
+            "v2/orders/{id}/refunds/{id}",
+        ),
+        (
+            "https://api.coingate.com/v2/rates/merchant/EUR/BTC",
+            "v2/rates/merchant/{currency}/{currency}",
+        ),
+        (
+            "https://api.coingate.com/v2/ledger/accounts/01GA9PQ8",
+            "v2/ledger/accounts/{id}",
+        ),
+    ],
+)
+def test_endpoint_template(url, template):
+    assert endpoint_template(url) == template
+
+
+def test_hooks_are_called_in_order():
+    client = _client(
+        InMemoryResponse.json({"reason": "InternalServerError"}, 500),
+        InMemoryResponse.json(_order(1)),
+    )
+    events = []
+    client.add_hook("before_request", lambda request: events.append("before"))
+    client.add_hook(
+        "after_response",
+        lambda request, response, timing: events.append(response.status_code),
+    )
+    client.add_hook(
+        "on_error", lambda request, error, timing: events.append(type(error).__name__)
+    )
+    client.add_hook(
+        "on_retry",
+        lambda request, attempt, error, delay: events.append(f"retry {attempt}"),
+    )
+
+    client.order.get(1)
+
+    assert events == [
+        "before",
+        500,
+        "InternalServerErrorException",
+        "retry 1",
+        "before",
+        200,
+    ]
+
+
+def test_unknown_event_is_rejected():
+    with pytest.raises(ValueError):
+        CoinGate().add_hook("on_success", print)
+
+
+def test_metrics_registry_records_requests():
+    client = _client(
+        InMemoryResponse.json({"reason": "InternalServerError"}, 500),
+        InMemoryResponse.json(_order(1)),
+        InMemoryResponse.json({"reason": "OrderNotFound"}, 404),
+    )
+    metrics = MetricsRegistry(buckets=(0.1, 1))
+    client.set_metrics(metrics)
+
+    client.order.get(1)
+    with pytest.raises(OrderNotFoundException):
+        client.order.get(2)
+
+    values = {(name, tuple(labels.items())): v for name, labels, v in metrics.samples()}
+    get = (("method", "GET"), ("endpoint", "v2/orders/{id}"))
+    assert values[("coingate_request_duration_seconds_count", get)] == 3
+    assert (
+        values[("coingate_request_duration_seconds_bucket", get + (("le", "+Inf"),))]
+        == 3
+    )
+    assert values[("coingate_responses_total", get + (("status", "500"),))] == 1
+    assert values[("coingate_responses_total", get + (("status", "200"),))] == 1
+    assert values[("coingate_retries_total", get)] == 1
+    assert (
+        values[
+            ("coingate_errors_total", get + (("exception", "OrderNotFoundException"),))
+        ]
+        == 1
+    )
+    assert values[("coingate_response_bytes_total", get)] > 0
+
+
+def test_set_metrics_replaces_previous_registry():
+    client = _client(InMemoryResponse.json(_order(1)), InMemoryResponse.json(_order(1)))
+    first, second = MetricsRegistry(), MetricsRegistry()
+    client.set_metrics(first)
+    client.order.get(1)
+    client.set_metrics(second)
+    client.order.get(1)
+    client.set_metrics(None)
+
+    assert sum(v for n, _, v in first.samples() if n == "coingate_responses_total") == 1
+    assert (
+        sum(v for n, _, v in second.samples() if n == "coingate_responses_total") == 1
+    )
+    assert not client._http_client.hooks
+
+
+def test_prometheus_exposition_format():
+    client = _client(
+        InMemoryResponse.json({"reason": "InternalServerError"}, 500),
+        InMemoryResponse.json({"reason": "InternalServerError"}, 500),
+    )
+    client.set_retry_policy(None)
+    metrics = MetricsRegistry(buckets=(0.1,))
+    client.set_metrics(metrics)
+
+    for _ in range(2):
+        with pytest.raises(InternalServerErrorException):
+            client.order.get(1)
+
+    lines = metrics.prometheus().splitlines()
+    labels = 'method="GET",endpoint="v2/orders/{id}"'
+    assert "# TYPE coingate_request_duration_seconds histogram" in lines
+    assert f'coingate_request_duration_seconds_bucket{{{labels},le="0.1"}} 2' in lines
+    assert f'coingate_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+    assert f"coingate_request_duration_seconds_count{{{labels}}} 2" in lines
+    assert "# TYPE coingate_responses_total counter" in lines
+    assert f'coingate_responses_total{{{labels},status="500"}} 2' in lines
+    assert lines.count("# TYPE coingate_responses_total counter") == 1
@@ -0,0 +1,259 @@
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from coingate.mirror import SQLiteMirror, SyncResult
+from coingate.parsing import parse_resource
+from coingate.resources.order import Order
+from coingate.resources.refund import PaginatedRefunds, PaginatedRefundsRefund
+from coingate.resources.withdrawal import PaginatedWithdrawals, Withdrawal
+
+START = datetime(2022, 10, 1, tzinfo=timezone.utc)
+
+
+def make_order(id, status="paid", day=0):
+    return Order(
+        id=id,
+        status=status,
+        do_not_convert=False,
+        price_currency="EUR",
+        price_amount="10.10",
+        lightning_network=False,
+        receive_currency="BTC",
+        receive_amount="",
+        created_at=START + timedelta(days=day),
+        order_id=f"shop-{id % 3}",
+        payment_url=f"https://pay.coingate.com/invoice/{id}",
+        underpaid_amount="0",
+        overpaid_amount="0",
+        is_refundable=True,
+        orderable_type="ApiOrder",
+        orderable_id=id,
+        payment_address=None,
+    )
+
+
+def make_refund(id, order_id=1, status="pending"):
+    return PaginatedRefundsRefund(
+        id=id,
+        request_amount="5",
+        refund_amount="5",
+        crypto_address=None,
+        crypto_address_memo=None,
+        status=status,
+        order={"id": order_id},
+        refund_currency={
+            "id": 1,
+            "title": "Bitcoin",
+            "symbol": "BTC",
+            "platform": {"id": 1, "title": "Bitcoin"},
+        },
+    )
+
+
+def make_withdrawal(id, day=0, status="completed"):
+    return Withdrawal(
+        id=id,
+        status=status,
+        amount="1.5",
+        created_at=START + timedelta(days=day),
+        completed_at=None,
+        currency={"id": 1, "title": "Bitcoin", "symbol": "BTC"},
+        payout_setting={"id": 1},
+        platform=None,
+    )
+
+
+def paginate(items, page, per_page=2):
+    total_pages = max(1, -(-len(items) // per_page))
+    return items[(page - 1) * per_page : page * per_page], total_pages
+
+
+class FakeOrderService:
+    def __init__(self):
+        self.orders = []
+        self.created_from = []
+
+    def iter_all(self, *, sort=None, created_from=None):
+        self.created_from.append(created_from)
+        orders = sorted(self.orders, key=lambda order: order.created_at)
+        if created_from is not None:
+            orders = [o for o in orders if o.created_at.date() >= created_from.date()]
+        return iter(orders)
+
+
+class FakeRefundService:
+    def __init__(self):
+        self.refunds = []
+        self.pages = []
+        self.failing_page = None
+
+    def get_refunds(self, *, page=1):
+        self.pages.append(page)
+        if page == self.failing_page:
+            raise ConnectionError
+        refunds = sorted(self.refunds, key=lambda refund: -refund.id)
+        items, total_pages = paginate(refunds, page)
+        return PaginatedRefunds(
+            current_page=page,
+            per_page=2,
+            total_refunds=len(refunds),
+            total_pages=total_pages,
+            refunds=items,
+        )
+
+
+class FakeWithdrawalService:
+    def __init__(self):
+        self.withdrawals = []
+        self.pages = []
+        self.failing_page = None
+
+    def get_all(self, *, page=1):
+        self.pages.append(page)
+        if page == self.failing_page:
+            raise ConnectionError
+        withdrawals = sorted(self.withdrawals, key=lambda w: w.created_at, reverse=True)
+        items, total_pages = paginate(withdrawals, page)
+        return PaginatedWithdrawals(
+            current_page=page,
+            per_page=2,
+            total_withdrawals=len(withdrawals),
+            total_pages=total_pages,
+            withdrawals=items,
+        )
+
+
+class FakeClient:
+    def __init__(self):
+        self.order = FakeOrderService()
+        self.refund = FakeRefundService()
+        self.withdrawal = FakeWithdrawalService()
+
+    def parse_resource(self, model, data):
+        return parse_resource(model, data)
+
+
+def test_first_sync_mirrors_everything_and_reads_back_equal_resources():
+    client = FakeClient()
+    client.order.orders = [make_order(i, day=i) for i in range(1, 6)]
+    client.refund.refunds = [make_refund(1), make_refund(2, order_id=3)]
+    client.withdrawal.withdrawals = [make_withdrawal(1, day=2)]
+
+    with SQLiteMirror(client) as mirror:
+        assert mirror.sync() == SyncResult(orders=5, refunds=2, withdrawals=1)
+
+        assert mirror.order(3) == client.order.orders[2]
+        assert mirror.order(3).price_amount == Decimal("10.10")
+        assert mirror.order(42) is None
+        assert mirror.refund(2) == client.refund.refunds[1]
+        assert mirror.withdrawal(1) == client.withdrawal.withdrawals[0]
+        assert mirror.watermark("orders") == START + timedelta(days=5)
+
+
+def test_queries_by_merchant_id_status_and_date():
+    client = FakeClient()
+    client.order.orders = [
+        make_order(1, "paid", day=1),
+        make_order(2, "expired", day=2),
+        make_order(3, "paid", day=3),
+        make_order(4, "paid", day=4),
+    ]
+    client.refund.refunds = [make_refund(1, order_id=1), make_refund(2, order_id=3)]
+
+    mirror = SQLiteMirror(client)
+    mirror.sync()
+
+    assert [o.id for o in mirror.orders_by_merchant_id("shop-1")] == [4, 1]
+    assert [o.id for o in mirror.orders(status="paid")] == [4, 3, 1]
+    assert [
+        o.id
+        for o in mirror.orders(
+            created_from=START + timedelta(days=2), created_to=START + timedelta(days=4)
+        )
+    ] == [3, 2]
+    assert [o.id for o in mirror.orders(limit=1)] == [4]
+    assert [r.id for r in mirror.refunds(order_id=3)] == [2]
+
+
+def test_incremental_sync_fetches_from_watermark_minus_rescan_window():
+    client = FakeClient()
+    client.order.orders = [make_order(i, day=i) for i in range(1, 11)]
+
+    mirror = SQLiteMirror(client, rescan_window=timedelta(days=2))
+    mirror.sync_orders()
+
+    client.order.orders[8] = make_order(9, "refunded", day=9)
+    client.order.orders[1] = make_order(2, "refunded", day=2)
+    client.order.orders.append(make_order(11, day=11))
+
+    assert mirror.sync_orders() == 4
+    assert client.order.created_from[-1] == START + timedelta(days=8)
+    assert mirror.order(9).status == "refunded"
+    # Outside of the re-scan window
+    assert mirror.order(2).status == "paid"
+    assert mirror.order(11) is not None
+
+    mirror.sync_orders(full=True)
+    assert mirror.order(2).status == "refunded"
+
+
+def test_incremental_sync_stops_paging_at_mirrored_records():
+    client = FakeClient()
+    client.refund.refunds = [make_refund(i) for i in range(1, 9)]
+    client.withdrawal.withdrawals = [make_withdrawal(i, day=i * 5) for i in range(1, 9)]
+
+    mirror = SQLiteMirror(client, rescan_window=timedelta(days=1))
+    mirror.sync()
+    client.refund.pages.clear()
+    client.withdrawal.pages.clear()
+
+    client.refund.refunds.append(make_refund(9, status="completed"))
+    client.withdrawal.withdrawals.append(make_withdrawal(9, day=50))
+
+    result = mirror.sync()
+
+    assert client.refund.pages == [1, 2]
+    assert client.withdrawal.pages == [1, 2]
+    assert mirror.refund(9).status == "completed"
+    assert result.refunds == 4
+    assert len(mirror.withdrawals()) == 9
+
+
+def test_interrupted_newest_first_sync_is_backfilled_by_next_sync():
+    client = FakeClient()
+    client.refund.refunds = [make_refund(i) for i in range(1, 9)]
+    client.withdrawal.withdrawals = [make_withdrawal(i, day=i * 5) for i in range(1, 9)]
+    client.refund.failing_page = client.withdrawal.failing_page = 3
+
+    mirror = SQLiteMirror(client, rescan_window=timedelta(days=1), batch_size=2)
+    with pytest.raises(ConnectionError):
+        mirror.sync_refunds()
+    with pytest.raises(ConnectionError):
+        mirror.sync_withdrawals()
+    # Newest pages were committed, but do not count as mirrored
+    assert len(mirror.refunds()) == len(mirror.withdrawals()) == 4
+    assert mirror.watermark("withdrawals") is None
+
+    client.refund.failing_page = client.withdrawal.failing_page = None
+    mirror.sync()
+    assert len(mirror.refunds()) == len(mirror.withdrawals()) == 8
+    assert mirror.watermark("withdrawals") == START + timedelta(days=40)
+
+    # Interrupted incremental sync keeps the previous watermark
+    client.refund.refunds += [make_refund(i) for i in range(9, 15)]
+    client.withdrawal.withdrawals += [
+        make_withdrawal(i, day=i * 5) for i in range(9, 15)
+    ]
+    client.refund.failing_page = client.withdrawal.failing_page = 3
+    with pytest.raises(ConnectionError):
+        mirror.sync_refunds()
+    with pytest.raises(ConnectionError):
+        mirror.sync_withdrawals()
+    assert mirror.watermark("withdrawals") == START + timedelta(days=40)
+
+    client.refund.failing_page = client.withdrawal.failing_page = None
+    mirror.sync()
+    assert [r.id for r in mirror.refunds()] == list(range(14, 0, -1))
+    assert len(mirror.withdrawals()) == 14
+    assert mirror.watermark("withdrawals") == START + timedelta(days=70)
@@ -0,0 +1,155 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+from coingate.pagination import (
+    afetch_pages_concurrently,
+    aiterate_pages,
+    fetch_pages_concurrently,
+    iterate_pages,
+)
+
+
+@dataclass
+class FakePage:
+    current_page: int
+    total_pages: int
+    items: List[int] = field(default_factory=list)
+
+
+def _make_fetcher(total_pages: int, per_page: int = 3):
+    fetched: List[int] = []
+
+    def fetch_page(page: int) -> FakePage:
+        fetched.append(page)
+        start = (page - 1) * per_page
+        return FakePage(page, total_pages, list(range(start, start + per_page)))
+
+    return fetch_page, fetched
+
+
+class TestIteratePages:
+    @pytest.mark.parametrize("prefetch", [True, False])
+    def test_yields_items_of_every_page(self, prefetch: bool):
+        fetch_page, fetched = _make_fetcher(total_pages=4)
+
+        items = list(iterate_pages(fetch_page, lambda p: p.items, prefetch=prefetch))
+
+        assert items == list(range(12))
+        assert sorted(fetched) == [1, 2, 3, 4]
+
+    def test_empty_result(self):
+        items = list(iterate_pages(lambda page: FakePage(1, 0), lambda p: p.items))
+
+        assert items == []
+
+    def test_prefetches_next_page_while_consuming(self):
+        second_page_requested = threading.Event()
+
+        def fetch_page(page: int) -> FakePage:
+            if page == 2:
+                second_page_requested.set()
+            return FakePage(page, 2, [page])
+
+        iterator = iterate_pages(fetch_page, lambda p: p.items)
+
+        assert next(iterator) == 1
+        assert second_page_requested.wait(timeout=1)
+        assert list(iterator) == [2]
+
+    def test_stops_fetching_when_closed(self):
+        fetch_page, fetched = _make_fetcher(total_pages=100)
+
+        iterator = iterate_pages(fetch_page, lambda p: p.items, prefetch=False)
+        assert next(iterator) == 0
+        iterator.close()
+
+        assert fetched == [1]
+
+    def test_propagates_errors(self):
+        def fetch_page(page: int) -> FakePage:
+            if page == 2:
+                raise RuntimeError("boom")
+            return FakePage(page, 3, [page])
+
+        with pytest.raises(RuntimeError):
+            list(iterate_pages(fetch_page, lambda p: p.items))
+
+
+@dataclass(frozen=True)
+class FakeItem:
+    id: int
+
+
+class TestFetchPagesConcurrently:
+    def test_merges_pages_in_order(self):
+        def fetch_page(page: int) -> FakePage:
+            # Later pages finish first, merge must still follow page order
+            time.sleep((5 - page) * 0.01)
+            return FakePage(page, 5, [FakeItem(page * 10 + i) for i in range(2)])
+
+        result = fetch_pages_concurrently(fetch_page, lambda p: p.items, workers=5)
+
+        assert [item.id for item in result.items] == [
+            page * 10 + i for page in range(1, 6) for i in range(2)
+        ]
+        assert result.total_pages == 5
+        assert result.is_complete
+
+    def test_removes_records_shifted_between_pages(self):
+        pages = {1: [1, 2, 3], 2: [3, 4, 5], 3: [5, 6]}
+
+        result = fetch_pages_concurrently(
+            lambda page: FakePage(page, 3, [FakeItem(i) for i in pages[page]]),
+            lambda p: p.items,
+        )
+
+        assert [item.id for item in result.items] == [1, 2, 3, 4, 5, 6]
+
+    def test_reports_failed_pages(self):
+        error = RuntimeError("boom")
+
+        def fetch_page(page: int) -> FakePage:
+            if page == 3:
+                raise error
+            return FakePage(page, 4, [FakeItem(page)])
+
+        result = fetch_pages_concurrently(fetch_page, lambda p: p.items)
+
+        assert [item.id for item in result.items] == [1, 2, 4]
+        assert result.failed_pages == {3: error}
+        assert not result.is_complete
+
+    def test_async_limits_concurrency(self):
+        in_flight = []
+        peak = []
+
+        async def fetch_page(page: int) -> FakePage:
+            in_flight.append(page)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.01)
+            in_flight.remove(page)
+            return FakePage(page, 10, [FakeItem(page)])
+
+        result = asyncio.run(
+            afetch_pages_concurrently(fetch_page, lambda p: p.items, workers=3)
+        )
+
+        assert [item.id for item in result.items] == list(range(1, 11))
+        assert max(peak) == 3
+
+
+class TestAsyncIteratePages:
+    def test_yields_items_of_every_page(self):
+        async def fetch_page(page: int) -> FakePage:
+            return FakePage(page, 3, [page * 10, page * 10 + 1])
+
+        async def _collect():
+            return [
+                item async for item in aiterate_pages(fetch_page, lambda p: p.items)
+            ]
+
+        assert asyncio.run(_collect()) == [10, 11, 20, 21, 30, 31]
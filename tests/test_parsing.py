@@ -0,0 +1,134 @@
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+from coingate import CoinGate
+from coingate.parsing import construct_resource, parse_resource
+from coingate.resources.order import Checkout, PaginatedOrders
+from coingate.resources.public import ExchangesRates
+from coingate.resources.refund import Refund
+from coingate.resources.withdrawal import Withdrawal
+from pydantic import ValidationError
+
+ORDER = {
+    "id": 123,
+    "status": "paid",
+    "do_not_convert": False,
+    "price_currency": "EUR",
+    "price_amount": "10.5",
+    "lightning_network": False,
+    "receive_currency": "EUR",
+    "receive_amount": 10.5,
+    "created_at": "2022-10-10T12:23:22+00:00",
+    "order_id": "shop-123",
+    "payment_url": "https://pay.coingate.com/invoice/1",
+    "underpaid_amount": "0",
+    "overpaid_amount": 0.001,
+    "is_refundable": True,
+    "orderable_type": "ApiOrder",
+    "orderable_id": 1,
+    "payment_address": None,
+    "unknown_field": "ignored",
+}
+
+PAYLOADS = [
+    (
+        PaginatedOrders,
+        {
+            "current_page": 1,
+            "per_page": 100,
+            "total_orders": 2,
+            "total_pages": 1,
+            "orders": [ORDER, {**ORDER, "id": 124}],
+        },
+    ),
+    (
+        Checkout,
+        {
+            **ORDER,
+            "pay_currency": "BTC",
+            "pay_amount": "0.0001",
+            "expire_at": "2022-10-10T12:43:22Z",
+            "payment_address": "addy",
+        },
+    ),
+    (
+        Refund,
+        {
+            "id": 1,
+            "request_amount": "10",
+            "refund_amount": "10",
+            "address": "addy",
+            "status": "pending",
+            "created_at": "2022-10-10T12:23:22+00:00",
+            "order": {"id": 1},
+            "refund_currency": {
+                "id": 1,
+                "title": "Bitcoin",
+                "symbol": "BTC",
+                "platform": {"id": 1, "title": "Bitcoin"},
+            },
+            "transactions": [],
+            "ledger_account": {
+                "id": "01GBPW7M2G5XQK3BE50XQRA36E",
+                "currency": {"id": 1, "title": "Bitcoin", "symbol": "BTC"},
+            },
+        },
+    ),
+    (
+        ExchangesRates,
+        {
+            "merchant": {"BTC": {"EUR": "7449.99", "USD": None}},
+            "trader": {"buy": {"BTC": {"EUR": "7500"}}, "sell": {}},
+        },
+    ),
+    (
+        Withdrawal,
+        {
+            "id": 1,
+            "status": "completed",
+            "amount": "0.5",
+            "created_at": "2022-10-10T12:23:22+00:00",
+            "completed_at": None,
+            "currency": {"id": 1, "title": "Bitcoin", "symbol": "BTC"},
+            "payout_setting": {"id": 1, "title": "somewhere"},
+            "platform": None,
+        },
+    ),
+]
+
+
+class TestConstructResource:
+    @pytest.mark.parametrize("model,data", PAYLOADS)
+    def test_equals_validated_resource(self, model, data):
+        constructed = construct_resource(model, data)
+
+        assert constructed == model(**data)
+        assert constructed.__fields_set__ == model(**data).__fields_set__
+
+    def test_coerces_field_types(self):
+        orders = construct_resource(PaginatedOrders, PAYLOADS[0][1])
+        order = orders.orders[0]
+
+        assert order.price_amount == Decimal("10.5")
+        assert order.overpaid_amount == Decimal("0.001")
+        assert order.receive_amount == "10.5"
+        assert order.created_at == datetime(
+            2022, 10, 10, 12, 23, 22, tzinfo=timezone.utc
+        )
+        assert not hasattr(order, "unknown_field")
+
+    def test_parse_resource_validates_by_default(self):
+        with pytest.raises(ValidationError):
+            parse_resource(Withdrawal, {"id": 1})
+
+        assert parse_resource(Withdrawal, {"id": 1}, validate=False).id == 1
+
+    def test_client_option(self):
+        client = CoinGate()
+        data = PAYLOADS[0][1]
+
+        assert client.parse_resource(PaginatedOrders, data) == PaginatedOrders(**data)
+
+        client.set_resource_validation(False)
+        assert client.parse_resource(Withdrawal, {"id": 1}).id == 1
@@ -0,0 +1,120 @@
+import threading
+import time
+
+import pytest
+from coingate.rate_limit import (
+    RateLimiter,
+    TokenBucket,
+    endpoint_group,
+    retry_delay_from_headers,
+)
+
+
+class TestTokenBucket:
+    def test_burst_does_not_wait(self):
+        bucket = TokenBucket(rate=10, capacity=5)
+
+        waits = [bucket.acquire() for _ in range(5)]
+
+        assert waits == [0.0] * 5
+        assert bucket.stats().delayed == 0
+
+    def test_queues_callers_over_capacity(self):
+        bucket = TokenBucket(rate=50, capacity=1)
+
+        started = time.monotonic()
+        for _ in range(4):
+            bucket.acquire()
+        elapsed = time.monotonic() - started
+
+        stats = bucket.stats()
+        assert elapsed == pytest.approx(3 / 50, abs=0.03)
+        assert stats.acquired == 4
+        assert stats.delayed == 3
+        assert stats.queue_depth == 0
+        assert stats.max_wait == pytest.approx(1 / 50, abs=0.01)
+
+    def test_reports_queue_depth_of_waiting_callers(self):
+        bucket = TokenBucket(rate=5, capacity=1)
+        bucket.acquire()
+
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        time.sleep(0.05)
+
+        assert bucket.stats().queue_depth == 3
+
+        for thread in threads:
+            thread.join()
+        assert bucket.stats().queue_depth == 0
+
+    def test_pause_holds_back_callers(self):
+        bucket = TokenBucket(rate=100, capacity=10)
+        bucket.pause(0.05)
+
+        assert bucket.acquire() == pytest.approx(0.05, abs=0.01)
+
+
+class TestRateLimiter:
+    @pytest.mark.parametrize(
+        "url,group",
+        [
+            ("https://api.coingate.com/v2/orders", "orders"),
+            ("https://api.coingate.com/v2/orders/1/checkout", "orders"),
+            ("https://api.coingate.com/v2/orders/1/refunds", "refunds"),
+            ("https://api.coingate.com/v2/refunds", "refunds"),
+            ("https://api.coingate.com/v2/rates/merchant/EUR/BTC", "rates"),
+            ("https://api.coingate.com/v2/ledger/accounts", "ledger"),
+        ],
+    )
+    def test_endpoint_group(self, url: str, group: str):
+        assert endpoint_group(url) == group
+
+    def test_uses_bucket_of_endpoint_group(self):
+        orders = TokenBucket(1)
+        default = TokenBucket(1)
+        limiter = RateLimiter({"orders": orders}, default=default)
+
+        limiter.acquire("https://api.coingate.com/v2/orders")
+        limiter.acquire("https://api.coingate.com/v2/ping")
+
+        assert orders.stats().acquired == 1
+        assert default.stats().acquired == 1
+        assert set(limiter.stats()) == {"orders", "default"}
+
+    def test_unknown_group_without_default_is_not_limited(self):
+        limiter = RateLimiter({"orders": TokenBucket(1)})
+
+        assert limiter.bucket_for("https://api.coingate.com/v2/rates") is None
+        assert limiter.acquire("https://api.coingate.com/v2/rates") == 0.0
+
+    def test_observe_pauses_bucket(self):
+        bucket = TokenBucket(100, 10)
+        limiter = RateLimiter({"rates": bucket})
+
+        limiter.observe("https://api.coingate.com/v2/rates", {"Retry-After": "0.05"})
+
+        assert limiter.acquire("https://api.coingate.com/v2/rates") > 0
+
+
+class TestRetryDelayFromHeaders:
+    @pytest.mark.parametrize(
+        "headers,expected",
+        [
+            ({}, None),
+            ({"Retry-After": "2"}, 2.0),
+            ({"X-RateLimit-Remaining": "3", "X-RateLimit-Reset": "10"}, None),
+            ({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "10"}, 10.0),
+        ],
+    )
+    def test_delay(self, headers, expected):
+        assert retry_delay_from_headers(headers) == expected
+
+    def test_reset_as_timestamp(self):
+        headers = {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(time.time() + 5),
+        }
+
+        assert retry_delay_from_headers(headers) == pytest.approx(5, abs=0.5)
@@ -0,0 +1,134 @@
+import threading
+from decimal import Decimal
+
+import pytest
+from coingate.rates import ExchangeRateCache, RateMatrix
+from coingate.resources.public import ExchangesRates
+
+RATES = {
+    "merchant": {"BTC": {"EUR": "7449.99"}, "EUR": {"BTC": "0.00013351"}},
+    "trader": {
+        "buy": {"BTC": {"EUR": "7500"}},
+        "sell": {"BTC": {"EUR": "7400"}},
+    },
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakePublicService:
+    def __init__(self):
+        self.calls = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def get_all_exchange_rates(self):
+        self.release.wait(timeout=1)
+        self.calls += 1
+        return ExchangesRates(**RATES)
+
+
+class FakeClient:
+    def __init__(self):
+        self.public = FakePublicService()
+
+
+class TestExchangeRateCache:
+    def setup_method(self):
+        self.client = FakeClient()
+        self.clock = FakeClock()
+        self.cache = ExchangeRateCache(
+            self.client, ttl=60, stale_ttl=120, clock=self.clock
+        )
+
+    def test_answers_lookups_from_one_snapshot(self):
+        assert self.cache.merchant_rate("btc", "EUR") == Decimal("7449.99")
+        assert self.cache.merchant_rate("EUR", "BTC") == Decimal("0.00013351")
+        assert self.cache.trader_rate("buy", "BTC", "EUR") == Decimal("7500")
+        assert self.cache.trader_rate("sell", "BTC", "EUR") == Decimal("7400")
+        assert self.cache.merchant_rate("EUR", "XYZ") is None
+
+        assert self.client.public.calls == 1
+
+    def test_serves_stale_snapshot_while_refreshing(self):
+        self.cache.rates()
+        self.clock.now += 90
+        self.client.public.release.clear()
+
+        # Refresh is blocked, but lookup still answers immediately
+        assert self.cache.merchant_rate("BTC", "EUR") == Decimal("7449.99")
+        assert self.client.public.calls == 1
+
+        self.client.public.release.set()
+        self.cache._background_lock.acquire(timeout=1)
+        assert self.client.public.calls == 2
+
+    def test_refreshes_synchronously_when_too_old(self):
+        self.cache.rates()
+        self.clock.now += 200
+
+        self.cache.rates()
+
+        assert self.client.public.calls == 2
+        assert self.cache.age == 0
+
+    def test_invalidate(self):
+        self.cache.rates()
+        self.cache.invalidate()
+
+        assert self.cache.age is None
+        self.cache.rates()
+        assert self.client.public.calls == 2
+
+
+class TestRateMatrix:
+    def setup_method(self):
+        np = pytest.importorskip("numpy")
+        self.np = np
+        self.matrix = RateMatrix(
+            {
+                "EUR": {"BTC": Decimal("0.00013351"), "USD": Decimal("1.2317")},
+                "BTC": {"EUR": Decimal("7449.99"), "USD": None},
+            }
+        )
+
+    def test_builds_index(self):
+        assert self.matrix.currencies == ("BTC", "EUR", "USD")
+        assert self.matrix.index_of("eur") == 1
+        assert self.matrix.matrix.shape == (3, 3)
+
+        with pytest.raises(KeyError):
+            self.matrix.index_of("XYZ")
+
+    def test_convert(self):
+        converted = self.matrix.convert([10, 100], "EUR", "USD")
+
+        assert converted.tolist() == pytest.approx([12.317, 123.17])
+
+    def test_missing_rate_is_nan(self):
+        converted = self.matrix.convert([1], "BTC", "USD")
+
+        assert self.np.isnan(converted).all()
+        assert self.matrix.rate("BTC", "USD") is None
+
+    def test_convert_to_all(self):
+        converted = self.matrix.convert_to_all([1, 2], "EUR")
+
+        assert converted.shape == (2, 3)
+        assert converted[1].tolist() == pytest.approx([0.00026702, 2, 2.4634])
+
+        subset = self.matrix.convert_to_all([1, 2], "EUR", ["USD"])
+        assert subset.ravel().tolist() == pytest.approx([1.2317, 2.4634])
+
+    def test_convert_exact(self):
+        assert self.matrix.convert_exact(
+            Decimal("99.99"), "EUR", "BTC", quantize=Decimal("1e-8")
+        ) == Decimal("0.01334966")
+        assert self.matrix.convert_exact(Decimal("5"), "EUR", "EUR") == Decimal(5)
+        assert self.matrix.convert_exact(Decimal("5"), "BTC", "USD") is None
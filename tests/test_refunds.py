@@ -0,0 +1,258 @@
+import json
+from decimal import Decimal
+from urllib.parse import parse_qs, urlsplit
+
+from coingate import CoinGate
+from coingate.exceptions import OrderNotFoundException
+from coingate.refunds import BulkRefunder, RefundRequest, RefundValidationError
+from coingate.resources.refund import Refund
+from coingate.transport import InMemoryResponse, InMemoryTransport
+
+CURRENCIES = [
+    {
+        "id": 5,
+        "title": "Tether",
+        "symbol": "USDT",
+        "kind": "crypto",
+        "native": False,
+        "disabled": False,
+        "disabled_message": None,
+        "merchant": {"price": True, "pay": True, "receive": True},
+        "platforms": [
+            {"id": 7, "id_name": "ethereum", "title": "Ethereum", "enabled": True},
+            {"id": 2, "id_name": "tron", "title": "Tron", "enabled": False},
+        ],
+    }
+]
+
+ACCOUNTS = [
+    {
+        "id": "usdt-1",
+        "balance": "100",
+        "status": "active",
+        "currency": {"id": 5, "title": "Tether", "symbol": "USDT"},
+    },
+    {
+        "id": "btc-1",
+        "balance": "1",
+        "status": "active",
+        "currency": {"id": 1, "title": "Bitcoin", "symbol": "BTC"},
+    },
+]
+
+
+def _order(id, price="50", currency="USDT", refundable=True):
+    return {
+        "id": id,
+        "status": "paid",
+        "do_not_convert": False,
+        "price_currency": currency,
+        "price_amount": price,
+        "lightning_network": False,
+        "receive_currency": currency,
+        "receive_amount": price,
+        "created_at": "2022-10-10T12:23:22+00:00",
+        "order_id": "",
+        "payment_url": f"https://pay.coingate.com/invoice/{id}",
+        "underpaid_amount": "0",
+        "overpaid_amount": "0",
+        "is_refundable": refundable,
+        "orderable_type": "ApiOrder",
+        "orderable_id": id,
+        "payment_address": None,
+    }
+
+
+ORDERS = {
+    1: _order(1),
+    2: _order(2, refundable=False),
+    3: _order(3, price="40"),
+    4: _order(4, price="80", currency="EUR"),
+}
+
+
+class FakeApi:
+    def __init__(self):
+        self.refunds = []
+        self.created = []
+
+    def __call__(self, request):
+        path = urlsplit(request.url).path
+        if path == "/v2/currencies":
+            return InMemoryResponse.json(CURRENCIES)
+        if path == "/v2/platforms":
+            return InMemoryResponse.json([])
+        if path == "/v2/ledger/accounts":
+            page = {
+                "current_page": 1,
+                "per_page": 100,
+                "total_accounts": len(ACCOUNTS),
+                "total_pages": 1,
+                "accounts": ACCOUNTS,
+            }
+            return InMemoryResponse.json(page)
+        if path.endswith("/refunds") and request.method == "GET":
+            return self._order_refunds(int(path.split("/")[3]))
+        if path.endswith("/refunds"):
+            return self._refund(path, parse_qs(request.body.decode()))
+
+        order = ORDERS.get(int(path.rsplit("/", 1)[1]))
+        if order is None:
+            error = {"reason": "OrderNotFound", "message": "Order not found"}
+            return InMemoryResponse.json(error, 404)
+        return InMemoryResponse.json(order)
+
+    def _refund(self, path, form):
+        self.refunds.append(form)
+        refund = {
+            "id": len(self.refunds),
+            "request_amount": form["amount"][0],
+            "refund_amount": form["amount"][0],
+            "address": form["address"][0],
+            "status": "pending",
+            "memo": None,
+            "created_at": "2022-10-10T12:23:22+00:00",
+            "order": {"id": int(path.split("/")[3])},
+            "refund_currency": {
+                "id": 5,
+                "title": "Tether",
+                "symbol": "USDT",
+                "platform": {"id": 7, "title": "Ethereum"},
+            },
+            "transactions": [],
+            "ledger_account": {
+                "id": form["ledger_account_id"][0],
+                "currency": {"id": 5, "title": "Tether", "symbol": "USDT"},
+            },
+        }
+        self.created.append(refund)
+        return InMemoryResponse.json(refund)
+
+    def _order_refunds(self, order_id):
+        refunds = [r for r in self.created if r["order"]["id"] == order_id]
+        page = {
+            "current_page": 1,
+            "per_page": 100,
+            "total_refunds": len(refunds),
+            "total_pages": 1,
+            "refunds": [
+                {
+                    **refund,
+                    "crypto_address": refund["address"],
+                    "crypto_address_memo": None,
+                }
+                for refund in refunds
+            ],
+        }
+        return InMemoryResponse.json(page)
+
+
+class FakeRates:
+    def merchant_rate(self, from_currency, to_currency):
+        return {("EUR", "USDT"): Decimal("1.1")}.get((from_currency, to_currency))
+
+
+def _refund(order_id, amount, **kwargs):
+    values = dict(
+        order_id=order_id,
+        amount=Decimal(amount),
+        address="0xabc",
+        currency="USDT",
+        platform="ethereum",
+        reason="Chargeback",
+        email="shopper@example.com",
+    )
+    values.update(kwargs)
+    return RefundRequest(**values)
+
+
+def _refunder(**kwargs):
+    api = FakeApi()
+    transport = InMemoryTransport(api, record=True)
+    refunder = BulkRefunder(CoinGate(transport=transport), **kwargs)
+    return refunder, api, transport
+
+
+def test_submits_valid_refunds_with_resolved_ids():
+    refunder, api, _ = _refunder()
+
+    results = refunder.submit([_refund(1, "20"), _refund(3, "15")])
+
+    assert results.is_complete
+    assert [refund.order.id for refund in results.succeeded] == [1, 3]
+    assert len(api.refunds) == 2
+    form = api.refunds[0]
+    assert form["currency_id"] == ["5"]
+    assert form["platform_id"] == ["7"]
+    assert form["ledger_account_id"] == ["usdt-1"]
+
+
+def test_predictable_rejections_are_not_sent():
+    refunder, api, _ = _refunder()
+
+    results = refunder.submit(
+        [
+            _refund(1, "30"),
+            _refund(1, "30"),  # refunds of order 1 exceed its price
+            _refund(2, "5"),  # not refundable
+            _refund(3, "0"),
+            _refund(3, "10", platform="tron"),  # platform disabled
+            _refund(3, "10", currency="DOGE"),
+            _refund(3, "10", ledger_account_id="btc-1"),
+            _refund(9, "10"),  # order does not exist
+        ]
+    )
+
+    assert isinstance(results[0], Refund)
+    for index in range(1, 7):
+        assert isinstance(results[index], RefundValidationError), index
+    assert isinstance(results[7], OrderNotFoundException)
+    assert len(api.refunds) == 1
+    assert refunder.rejected == 6
+
+
+def test_balance_is_reserved_across_the_batch():
+    refunder, api, _ = _refunder(rates=FakeRates())
+
+    errors = refunder.validate(
+        [
+            _refund(1, "50"),
+            _refund(3, "40"),
+            # 80 EUR is 88 USDT, only 10 USDT are left
+            _refund(4, "80"),
+        ]
+    )
+
+    assert errors[:2] == [None, None]
+    assert isinstance(errors[2], RefundValidationError)
+    assert "balance" in errors[2].message
+    assert api.refunds == []
+
+
+def test_ledger_balances_are_cached_and_reloaded_after_submit():
+    refunder, _, transport = _refunder()
+
+    def ledger_requests():
+        return sum(r.url.endswith("ledger/accounts") for r in transport.requests)
+
+    refunder.validate([_refund(1, "1")])
+    refunder.validate([_refund(1, "1")])
+    assert ledger_requests() == 1
+
+    refunder.submit([_refund(1, "1")])
+    refunder.validate([_refund(1, "1")])
+    assert ledger_requests() == 2
+
+
+def test_refunds_already_made_count_against_order_price():
+    refunder, api, _ = _refunder()
+    refunder.submit([_refund(1, "30"), _refund(3, "40")])
+    api.created[1]["status"] = "rejected"
+
+    results = refunder.submit([_refund(1, "30"), _refund(1, "20"), _refund(3, "40")])
+
+    assert isinstance(results[0], RefundValidationError)
+    assert "30 of it is already refunded" in results[0].message
+    assert isinstance(results[1], Refund)
+    # Rejected refund does not count
+    assert isinstance(results[2], Refund)
@@ -0,0 +1,118 @@
+import asyncio
+
+import pytest
+import requests
+from coingate.exceptions import (
+    InternalServerErrorException,
+    OrderNotFoundException,
+    RateLimitException,
+)
+from coingate.retry import RetryPolicy
+
+try:
+    import httpx
+    from coingate.aio import AsyncCoinGate
+except ImportError:  # `async` extra is not installed
+    httpx = None  # type: ignore
+
+requires_httpx = pytest.mark.skipif(httpx is None, reason="httpx is not installed")
+
+
+def _server_error():
+    return InternalServerErrorException("InternalServerError", 500, None, None)
+
+
+class FlakySend:
+    def __init__(self, *errors: Exception):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+class TestRetryPolicy:
+    def _policy(self, **kwargs) -> RetryPolicy:
+        return RetryPolicy(base_delay=0.001, max_delay=0.002, **kwargs)
+
+    def test_retries_transient_errors(self):
+        policy = self._policy()
+        send = FlakySend(_server_error(), requests.ConnectionError())
+
+        assert policy.call("get", send) == "ok"
+        assert send.calls == 3
+        assert policy.stats.calls == 1
+        assert policy.stats.retries == 2
+        assert len(policy.stats.attempt_durations(3)) == 1
+
+    def test_gives_up_after_max_attempts(self):
+        policy = self._policy(max_attempts=2)
+        send = FlakySend(_server_error(), _server_error(), _server_error())
+
+        with pytest.raises(InternalServerErrorException):
+            policy.call("get", send)
+
+        assert send.calls == 2
+        assert policy.stats.exhausted == 1
+
+    @pytest.mark.parametrize("method", ["post", b"PATCH"])
+    def test_does_not_retry_unsafe_methods(self, method):
+        policy = self._policy()
+        send = FlakySend(_server_error())
+
+        with pytest.raises(InternalServerErrorException):
+            policy.call(method, send)
+
+        assert send.calls == 1
+
+    def test_does_not_retry_client_errors(self):
+        policy = self._policy()
+        send = FlakySend(OrderNotFoundException("OrderNotFound", 404, None, None))
+
+        with pytest.raises(OrderNotFoundException):
+            policy.call("get", send)
+
+        assert send.calls == 1
+
+    def test_allowlist(self):
+        policy = self._policy(retry_on=[RateLimitException])
+        send = FlakySend(RateLimitException("RateLimit", 429, None, None))
+
+        assert policy.call("get", send) == "ok"
+
+    def test_full_jitter_backoff(self):
+        policy = RetryPolicy(base_delay=1, max_delay=5)
+
+        delays = [policy.backoff(attempt) for attempt in (1, 2, 3, 4) * 50]
+
+        assert all(0 <= delay <= 5 for delay in delays)
+        assert max(policy.backoff(1) for _ in range(100)) <= 1
+
+    def test_percentile(self):
+        policy = self._policy()
+        for duration in range(1, 101):
+            policy.stats.record_call(duration / 1000)
+
+        assert policy.stats.percentile(50) == pytest.approx(0.05)
+        assert policy.stats.percentile(99) == pytest.approx(0.099)
+
+
+@requires_httpx
+class TestAsyncClientRetries:
+    def test_retries_server_errors(self):
+        responses = [
+            httpx.Response(500, json={"reason": "InternalServerError"}),
+            httpx.Response(200, json={"ping": "pong", "time": "2022-10-10T00:00:00"}),
+        ]
+        client = AsyncCoinGate(
+            transport=httpx.MockTransport(lambda request: responses.pop(0))
+        )
+        client.set_retry_policy(RetryPolicy(base_delay=0.001))
+
+        ping = asyncio.run(client.public.ping())
+
+        assert ping.ping == "pong"
+        assert not responses
@@ -0,0 +1,192 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+import requests
+from coingate import CoinGate
+from coingate.exceptions import OrderNotFoundException
+from coingate.single_flight import SingleFlight
+from requests.adapters import BaseAdapter
+
+try:
+    import httpx
+    from coingate.aio import AsyncCoinGate
+except ImportError:  # `async` extra is not installed
+    httpx = None  # type: ignore
+
+requires_httpx = pytest.mark.skipif(httpx is None, reason="httpx is not installed")
+
+ORDER = {
+    "id": 123,
+    "status": "new",
+    "do_not_convert": False,
+    "price_currency": "EUR",
+    "price_amount": "10.0",
+    "lightning_network": False,
+    "receive_currency": "EUR",
+    "receive_amount": "10.0",
+    "created_at": "2022-10-10T12:23:22+00:00",
+    "order_id": "",
+    "payment_url": "https://pay-sandbox.coingate.com/invoice/1",
+    "underpaid_amount": "0",
+    "overpaid_amount": "0",
+    "is_refundable": False,
+    "orderable_type": "ApiOrder",
+    "orderable_id": 1,
+    "payment_address": None,
+}
+
+
+class BlockingAdapter(BaseAdapter):
+    """Holds every request until `release` is set."""
+
+    def __init__(self, status_code=200, body=ORDER):
+        super().__init__()
+        self.status_code = status_code
+        self.body = json.dumps(body).encode()
+        self.release = threading.Event()
+        self.requests = []
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        self.release.wait(5)
+
+        response = requests.Response()
+        response.request = request
+        response.url = request.url
+        response.status_code = self.status_code
+        response._content = self.body
+        return response
+
+    def close(self):
+        pass
+
+
+class TestSingleFlight:
+    def setup_method(self):
+        self.client = CoinGate("api_key", True)
+        self.adapter = BlockingAdapter()
+        self.client._http_client.transport.session.mount("https://", self.adapter)
+        self.single_flight = SingleFlight()
+        self.client.set_single_flight(self.single_flight)
+
+    def _run_concurrently(self, calls):
+        with ThreadPoolExecutor(len(calls)) as executor:
+            futures = [executor.submit(call) for call in calls]
+            # Let every caller join the request of the first one
+            while self.single_flight.saved < len(calls) - 1:
+                threading.Event().wait(0.001)
+            self.adapter.release.set()
+            return [f.exception() or f.result() for f in futures]
+
+    def test_identical_requests_share_one_call(self):
+        orders = self._run_concurrently([lambda: self.client.order.get(123)] * 8)
+
+        assert len(self.adapter.requests) == 1
+        assert all(order.id == 123 for order in orders)
+        assert (self.single_flight.calls, self.single_flight.saved) == (1, 7)
+        assert self.single_flight.saved_ratio == 7 / 8
+        assert len(self.single_flight) == 0
+
+    def test_completed_requests_are_sent_again(self):
+        self.adapter.release.set()
+
+        self.client.order.get(123)
+        self.client.order.get(123)
+
+        assert len(self.adapter.requests) == 2
+        assert self.single_flight.saved == 0
+
+    def test_different_requests_are_not_coalesced(self):
+        assert self.single_flight.key(
+            "get", "https://x/v2/orders", {"page": 1}
+        ) != self.single_flight.key("get", "https://x/v2/orders", {"page": 2})
+        assert self.single_flight.key(
+            "get", "https://x/v2/orders", {"page": 1, "sort": None}
+        ) == self.single_flight.key("get", "https://x/v2/orders", {"page": 1})
+        assert not self.single_flight.is_coalescable("post")
+
+    def test_identical_exchange_rate_lookups_share_one_call(self):
+        self.adapter.body = b"0.0000472"
+
+        rates = self._run_concurrently(
+            [lambda: self.client.public.get_exchange_rate_for_merchant("EUR", "BTC")]
+            * 4
+        )
+
+        assert len(self.adapter.requests) == 1
+        assert rates == [Decimal("0.0000472")] * 4
+
+    def test_waiting_callers_receive_the_same_exception(self):
+        self.adapter.status_code = 404
+        self.adapter.body = json.dumps(
+            {"message": "Order not found", "reason": "OrderNotFound"}
+        ).encode()
+
+        errors = self._run_concurrently([lambda: self.client.order.get(1)] * 3)
+
+        assert len(self.adapter.requests) == 1
+        assert all(isinstance(e, OrderNotFoundException) for e in errors)
+
+
+@requires_httpx
+def test_async_identical_requests_share_one_call():
+    requests_sent = []
+
+    async def handler(request):
+        requests_sent.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json=ORDER)
+
+    client = AsyncCoinGate("api_key", True, transport=httpx.MockTransport(handler))
+    single_flight = SingleFlight()
+    client.set_single_flight(single_flight)
+
+    async def main():
+        return await asyncio.gather(*(client.order.get(123) for _ in range(5)))
+
+    orders = asyncio.run(main())
+
+    assert len(requests_sent) == 1
+    assert [order.id for order in orders] == [123] * 5
+    assert single_flight.saved == 4
+
+
+def test_async_exception_without_waiters():
+    single_flight = SingleFlight()
+
+    async def fail():
+        raise ValueError("failed")
+
+    with pytest.raises(ValueError):
+        asyncio.run(single_flight.acall("key", fail))
+    assert len(single_flight) == 0
+
+
+def test_async_cancelled_caller_does_not_cancel_shared_call():
+    single_flight = SingleFlight()
+
+    async def main():
+        release = asyncio.Event()
+
+        async def fetch():
+            await release.wait()
+            return "result"
+
+        first = asyncio.ensure_future(single_flight.acall("key", fetch))
+        second = asyncio.ensure_future(single_flight.acall("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+        await asyncio.sleep(0)
+        release.set()
+        return first, await second
+
+    first, result = asyncio.run(main())
+
+    assert first.cancelled()
+    assert result == "result"
+    assert (single_flight.calls, single_flight.saved) == (1, 1)
+    assert len(single_flight) == 0
@@ -0,0 +1,156 @@
+import io
+import json
+from decimal import Decimal
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+import requests
+from coingate import CoinGate
+from coingate.streaming import JSONItemStream
+from requests.adapters import BaseAdapter
+
+DOCUMENT = {
+    "current_page": 1,
+    "total_pages": 1,
+    "items": [
+        {"id": 1, "note": 'quote " and \\ backslash', "tags": ["a", {"b": [1, 2]}]},
+        {"id": 2, "note": "ünïcödé ✓", "nested": {"x": None}},
+        3.5,
+        None,
+        "text ]}",
+    ],
+    "trailer": {"ok": True},
+}
+
+
+def _response(body: bytes) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+    return response
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 1 << 16])
+def test_decodes_items_across_chunk_boundaries(chunk_size):
+    body = json.dumps(DOCUMENT, ensure_ascii=False, indent=2).encode()
+    stream = JSONItemStream(
+        _response(body), "items", lambda item: item, chunk_size=chunk_size
+    )
+
+    assert list(stream) == DOCUMENT["items"]
+    assert stream.fields == {
+        "current_page": 1,
+        "total_pages": 1,
+        "trailer": {"ok": True},
+    }
+
+
+def test_builds_items_before_body_is_complete():
+    body = json.dumps({"items": [{"id": 1}, {"id": 2}]}).encode()
+    chunks = []
+
+    class Response(requests.Response):
+        def iter_content(self, chunk_size=1, decode_unicode=False):
+            for i in range(0, len(body), 4):
+                chunks.append(i)
+                yield body[i : i + 4]
+
+    response = Response()
+    response.raw = io.BytesIO()
+    stream = JSONItemStream(response, "items", lambda item: item["id"])
+    iterator = iter(stream)
+
+    assert next(iterator) == 1
+    assert len(chunks) < len(body) / 4
+
+
+def test_truncated_document_raises():
+    stream = JSONItemStream(_response(b'{"items": [{"id": 1}, {"id"'), "items", dict)
+
+    with pytest.raises(ValueError):
+        list(stream)
+
+
+class PagesAdapter(BaseAdapter):
+    def __init__(self, pages):
+        super().__init__()
+        self.pages = pages
+        self.requests = []
+
+    def send(self, request, stream=False, **kwargs):
+        self.requests.append((request, stream))
+        page = int(parse_qs(urlparse(request.url).query)["page"][0])
+
+        body = self.pages[page - 1]
+        if not isinstance(body, bytes):
+            body = json.dumps(body).encode()
+
+        response = _response(body)
+        response.request = request
+        response.url = request.url
+        return response
+
+    def close(self):
+        pass
+
+
+def _order(id):
+    return {
+        "id": id,
+        "status": "paid",
+        "do_not_convert": False,
+        "price_currency": "EUR",
+        "price_amount": "129.99",
+        "lightning_network": False,
+        "receive_currency": "EUR",
+        "receive_amount": "129.99",
+        "created_at": "2022-10-10T12:23:22+00:00",
+        "order_id": f"shop-{id}",
+        "payment_url": f"https://pay.coingate.com/invoice/{id}",
+        "underpaid_amount": "0",
+        "overpaid_amount": "0",
+        "is_refundable": True,
+        "orderable_type": "ApiOrder",
+        "orderable_id": id,
+        "payment_address": None,
+    }
+
+
+def test_order_iter_all_streams_every_page():
+    pages = [
+        {
+            "current_page": number,
+            "per_page": 3,
+            "total_orders": 6,
+            "total_pages": 2,
+            "orders": [_order(10 * number + i) for i in range(3)],
+        }
+        for number in (1, 2)
+    ]
+
+    client = CoinGate()
+    adapter = PagesAdapter(pages)
+    client._http_client.transport.session.mount("https://", adapter)
+
+    orders = list(client.order.iter_all(stream=True))
+
+    assert [order.id for order in orders] == [10, 11, 12, 20, 21, 22]
+    assert orders[0] == client.order.get_all(page=1).orders[0]
+    assert all(stream for _, stream in adapter.requests[:2])
+
+
+def test_streamed_numbers_are_decoded_with_client_codec():
+    page = {
+        "current_page": 1,
+        "per_page": 1,
+        "total_orders": 1,
+        "total_pages": 1,
+        "orders": [{**_order(1), "price_amount": 0.5}],
+    }
+    body = json.dumps(page).replace("0.5", "0.10000000000000000555").encode()
+    client = CoinGate()
+    client._http_client.transport.session.mount("https://", PagesAdapter([body]))
+
+    orders = list(client.order.iter_all(stream=True))
+
+    assert orders[0].price_amount == Decimal("0.10000000000000000555")
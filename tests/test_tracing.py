@@ -0,0 +1,157 @@
+import asyncio
+from urllib.parse import parse_qs
+
+import pytest
+from coingate import CoinGate
+from coingate.http_cache import ResponseCache
+from coingate.retry import RetryPolicy
+from coingate.services import OrderService
+from coingate.transport import InMemoryResponse, InMemoryTransport
+
+from .test_transport import _order, api
+
+pytest.importorskip("opentelemetry.sdk")
+
+from coingate.tracing import Tracing  # noqa: E402
+from opentelemetry.sdk.trace import TracerProvider  # noqa: E402
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+
+
+@pytest.fixture
+def exporter():
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    exporter.tracer = provider.get_tracer("test")
+    return exporter
+
+
+def _spans(exporter):
+    return {span.name: span for span in exporter.get_finished_spans()}
+
+
+def test_spans_of_service_call_request_and_attempts(exporter):
+    answers = [
+        InMemoryResponse.json({"reason": "InternalServerError"}, 500),
+        InMemoryResponse.json(_order(7)),
+    ]
+    transport = InMemoryTransport(lambda request: answers.pop(0), record=True)
+    client = CoinGate("api_key", transport=transport)
+    client.set_retry_policy(RetryPolicy(base_delay=0))
+    client.set_tracing(Tracing(exporter.tracer))
+
+    client.order.get(7)
+
+    finished = exporter.get_finished_spans()
+    assert [span.name for span in finished] == [
+        "HTTP GET",
+        "HTTP GET",
+        "GET v2/orders/{id}",
+        "OrderService.get",
+    ]
+    first, second, request, service = finished
+    assert request.parent.span_id == service.context.span_id
+    assert first.parent.span_id == second.parent.span_id == request.context.span_id
+    assert first.attributes["http.response.status_code"] == 500
+    assert second.attributes["http.request.resend_count"] == 1
+    assert request.attributes["coingate.endpoint"] == "v2/orders/{id}"
+    assert request.attributes["coingate.retry_count"] == 1
+    assert request.attributes["http.response.status_code"] == 200
+
+    trace_id = format(service.context.trace_id, "032x")
+    span_id = format(second.context.span_id, "016x")
+    traceparent = transport.requests[1].headers["traceparent"]
+    assert traceparent.startswith(f"00-{trace_id}-{span_id}-")
+
+
+def test_paging_steps_are_children_of_service_span(exporter):
+    client = CoinGate("api_key", transport=InMemoryTransport(api))
+    client.set_tracing(Tracing(exporter.tracer))
+
+    ids = [order.id for order in client.order.iter_all(per_page=2)]
+
+    assert ids == [10, 11, 20, 21]
+    finished = exporter.get_finished_spans()
+    service = _spans(exporter)["OrderService.iter_all"]
+    pages = [span for span in finished if span.name == "GET v2/orders"]
+    assert sorted(span.attributes["coingate.page"] for span in pages) == [1, 2]
+    # Second page is prefetched in a background thread
+    assert all(span.parent.span_id == service.context.span_id for span in pages)
+
+
+def test_page_of_paging_step_sent_in_form_body(exporter):
+    def refunds(request):
+        page = int(parse_qs(request.body.decode())["page"][0])
+        return InMemoryResponse.json(
+            {
+                "current_page": page,
+                "per_page": 100,
+                "total_refunds": 0,
+                "total_pages": 1,
+                "refunds": [],
+            }
+        )
+
+    client = CoinGate("api_key", transport=InMemoryTransport(refunds))
+    client.set_tracing(Tracing(exporter.tracer))
+
+    client.refund.get_refunds(page=3)
+
+    assert _spans(exporter)["GET v2/refunds"].attributes["coingate.page"] == 3
+
+
+def test_cache_lookup_span(exporter):
+    answers = [
+        InMemoryResponse.json(_order(1), headers={"ETag": '"v1"'}),
+        InMemoryResponse(304),
+    ]
+    client = CoinGate(transport=InMemoryTransport(lambda request: answers.pop(0)))
+    client.set_response_cache(ResponseCache())
+    client.set_tracing(Tracing(exporter.tracer))
+
+    client.order.get(1)
+    client.order.get(1)
+
+    lookups = [
+        span.attributes["coingate.cache.hit"]
+        for span in exporter.get_finished_spans()
+        if span.name == "coingate.cache_lookup"
+    ]
+    assert lookups == [False, True]
+
+
+def test_async_client_spans(exporter):
+    httpx = pytest.importorskip("httpx")
+    from coingate.aio import AsyncCoinGate
+
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=_order(3))
+
+    client = AsyncCoinGate("api_key", transport=httpx.MockTransport(handler))
+    client.set_tracing(Tracing(exporter.tracer))
+
+    asyncio.run(client.order.get(3))
+
+    spans = _spans(exporter)
+    assert spans["GET v2/orders/{id}"].parent.span_id == (
+        spans["AsyncOrderService.get"].context.span_id
+    )
+    assert spans["HTTP GET"].attributes["http.response.status_code"] == 200
+    assert "traceparent" in requests[0].headers
+
+
+def test_disabling_tracing_restores_plain_services(exporter):
+    client = CoinGate(transport=InMemoryTransport(api))
+    client.set_tracing(Tracing(exporter.tracer))
+    client.set_tracing(None)
+
+    client.order.get(1)
+
+    assert exporter.get_finished_spans() == ()
+    assert isinstance(client.order, OrderService)
@@ -0,0 +1,224 @@
+import json
+import threading
+from decimal import Decimal
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+import requests
+from coingate import CoinGate
+from coingate.exceptions import InternalServerErrorException
+from coingate.http_cache import ResponseCache
+from coingate.retry import RetryPolicy
+from coingate.transport import (
+    InMemoryResponse,
+    InMemoryTransport,
+    RequestsTransport,
+    Transport,
+    TransportRequest,
+    Urllib3Transport,
+    encode_form,
+)
+
+
+def _order(id):
+    return {
+        "id": id,
+        "status": "paid",
+        "do_not_convert": False,
+        "price_currency": "EUR",
+        "price_amount": "10.5",
+        "lightning_network": False,
+        "receive_currency": "EUR",
+        "receive_amount": "10.5",
+        "created_at": "2022-10-10T12:23:22+00:00",
+        "order_id": f"shop-{id}",
+        "payment_url": f"https://pay.coingate.com/invoice/{id}",
+        "underpaid_amount": "0",
+        "overpaid_amount": "0",
+        "is_refundable": True,
+        "orderable_type": "ApiOrder",
+        "orderable_id": id,
+        "payment_address": None,
+    }
+
+
+def _page(number, total_pages=2):
+    return {
+        "current_page": number,
+        "per_page": 2,
+        "total_orders": 2 * total_pages,
+        "total_pages": total_pages,
+        "orders": [_order(10 * number + i) for i in range(2)],
+    }
+
+
+def api(request: TransportRequest) -> InMemoryResponse:
+    url = urlsplit(request.url)
+    if url.path == "/v2/orders":
+        page = int(parse_qs(url.query).get("page", ["1"])[0])
+        return InMemoryResponse.json(_page(page))
+    if url.path.startswith("/v2/orders/"):
+        return InMemoryResponse.json(_order(int(url.path.rsplit("/", 1)[1])))
+    return InMemoryResponse.json({"reason": "PageNotFound"}, 404)
+
+
+def test_encode_form_matches_requests():
+    values = {"price_amount": Decimal("10.50"), "title": "A & B", "x": None, "n": 1}
+    prepared = requests.Request(
+        "POST", "https://example.com", data=values, params=values
+    ).prepare()
+
+    assert encode_form(values) == prepared.body
+    assert prepared.url == f"https://example.com/?{encode_form(values)}"
+
+
+class TestInMemoryTransport:
+    def test_services_run_unchanged(self):
+        transport = InMemoryTransport(api, record=True)
+        client = CoinGate("api_key", transport=transport)
+
+        order = client.order.get(7)
+        created = [o.id for o in client.order.iter_all(per_page=2)]
+        streamed = [o.id for o in client.order.iter_all(per_page=2, stream=True)]
+
+        assert order.price_amount == Decimal("10.5")
+        assert created == streamed == [10, 11, 20, 21]
+        request = transport.requests[0]
+        assert request.method == "GET"
+        assert request.url == "https://api.coingate.com/v2/orders/7"
+        assert request.headers["Authorization"] == "Token api_key"
+
+    def test_requests_are_not_recorded_by_default(self):
+        transport = InMemoryTransport(api)
+
+        CoinGate(transport=transport).order.get(7)
+
+        assert transport.requests == []
+
+    def test_form_body_is_encoded(self):
+        transport = InMemoryTransport(
+            lambda request: InMemoryResponse.json({**_order(1), "token": "token"}),
+            record=True,
+        )
+        client = CoinGate(transport=transport)
+
+        client.order.create(Decimal("10.50"), "EUR", "EUR", title="A & B")
+
+        request = transport.requests[0]
+        assert request.method == "POST"
+        assert parse_qs(request.body.decode()) == {
+            "price_amount": ["10.50"],
+            "price_currency": ["EUR"],
+            "receive_currency": ["EUR"],
+            "title": ["A & B"],
+        }
+
+    def test_retries_and_cache_run_unchanged(self):
+        answers = [
+            InMemoryResponse.json({"reason": "InternalServerError"}, 500),
+            InMemoryResponse.json(_order(1), headers={"ETag": '"v1"'}),
+            InMemoryResponse(304),
+        ]
+        transport = InMemoryTransport(lambda request: answers.pop(0), record=True)
+        client = CoinGate(transport=transport)
+        client.set_retry_policy(RetryPolicy(base_delay=0))
+        cache = ResponseCache()
+        client.set_response_cache(cache)
+
+        assert client.order.get(1).id == 1
+        assert client.order.get(1).id == 1
+
+        assert transport.requests[2].headers["If-None-Match"] == '"v1"'
+        assert (cache.hits, cache.misses) == (1, 1)
+
+    def test_raises_client_exceptions(self):
+        transport = InMemoryTransport(
+            lambda request: InMemoryResponse.json(
+                {"reason": "InternalServerError"}, 500
+            )
+        )
+        client = CoinGate(transport=transport)
+
+        with pytest.raises(InternalServerErrorException):
+            client.order.get(1)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self._answer()
+
+    def do_POST(self):
+        self._answer()
+
+    def _answer(self):
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        self.server.seen.append((self.command, self.path, body, dict(self.headers)))
+        path = urlsplit(self.path).path
+        if self.command == "POST":
+            content = json.dumps({**_order(1), "token": "token"}).encode()
+        elif path == "/v2/orders":
+            number = int(parse_qs(urlsplit(self.path).query)["page"][0])
+            content = json.dumps(_page(number)).encode()
+        else:
+            content = json.dumps(_order(int(path.rsplit("/", 1)[1]))).encode()
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.seen = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_transport_without_send_cannot_be_created():
+    class Incomplete(Transport):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+@pytest.mark.parametrize("transport_class", [RequestsTransport, Urllib3Transport])
+def test_network_transports(server, transport_class):
+    client = CoinGate("api_key", transport=transport_class())
+    client.BASE_API_URL = f"http://127.0.0.1:{server.server_port}"
+
+    order = client.order.get(5)
+    streamed = [o.id for o in client.order.iter_all(per_page=2, stream=True)]
+    client.order.create(Decimal("1"), "EUR", "EUR")
+
+    assert order.id == 5
+    assert streamed == [10, 11, 20, 21]
+    method, path, body, headers = server.seen[-1]
+    assert (method, path) == ("POST", "/v2/orders")
+    assert body == b"price_amount=1&price_currency=EUR&receive_currency=EUR"
+    assert headers["Authorization"] == "Token api_key"
+    assert headers["Content-Type"] == "application/x-www-form-urlencoded"
+    client._http_client.transport.close()
+
+
+def test_urllib3_transport_raises_requests_connection_errors():
+    client = CoinGate(transport=Urllib3Transport())
+    # Nothing listens on the discard port
+    client.BASE_API_URL = "http://127.0.0.1:9"
+
+    with pytest.raises(requests.ConnectionError):
+        client.order.get(1)
@@ -0,0 +1,209 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from coingate.resources.order import Order, PaginatedOrders
+from coingate.watcher import OrderWatcher
+
+START = datetime(2022, 10, 10, 12, tzinfo=timezone.utc)
+
+
+def make_order(id, status="pending", created_at=START):
+    return Order(
+        id=id,
+        status=status,
+        do_not_convert=False,
+        price_currency="EUR",
+        price_amount="10",
+        lightning_network=False,
+        receive_currency="BTC",
+        receive_amount="",
+        created_at=created_at,
+        order_id=f"shop-{id}",
+        payment_url=f"https://pay.coingate.com/invoice/{id}",
+        underpaid_amount="0",
+        overpaid_amount="0",
+        is_refundable=False,
+        orderable_type="ApiOrder",
+        orderable_id=id,
+        payment_address=None,
+    )
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = START
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += timedelta(seconds=seconds)
+
+
+class FakeOrderService:
+    def __init__(self, orders):
+        self.orders = {order.id: order for order in orders}
+        self.gets = 0
+        self.pages = 0
+
+    def set_status(self, id, status):
+        self.orders[id] = self.orders[id].copy(update={"status": status})
+
+    def get(self, id):
+        self.gets += 1
+        return self.orders[id]
+
+    def get_all(self, *, per_page, page, sort, created_from):
+        self.pages += 1
+        orders = sorted(self.orders.values(), key=lambda order: order.created_at)
+        orders = [o for o in orders if o.created_at.date() >= created_from.date()]
+        total_pages = max(1, -(-len(orders) // per_page))
+        return PaginatedOrders(
+            current_page=page,
+            per_page=per_page,
+            total_orders=len(orders),
+            total_pages=total_pages,
+            orders=orders[(page - 1) * per_page : page * per_page],
+        )
+
+
+class FakeClient:
+    def __init__(self, orders):
+        self.order = FakeOrderService(orders)
+
+
+def test_reports_transitions_and_stops_watching_final_orders():
+    client = FakeClient([make_order(1), make_order(2)])
+    clock = FakeClock()
+    watcher = OrderWatcher(client, min_interval=5, scan_threshold=100, now=clock)
+    received = []
+    watcher.on_transition(received.append)
+    for order in client.order.orders.values():
+        watcher.watch_order(order)
+
+    assert watcher.poll() == []
+
+    client.order.set_status(1, "paid")
+    clock.advance(5)
+    transitions = watcher.poll()
+
+    assert [(t.order.id, t.previous_status, t.status) for t in transitions] == [
+        (1, "pending", "paid")
+    ]
+    assert received == transitions
+    assert 1 not in watcher and 2 in watcher
+
+
+def test_interval_grows_with_age_and_is_capped_by_expiry():
+    clock = FakeClock()
+    clock.advance(3600)
+    client = FakeClient([make_order(1), make_order(2)])
+    watcher = OrderWatcher(
+        client, min_interval=5, max_interval=300, age_factor=0.1, now=clock
+    )
+
+    watcher.watch_order(client.order.orders[1])
+    assert watcher.next_poll_in() == 300
+
+    watcher.watch(
+        2,
+        status="pending",
+        created_at=START,
+        expire_at=clock.now + timedelta(seconds=60),
+    )
+    assert watcher.next_poll_in() == 65
+
+
+def test_coalesces_many_due_orders_into_page_scans():
+    orders = [make_order(i) for i in range(1, 251)]
+    client = FakeClient(orders)
+    clock = FakeClock()
+    watcher = OrderWatcher(client, scan_threshold=20, per_page=100, now=clock)
+    for order in orders:
+        watcher.watch_order(order)
+
+    client.order.set_status(7, "expired")
+    clock.advance(5)
+    transitions = watcher.poll()
+
+    assert [t.order.id for t in transitions] == [7]
+    assert client.order.pages == 3
+    assert client.order.gets == 0
+    assert watcher.requests == 3
+
+
+def test_scan_stops_when_polling_the_rest_takes_fewer_requests():
+    # Busy account: 30 pages of orders since the oldest watched one
+    orders = [
+        make_order(i, created_at=START - timedelta(days=30) + timedelta(minutes=i))
+        for i in range(1, 3001)
+    ]
+    client = FakeClient(orders)
+    clock = FakeClock()
+    watcher = OrderWatcher(client, scan_threshold=20, per_page=100, now=clock)
+    watched = [orders[0]] + orders[-19:]
+    for order in watched:
+        watcher.watch_order(order)
+
+    clock.advance(300)
+    watcher.poll()
+
+    assert client.order.pages == 1
+    assert client.order.gets == 19
+    assert watcher.requests <= len(watched)
+
+
+def test_naive_times_are_taken_as_utc():
+    clock = FakeClock()
+    clock.advance(3600)
+    client = FakeClient([make_order(1), make_order(2)])
+    watcher = OrderWatcher(client, scan_threshold=2, now=clock)
+
+    watcher.watch(1, status="pending", created_at=START.replace(tzinfo=None))
+    watcher.watch_order(client.order.orders[2])
+    clock.advance(300)
+
+    assert watcher.poll() == []
+    assert client.order.pages == 1
+
+
+def test_orders_without_created_at_are_polled_individually():
+    client = FakeClient([make_order(1, "paid")])
+    watcher = OrderWatcher(client, now=FakeClock())
+    watcher.watch(1)
+
+    transitions = watcher.poll()
+
+    assert [(t.previous_status, t.status) for t in transitions] == [(None, "paid")]
+    assert client.order.gets == 1
+
+
+def test_background_thread_is_woken_by_newly_watched_order():
+    client = FakeClient([make_order(1, "paid")])
+    watcher = OrderWatcher(client, max_interval=300)
+    reported = threading.Event()
+    watcher.on_transition(lambda transition: reported.set())
+
+    watcher.start()
+    try:
+        # Nothing is watched, so the thread waits for `max_interval`
+        time.sleep(0.1)
+        watcher.watch(1)
+        assert reported.wait(5)
+    finally:
+        watcher.stop()
+
+
+def test_async_iterator_ends_when_every_order_is_final():
+    client = FakeClient([make_order(1, "paid"), make_order(2, "expired")])
+    watcher = OrderWatcher(client)
+    watcher.watch(1)
+    watcher.watch(2)
+
+    async def collect():
+        return [t.order.id async for t in watcher.transitions()]
+
+    assert sorted(asyncio.run(collect())) == [1, 2]
+    assert len(watcher) == 0